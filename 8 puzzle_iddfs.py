@@ -1,43 +1,62 @@
-def find_zero(state):
-    for i in range(3):
-        for j in range(3):
-            if state[i][j] == 0:
-                return i, j
+from collections import OrderedDict
 
-def swap(state, x1, y1, x2, y2):
-    new_state = [row[:] for row in state]
-    new_state[x1][y1], new_state[x2][y2] = new_state[x2][y2], new_state[x1][y1]
-    return new_state
+from A_star import BLANK_SHIFT, move_table, pack_state, unpack_state
 
-def dfs(state, goal, path, visited, depth_limit):
-    if state == goal:
-        return path + [state]
+class TranspositionTable:
+    """Shallowest depth at which each packed state was reached.
 
-    if len(path) >= depth_limit:
-        return None
+    Entries are tagged with the iteration (generation) that stored them and
+    survive across depth limits. A state is pruned when it was already reached
+    at a shallower depth, or at the same depth earlier in this iteration.
+    Once `capacity` entries are stored, the least recently stored ones are
+    evicted; losing an entry only costs pruning, never a solution.
+    """
 
-    visited.add(str(state))
-    x, y = find_zero(state)
+    def __init__(self, capacity=1_000_000):
+        self.capacity = capacity
+        self.entries = OrderedDict()
 
-    moves = [(-1,0), (1,0), (0,-1), (0,1)]  # Up, Down, Left, Right
+    def visit(self, code, depth, generation):
+        """Record a visit; returns False if the state should be pruned."""
+        entry = self.entries.get(code)
+        if entry is not None:
+            seen_depth, seen_generation = entry
+            if seen_depth < depth or (seen_depth == depth and seen_generation == generation):
+                return False
+            self.entries.move_to_end(code)
+        elif len(self.entries) >= self.capacity:
+            self.entries.popitem(last=False)
+        self.entries[code] = (depth, generation)
+        return True
 
-    for dx, dy in moves:
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < 3 and 0 <= ny < 3:
-            new_state = swap(state, x, y, nx, ny)
-            if str(new_state) not in visited:
-                result = dfs(new_state, goal, path + [state], visited, depth_limit)
-                if result is not None:
-                    return result
-    return None
+def dfs(code, goal, path, table, depth, depth_limit, generation, stats=None):
+    if stats is not None:
+        stats["expanded"] = stats.get("expanded", 0) + 1
+    path.append(code)
+    if code == goal:
+        return True
+
+    if depth < depth_limit:
+        for cell, cell_shift, blank_shift, blank_delta in move_table[code >> BLANK_SHIFT]:  # Up, Down, Left, Right
+            tile = (code >> cell_shift) & 0xF
+            child = code + (tile << blank_shift) - (tile << cell_shift) + blank_delta
+            if table.visit(child, depth + 1, generation):
+                if dfs(child, goal, path, table, depth + 1, depth_limit, generation, stats):
+                    return True
+    path.pop()
+    return False
 
-def iddfs(start, goal, max_depth):
+def iddfs(start, goal, max_depth, trace=False, stats=None, table_size=1_000_000):
+    """Iterative deepening DFS sharing one bounded transposition table across depth limits."""
+    start_code, goal_code = pack_state(start), pack_state(goal)
+    table = TranspositionTable(table_size)
     for depth in range(max_depth + 1):
-        visited = set()
-        print(f"Searching with depth limit = {depth}")
-        result = dfs(start, goal, [], visited, depth)
-        if result is not None:
-            return result
+        if trace:
+            print(f"Searching with depth limit = {depth}")
+        table.visit(start_code, 0, depth)
+        path = []
+        if dfs(start_code, goal_code, path, table, 0, depth, depth, stats):
+            return [unpack_state(code) for code in path]
     return None
 
 def input_state(prompt):
@@ -62,7 +81,7 @@ if __name__ == "__main__":
 
     print("\nSearching for solution with Iterative Deepening DFS (IDDFS)...\n")
 
-    solution = iddfs(start, goal, max_depth)
+    solution = iddfs(start, goal, max_depth, trace=True)
 
     if solution:
         print(f"\nSolution found in {len(solution) - 1} moves:\n")
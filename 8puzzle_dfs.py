@@ -1,32 +1,54 @@
-def find_zero(state):
-    for i in range(3):
-        for j in range(3):
-            if state[i][j] == 0:
-                return i, j
-
-def swap(state, x1, y1, x2, y2):
-    new_state = [row[:] for row in state]
-    new_state[x1][y1], new_state[x2][y2] = new_state[x2][y2], new_state[x1][y1]
-    return new_state
-
-def dfs(state, goal, path, visited):
-    if state == goal:
-        return path + [state]
-
-    visited.add(str(state))
-    x, y = find_zero(state)
-
-    moves = [(-1,0), (1,0), (0,-1), (0,1)]  # Up, Down, Left, Right
-
-    for dx, dy in moves:
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < 3 and 0 <= ny < 3:
-            new_state = swap(state, x, y, nx, ny)
-            if str(new_state) not in visited:
-                result = dfs(new_state, goal, path + [state], visited)
-                if result is not None:
-                    return result
-    return None
+from A_star import BLANK_SHIFT, move_table, pack_state, unpack_state
+
+def dfs(start, goal, node_budget=None, memory_budget=None, stats=None):
+    """Iterative depth-first search over packed boards.
+
+    Uses an explicit stack of move iterators and a path stack that is pushed
+    and popped in place, so deep searches never hit the recursion limit.
+    `node_budget` caps the number of states pushed and `memory_budget` caps
+    the number of states kept in the visited set; when either runs out the
+    search stops and returns None. If a `stats` dict is given it receives
+    "expanded", "visited" and "stopped" (None, "node budget" or "memory budget").
+    """
+    start_code, goal_code = pack_state(start), pack_state(goal)
+    visited = {start_code}
+    path = [start_code]
+    frames = [iter(move_table[start_code >> BLANK_SHIFT])]  # Up, Down, Left, Right order
+    expanded = 1
+    stopped = None
+    found = start_code == goal_code
+
+    while frames and not found:
+        code = path[-1]
+        for cell, cell_shift, blank_shift, blank_delta in frames[-1]:
+            tile = (code >> cell_shift) & 0xF
+            child = code + (tile << blank_shift) - (tile << cell_shift) + blank_delta
+            if child not in visited:
+                break
+        else:
+            frames.pop()
+            path.pop()
+            continue
+
+        if node_budget is not None and expanded >= node_budget:
+            stopped = "node budget"
+            break
+        if memory_budget is not None and len(visited) >= memory_budget:
+            stopped = "memory budget"
+            break
+        expanded += 1
+        visited.add(child)
+        path.append(child)
+        if child == goal_code:
+            found = True
+        else:
+            frames.append(iter(move_table[child >> BLANK_SHIFT]))
+
+    if stats is not None:
+        stats["expanded"] = expanded
+        stats["visited"] = len(visited)
+        stats["stopped"] = stopped
+    return [unpack_state(code) for code in path] if found else None
 
 def input_state(prompt):
     print(prompt)
@@ -48,7 +70,7 @@ if __name__ == "__main__":
 
     print("\nSearching for solution with pure DFS (no depth limit)...")
 
-    solution = dfs(start, goal, [], set())
+    solution = dfs(start, goal)
 
     if solution:
         print(f"\nSolution found in {len(solution)-1} moves:\n")
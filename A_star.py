@@ -1,4 +1,6 @@
+import functools
 import heapq
+import itertools
 
 # ----- Goal state -----
 goal_state = [[1, 2, 3],
@@ -14,6 +16,64 @@ for i in range(3):
     for j in range(3):
         goal_positions[goal_state[i][j]] = (i, j)
 
+# ----- Packed State Encoding -----
+# A board is packed into one int: cell k (row-major) keeps its tile in bits
+# 4k..4k+3 and the index of the blank cell is kept in bits 36..39, so moves
+# never have to search for the 0.
+BLANK_SHIFT = 36
+
+def pack_state(state):
+    """Pack a 3x3 board into a single integer."""
+    code = 0
+    for i in range(3):
+        for j in range(3):
+            k = 3 * i + j
+            code |= state[i][j] << (4 * k)
+            if state[i][j] == 0:
+                code |= k << BLANK_SHIFT
+    return code
+
+def unpack_state(code):
+    """Rebuild the 3x3 board from its packed integer."""
+    return [[(code >> (4 * (3 * i + j))) & 0xF for j in range(3)] for i in range(3)]
+
+def unpack_cells(code):
+    """Flat row-major list of tiles, the board form external heuristics take."""
+    return [(code >> shift) & 0xF for shift in range(0, 36, 4)]
+
+# For every blank cell: (cell, cell_shift, blank_shift, blank_delta) of each
+# cell the blank can swap with. Sliding the tile t from `cell` into the blank
+# is then code + (t << blank_shift) - (t << cell_shift) + blank_delta.
+move_table = []
+for k in range(9):
+    x, y = divmod(k, 3)
+    entries = []
+    for dx, dy in moves:
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < 3 and 0 <= ny < 3:
+            cell = 3 * nx + ny
+            entries.append((cell, 4 * cell, 4 * k, (cell - k) << BLANK_SHIFT))
+    move_table.append(tuple(entries))
+
+def build_distance_table(goal):
+    """distance_table[tile][cell] = Manhattan distance of `tile` at `cell` from its goal cell."""
+    table = [[0] * 9 for _ in range(9)]
+    for gi in range(3):
+        for gj in range(3):
+            tile = goal[gi][gj]
+            if tile != 0:
+                for k in range(9):
+                    table[tile][k] = abs(k // 3 - gi) + abs(k % 3 - gj)
+    return table
+
+@functools.lru_cache(maxsize=64)
+def goal_distance_table(goal_code):
+    """Distance table for a packed goal, built once per goal in each process."""
+    return build_distance_table(unpack_state(goal_code))
+
+goal_code = pack_state(goal_state)
+distance_table = goal_distance_table(goal_code)
+
 # ----- Heuristic Function -----
 def manhattan_distance(state):
     """Calculate the Manhattan distance heuristic."""
@@ -26,82 +86,124 @@ def manhattan_distance(state):
                 distance += abs(i - gi) + abs(j - gj)
     return distance
 
-# ----- Utility Functions -----
-def find_blank(state):
-    for i in range(3):
-        for j in range(3):
-            if state[i][j] == 0:
-                return i, j
-
-def get_neighbors(state):
-    neighbors = []
-    x, y = find_blank(state)
-    for dx, dy in moves:
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < 3 and 0 <= ny < 3:
-            new_state = [row[:] for row in state]
-            new_state[x][y], new_state[nx][ny] = new_state[nx][ny], new_state[x][y]
-            neighbors.append(new_state)
-    return neighbors
-
-def state_to_tuple(state):
-    return tuple(tuple(row) for row in state)
+def packed_manhattan(code, table=distance_table):
+    """Manhattan distance of a packed board (used once per search, moves update it incrementally)."""
+    return sum(table[(code >> (4 * k)) & 0xF][k] for k in range(9))
 
+# ----- Utility Functions -----
 def print_state(state):
     for row in state:
         print(" ".join(str(x) if x != 0 else " " for x in row))
     print()
 
 # ----- A* Search -----
-def a_star(start_state):
-    open_set = []
-    heapq.heappush(open_set, (0, start_state, [], 0))  # (f, state, path, g)
-    visited = set()
-
-    print("🔹 Starting A* Search...\n")
-    while open_set:
-        f, current, path, g = heapq.heappop(open_set)
-        if state_to_tuple(current) in visited:
-            continue
-        visited.add(state_to_tuple(current))
-
-        h = manhattan_distance(current)
-        print(f"Exploring Node (g={g}, h={h}, f={f}):")
-        print_state(current)
-
-        if current == goal_state:
-            print("✅ Goal Reached!\n")
-            return path + [current]
-
-        for neighbor in get_neighbors(current):
-            if state_to_tuple(neighbor) not in visited:
-                g_new = g + 1
-                h_new = manhattan_distance(neighbor)
-                f_new = g_new + h_new
-                heapq.heappush(open_set, (f_new, neighbor, path + [current], g_new))
-
+def reconstruct_path(nodes, code):
+    """Follow parent pointers from `code` back to the start."""
+    path = []
+    while code is not None:
+        path.append(code)
+        code = nodes[code][0]
+    path.reverse()
+    return path
+
+def a_star(start_state, goal=None, trace=False, stats=None, heuristic=None, batch_heuristic=None):
+    """A* over packed boards; pass trace=True to print every explored node.
+
+    `goal` defaults to the module's goal_state. `heuristic` replaces the
+    incremental Manhattan distance with a callable on flat boards, e.g. a
+    pattern database built for the same goal. `batch_heuristic` instead
+    scores a list of packed boards in one call (see
+    vectorized_heuristics.packed_heuristic): every open node on the lowest f
+    is expanded before their children are scored together, which keeps the
+    search optimal for a consistent heuristic. If a `stats` dict is given,
+    the number of expanded nodes is stored under "expanded".
+    """
+    target = goal_code if goal is None else pack_state(goal)
+    table = goal_distance_table(target)
+    start = pack_state(start_state)
+    if batch_heuristic is not None:
+        h_start = int(batch_heuristic([start])[0])
+    elif heuristic is None:
+        h_start = packed_manhattan(start, table)
+    else:
+        h_start = heuristic(unpack_cells(start))
+    # Node store: state -> (parent, best g found so far). Heap entries only
+    # carry the state, paths are rebuilt once the goal is popped.
+    nodes = {start: (None, 0)}
+    tie = itertools.count()
+    open_set = [(h_start, next(tie), start, 0, h_start)]  # (f, tie, state, g, h)
+    expanded = 0
+    pending = []     # (state, g) of children waiting to be scored with the rest of their f layer
+    layer_f = h_start
+
+    if trace:
+        print("🔹 Starting A* Search...\n")
+    while open_set or pending:
+        if pending and (not open_set or open_set[0][0] > layer_f):
+            # the lowest f layer is fully expanded: score all of its children at once
+            for (neighbor, g_new), h_new in zip(pending, batch_heuristic([code for code, _ in pending])):
+                heapq.heappush(open_set, (g_new + h_new, next(tie), neighbor, g_new, h_new))
+            pending.clear()
+        f, _, current, g, h = heapq.heappop(open_set)
+        if g > nodes[current][1]:
+            continue  # stale entry, a cheaper route to this state was pushed later
+        expanded += 1
+
+        if trace:
+            print(f"Exploring Node (g={g}, h={h}, f={f}):")
+            print_state(unpack_state(current))
+
+        if current == target:
+            if trace:
+                print("✅ Goal Reached!\n")
+            if stats is not None:
+                stats["expanded"] = expanded
+            return [unpack_state(code) for code in reconstruct_path(nodes, current)]
+
+        blank = current >> BLANK_SHIFT
+        g_new = g + 1
+        for cell, cell_shift, blank_shift, blank_delta in move_table[blank]:
+            tile = (current >> cell_shift) & 0xF
+            neighbor = current + (tile << blank_shift) - (tile << cell_shift) + blank_delta
+            known = nodes.get(neighbor)
+            if known is None or g_new < known[1]:
+                nodes[neighbor] = (current, g_new)
+                if batch_heuristic is not None:
+                    pending.append((neighbor, g_new))
+                    layer_f = f
+                    continue
+                if heuristic is None:
+                    # only the moved tile changes its distance to the goal
+                    h_new = h + table[tile][blank] - table[tile][cell]
+                else:
+                    h_new = heuristic(unpack_cells(neighbor))
+                heapq.heappush(open_set, (g_new + h_new, next(tie), neighbor, g_new, h_new))
+
+    if stats is not None:
+        stats["expanded"] = expanded
     return None
 
-# ----- Example Input -----
-initial_state = [[2, 8, 3],
-                 [1, 6, 4],
-                 [7, 0, 5]]
-
-print("🔹 Initial State:")
-print_state(initial_state)
-print("🔹 Goal State:")
-print_state(goal_state)
-
-solution = a_star(initial_state)
-
-# ----- Print Solution Path -----
-if solution:
-    print("🔹 Solution Path:")
-    for step, state in enumerate(solution):
-        g = step
-        h = manhattan_distance(state)
-        f = g + h
-        print(f"Step {step}: g={g}, h={h}, f={f}")
-        print_state(state)
-else:
-    print("❌ No solution found.")
+if __name__ == "__main__":
+    # ----- Example Input -----
+    initial_state = [[2, 8, 3],
+                     [1, 6, 4],
+                     [7, 0, 5]]
+
+    print("🔹 Initial State:")
+    print_state(initial_state)
+    print("🔹 Goal State:")
+    print_state(goal_state)
+
+    solution = a_star(initial_state, trace=True)
+
+    # ----- Print Solution Path -----
+    if solution:
+        print("🔹 Solution Path:")
+        for step, state in enumerate(solution):
+            g = step
+            h = manhattan_distance(state)
+            f = g + h
+            print(f"Step {step}: g={g}, h={h}, f={f}")
+            print_state(state)
+    else:
+        print("❌ No solution found.")
@@ -0,0 +1,218 @@
+"""Goal-directed backward chaining with tabling over a FOLKB.
+
+A query is answered by resolving it against the KB's facts and the rules
+whose consequent matches it, solving rule bodies left to right with the
+bindings found so far. Every subgoal is tabled under its variant (the goal
+with its variables renamed canonically), so
+
+  * a repeated subgoal is answered from its table instead of being re-proved,
+  * a recursive call to a subgoal that is still being evaluated consumes the
+    answers found so far, and the subgoal that leads the recursive cluster
+    is re-evaluated until no table gains an answer (linear tabling), which
+    makes left-recursive and cyclic rules terminate. Within one such pass
+    every other member of the cluster is re-evaluated at most once.
+
+Answers to the query itself are streamed as they are proved, so a caller
+can stop after the first proof; subgoals are evaluated to completion.
+Facts are ground atoms and rules are range-restricted (Datalog), as in
+FOL_Forward_reasoning. Each distinct subgoal opened inside another one
+nests a Python call, so right recursion along chains longer than a couple
+of hundred steps needs a higher sys.setrecursionlimit().
+"""
+
+from FOL_Forward_reasoning import FOLKB, Rule, extend, is_variable
+
+# -------------------- Tables --------------------
+
+def variant(goal):
+    """Goal with its variables numbered by first occurrence, e.g. P(x, A, x) -> P(0, A, 0)."""
+    pred, args = goal
+    names = {}
+    return (pred, tuple((True, names.setdefault(a, len(names))) if is_variable(a) else (False, a)
+                        for a in args))
+
+class Table:
+    """Answers (ground argument tuples) found for one subgoal variant."""
+    def __init__(self):
+        self.answers = {}      # args -> None (an insertion-ordered set)
+        self.complete = False
+        self.evaluating = False
+        self.depth = 0         # position on the evaluation stack
+        self.link = 0          # shallowest in-progress table this evaluation depends on
+        self.loops = False     # some evaluation consumed this table while it was in progress
+        self.iteration = -1    # leader iteration in which this table was last evaluated
+
+class BackwardChainer:
+    """Tabled backward chaining over the facts and rules of a FOLKB."""
+    def __init__(self, kb):
+        self.kb = kb
+        self.tables = {}
+        self.stack = []
+        self.pending = []      # incomplete tables waiting for their leader to finish
+        self.added = 0         # answers added to any table, to detect a fixpoint
+        self.iteration = 0     # bumped whenever a leader starts another pass
+        self.size = None
+
+    def reset(self):
+        self.tables.clear()
+        self.pending.clear()
+
+    # -------------------- Queries --------------------
+
+    def ask(self, query):
+        """Yield one binding dict per answer to `query` as soon as it is proved."""
+        if self.stack:
+            raise RuntimeError("finish or close the previous ask() before starting another")
+        size = (len(self.kb.facts), len(self.kb.rules))
+        if size != self.size:  # the KB changed, so the tables may be incomplete
+            self.reset()
+            self.size = size
+        pattern = tuple((is_variable(a), a) for a in query[1])
+        key = variant(query)
+        table = self.tables.get(key)
+        if table is None:
+            table = self.tables[key] = Table()
+        answers = iter(table.answers) if table.complete else self._evaluate(query, table)
+        try:
+            for values in answers:
+                yield {a: v for (var, a), v in zip(pattern, values) if var}
+        finally:
+            if not table.complete:
+                answers.close()
+
+    def prove(self, query):
+        """True as soon as one proof of `query` is found."""
+        answers = self.ask(query)
+        try:
+            return next(answers, None) is not None
+        finally:
+            answers.close()
+
+    # -------------------- Evaluation --------------------
+
+    def _answers(self, goal):
+        """All answers to a subgoal: from its table, or by evaluating it now."""
+        key = variant(goal)
+        table = self.tables.get(key)
+        if table is None:
+            table = self.tables[key] = Table()
+        if table.complete:
+            return table.answers
+        if table.evaluating:
+            # a recursive call: use what is known; the leader will come back for more
+            table.loops = True
+            caller = self.stack[-1]
+            caller.link = min(caller.link, table.depth)
+            return list(table.answers)
+        if table.iteration == self.iteration:
+            # already re-evaluated in this pass; depend on its cluster's leader instead
+            caller = self.stack[-1]
+            caller.link = min(caller.link, table.link)
+            return list(table.answers)
+        return list(self._evaluate(goal, table))
+
+    def _evaluate(self, goal, table):
+        """Yield the table's known answers, then each new one as it is proved."""
+        yield from list(table.answers)
+        table.evaluating = True
+        table.depth = table.link = len(self.stack)
+        table.loops = False
+        table.iteration = self.iteration
+        self.stack.append(table)
+        first_pending = len(self.pending)
+        finished = False
+        try:
+            while True:
+                before = self.added
+                for values in self._resolve(goal):
+                    if values not in table.answers:
+                        table.answers[values] = None
+                        self.added += 1
+                        yield values
+                if table.link < table.depth or not table.loops or self.added == before:
+                    break
+                self.iteration += 1
+            finished = True
+        finally:
+            self.stack.pop()
+            table.evaluating = False
+            if self.stack and table.link < table.depth:
+                # part of a recursive cluster led further up the stack
+                caller = self.stack[-1]
+                caller.link = min(caller.link, table.link)
+                for member in self.pending[first_pending:]:
+                    member.link = min(member.link, table.link)
+                self.pending.append(table)
+            elif finished:
+                table.complete = True
+                for member in self.pending[first_pending:]:
+                    member.complete = True
+                del self.pending[first_pending:]
+            else:  # abandoned by the caller; nothing half-evaluated may be reused
+                for member in self.pending[first_pending:]:
+                    member.iteration = -1
+                table.iteration = -1
+                del self.pending[first_pending:]
+
+    def _resolve(self, goal):
+        """One pass over the facts and rules matching `goal`; yields answer tuples."""
+        pred, args = goal
+        for fact in self.kb.matching(goal):
+            yield fact[1]
+        pattern = tuple((is_variable(a), a) for a in args)
+        for rule in self.kb.rules:
+            head_pred, head_args = rule.consequent
+            if head_pred != pred or len(head_args) != len(args):
+                continue
+            # constants in the goal bind the rule's head variables before the body is solved
+            theta = {}
+            for h, g in zip(head_args, args):
+                if is_variable(h):
+                    if not is_variable(g) and theta.setdefault(h, g) != g:
+                        break
+                elif not is_variable(g) and h != g:
+                    break
+            else:
+                for bindings in self._body(rule.patterns, 0, theta):
+                    values = tuple(bindings.get(a, a) for a in head_args)
+                    if extend(pattern, values, {}) is not None:
+                        yield values
+
+    def _body(self, patterns, k, theta):
+        """Solve patterns[k:] left to right, passing the bindings along."""
+        if k == len(patterns):
+            yield theta
+            return
+        pred, pattern = patterns[k]
+        subgoal = (pred, tuple(theta.get(a, a) if var else a for var, a in pattern))
+        for values in self._answers(subgoal):
+            extended = extend(pattern, values, theta)
+            if extended is not None:
+                yield from self._body(patterns, k + 1, extended)
+
+# -------------------- Demo --------------------
+
+if __name__ == "__main__":
+    kb = FOLKB()
+    kb.add_fact(("Owns", ("A", "t1")))
+    kb.add_fact(("Missile", ("t1",)))
+    kb.add_fact(("American", ("Robert",)))
+    kb.add_fact(("Enemy", ("A", "America")))
+    kb.add_rule(Rule([("Missile", ("x",))], ("Weapon", ("x",))))
+    kb.add_rule(Rule([("Enemy", ("x", "America"))], ("Hostile", ("x",))))
+    kb.add_rule(Rule([("Missile", ("x",)), ("Owns", ("A", "x"))], ("Sells", ("Robert", "x", "A"))))
+    kb.add_rule(Rule([("American", ("p",)), ("Weapon", ("q",)), ("Sells", ("p", "q", "r")), ("Hostile", ("r",))],
+                     ("Criminal", ("p",))))
+
+    # a left-recursive rule over a cyclic graph: plain SLD resolution would loop forever
+    for a, b in [("A", "B"), ("B", "C"), ("C", "A"), ("C", "D")]:
+        kb.add_fact(("Edge", (a, b)))
+    kb.add_rule(Rule([("Path", ("x", "y")), ("Edge", ("y", "z"))], ("Path", ("x", "z"))))
+    kb.add_rule(Rule([("Edge", ("x", "y"))], ("Path", ("x", "y"))))
+
+    engine = BackwardChainer(kb)
+    query = ("Criminal", ("Robert",))
+    print(f"Query {query} proved? -> {engine.prove(query)}")
+    query = ("Path", ("A", "y"))
+    print(f"Answers to {query}:", sorted(b["y"] for b in engine.ask(query)))
+    print(f"Tabled subgoals: {len(engine.tables)}")
@@ -1,5 +1,7 @@
-from copy import deepcopy
-from itertools import product
+from bisect import bisect_left
+from collections import deque
+
+from FOL_fact_store import FactStore
 
 # -------------------- Utility functions --------------------
 
@@ -51,118 +53,465 @@ class Rule:
     def __init__(self, antecedents, consequent):
         self.antecedents = antecedents  # list of atoms
         self.consequent = consequent    # single atom
+        # each argument pre-split into (is variable, symbol) for the join loop
+        self.patterns = [(p, tuple((is_variable(a), a) for a in args)) for p, args in antecedents]
     def __repr__(self):
         ants = " ∧ ".join([f"{p}{a}" for p, a in self.antecedents])
         return f"{ants} => {self.consequent[0]}{self.consequent[1]}"
 
+def extend(pattern, values, theta):
+    """Bindings extending theta so that `pattern` matches the ground `values`, or None."""
+    new = None
+    for (var, a), v in zip(pattern, values):
+        if var:
+            bound = (theta if new is None else new).get(a)
+            if bound is None:
+                if new is None:
+                    new = dict(theta)
+                new[a] = v
+            elif bound != v:
+                return None
+        elif a != v:
+            return None
+    return theta if new is None else new
+
 class FOLKB:
-    """Forward chaining knowledge base."""
-    def __init__(self):
-        self.facts = set()
+    """Forward chaining knowledge base over ground facts.
+
+    Facts live in a FactStore: symbols are interned to integer ids and each
+    relation is kept column-wise with an index from (position, constant) to
+    rows. Rows are appended in insertion order, so "facts added before round
+    r" is a prefix of every index. Rules are compiled to ids when added and
+    joined on ids. forward_chain is semi-naive: a rule is only joined on
+    combinations that use at least one fact it has not seen yet.
+
+    With provenance=True each derived fact records its rule number and the
+    ids of the facts it came from; derived_steps formats them on demand.
+    """
+    def __init__(self, provenance=False):
+        self.facts = FactStore()
+        self.symbols = self.facts.symbols
         self.rules = []
-        self.derived_steps = []
+        self.compiled = []     # per rule: ([(pred id, pattern)], (pred id, pattern)), constants as ids
+        self.seen = []         # seen[r] = facts rule r has already been joined against
+        self.provenance = {} if provenance else None  # fact id -> (rule number, fact ids) or source
 
     def add_fact(self, atom, source="given"):
-        if atom not in self.facts:
-            self.facts.add(atom)
-            self.derived_steps.append(f"Derived fact {atom} ({source})")
-            return True
-        return False
+        fid = self.facts.add(atom)
+        if fid is None:
+            return False
+        if self.provenance is not None and source != "given":
+            self.provenance[fid] = source
+        return True
+
+    def load(self, path, pred=None, delimiter=None):
+        """Bulk-add the rows of a CSV/TSV file as facts (see FactStore.load)."""
+        return self.facts.load(path, pred, delimiter)
+
+    @property
+    def derived_steps(self):
+        """One line per fact explaining where it came from (empty without provenance)."""
+        if self.provenance is None:
+            return []
+        fact = self.facts.fact
+        steps = []
+        for fid in range(len(self.facts)):
+            source = self.provenance.get(fid, "given")
+            if isinstance(source, tuple):
+                r, used = source
+                source = f"from rule {self.rules[r]} using {tuple(fact(u) for u in used)}"
+            steps.append(f"Derived fact {fact(fid)} ({source})")
+        return steps
 
     def add_rule(self, rule):
+        intern = self.symbols.intern
+        body_vars = {a for _, args in rule.antecedents for a in args if is_variable(a)}
+        patterns = [(intern(p), tuple((True, a) if is_variable(a) else (False, intern(a)) for a in args))
+                    for p, args in rule.antecedents]
+        pred, args = rule.consequent
+        # a head variable the body never binds stays in the fact as a name, as before
+        head = (intern(pred), tuple((True, a) if a in body_vars else (False, intern(a)) for a in args))
         self.rules.append(rule)
+        self.compiled.append((patterns, head))
+        self.seen.append(0)
+
+    def candidates(self, pred, pattern, theta, lo, hi):
+        """(relation, rows) holding the facts with ids in [lo, hi) that may match
+        `pattern` under theta, taken from the most selective index."""
+        rel = self.facts.relation(pred, len(pattern))
+        if rel is None:
+            return None, ()
+        start, stop = rel.rows_between(lo, hi)
+        best = None
+        for pos, (var, a) in enumerate(pattern):
+            value = theta.get(a) if var else a
+            if value is not None:
+                rows = rel.rows_with(pos, value)
+                if not rows:
+                    return rel, ()
+                if best is None or len(rows) < len(best):
+                    best = rows
+        if best is None or len(best) >= stop - start:
+            return rel, range(start, stop)
+        return rel, best[bisect_left(best, start) if start else 0:bisect_left(best, stop)]
+
+    def _join(self, steps, k, theta, used):
+        """Match steps[k:] left to right, passing the bindings along."""
+        if k == len(steps):
+            yield theta, used
+            return
+        pred, pattern, lo, hi = steps[k]
+        rel, rows = self.candidates(pred, pattern, theta, lo, hi)
+        if not rows:
+            return
+        columns, stamps = rel.columns, rel.stamps
+        for r in rows:
+            extended = extend(pattern, tuple(column[r] for column in columns), theta)
+            if extended is not None:
+                yield from self._join(steps, k + 1, extended, used + (stamps[r],))
+
+    def matching(self, atom):
+        """Yield the facts matching `atom` (which may contain variables)."""
+        get = self.symbols.get
+        pred, args = atom
+        pred_id = get(pred)
+        pattern = tuple((True, a) if is_variable(a) else (False, get(a)) for a in args)
+        if pred_id is None or (False, None) in pattern:
+            return
+        rel, rows = self.candidates(pred_id, pattern, {}, 0, len(self.facts))
+        for r in rows:
+            values = rel.row(r)
+            if extend(pattern, values, {}) is not None:
+                yield self.facts.decode(pred_id, values)
 
     def forward_chain(self, query=None, max_iter=1000):
-        """Perform forward chaining until no new facts or query proven."""
-        new_added = True
+        """Perform forward chaining until no new facts or query proven.
+
+        Each round joins every rule once per antecedent i, with antecedent i
+        restricted to the facts that are new to the rule, antecedents before
+        it to the old facts and those after it to old and new ones, so no
+        combination is tried twice.
+        """
+        facts = self.facts
         iter_count = 0
-        while new_added and iter_count < max_iter:
+        while iter_count < max_iter:
+            hi = len(facts)
+            if all(seen == hi for seen in self.seen):
+                break
             iter_count += 1
-            new_added = False
-            for rule in self.rules:
-                # Rename variables in the rule to avoid clashes
-                var_map = {}
-                fresh_ants = []
-                fresh_cons = deepcopy(rule.consequent)
-
-                def freshen_term(t):
-                    if is_variable(t):
-                        if t not in var_map:
-                            var_map[t] = f"{t}_{iter_count}"
-                        return var_map[t]
-                    return t
-
-                for p, args in rule.antecedents:
-                    fresh_ants.append((p, tuple(freshen_term(a) for a in args)))
-                fresh_cons = (fresh_cons[0], tuple(freshen_term(a) for a in fresh_cons[1]))
-
-                # Match antecedents with known facts
-                candidate_facts_lists = []
-                for (p, a) in fresh_ants:
-                    candidate_facts_lists.append([f for f in self.facts if f[0] == p and len(f[1]) == len(a)])
-
-                # Try all combinations of matching facts
-                for combo in product(*candidate_facts_lists):
-                    theta = {}
-                    fail = False
-                    for ant_atom, fact_atom in zip(fresh_ants, combo):
-                        theta = unify(ant_atom, fact_atom, theta)
-                        if theta is None:
-                            fail = True
-                            break
-                    if fail:
-                        continue
-
-                    # Infer new fact
-                    inferred = substitute(fresh_cons, theta)
-                    if self.add_fact(inferred, source=f"from rule {rule} using {combo}"):
-                        new_added = True
-                        if query is not None and unify(inferred, query) is not None:
+            for r, (patterns, (head_pred, head)) in enumerate(self.compiled):
+                lo = self.seen[r]
+                if lo == hi:
+                    continue
+                for i in range(len(patterns)):
+                    if i and not lo:
+                        break  # no old facts to pair the earlier antecedents with
+                    order = [i] + [j for j in range(len(patterns)) if j != i]
+                    steps = [(patterns[j][0], patterns[j][1],
+                              lo if j == i else 0, lo if j < i else hi) for j in order]
+                    for theta, used in self._join(steps, 0, {}, ()):
+                        values = tuple(theta[a] if var else a for var, a in head)
+                        fid = facts.add_ids(head_pred, values)
+                        if fid is None:
+                            continue
+                        if self.provenance is not None:
+                            combo = [None] * len(order)
+                            for j, u in zip(order, used):
+                                combo[j] = u
+                            self.provenance[fid] = (r, tuple(combo))
+                        if query is not None and unify(facts.decode(head_pred, values), query) is not None:
                             return True
-        return (query is None) or (any(unify(f, query) is not None for f in self.facts))
+                self.seen[r] = hi
+        return (query is None) or (next(self.matching(query), None) is not None)
+
+# -------------------- Rete Network --------------------
+
+class AlphaMemory:
+    """Facts passing one antecedent pattern's constant and repeated-variable tests."""
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.items = {}        # fact -> None (an insertion-ordered set)
+        self.successors = []   # join nodes fed by this memory
+
+    def test(self, args):
+        seen = {}
+        for (var, a), v in zip(self.pattern, args):
+            if not var:
+                if a != v:
+                    return False
+            elif seen.setdefault(a, v) != v:
+                return False
+        return True
+
+class JoinNode:
+    """Joins the partial matches (tokens) of the antecedents before it with one alpha memory.
+
+    Both sides are hashed on the values of the variables they share, so an
+    activation only meets the entries it can actually join with.
+    """
+    def __init__(self, parent, alpha, pattern, bound):
+        self.parent = parent
+        self.alpha = alpha
+        self.shared = tuple((a, pos) for pos, (var, a) in enumerate(pattern) if var and a in bound)
+        self.binds = {}
+        for pos, (var, a) in enumerate(pattern):
+            if var and a not in bound:
+                self.binds.setdefault(a, pos)
+        self.left = {(): {(): {}}} if parent is None else {}  # key -> {token: bindings}
+        self.right = {}        # key -> {fact: None}
+        self.children = []
+        self.rules = []        # rules whose last antecedent is this node
+
+    def key_of(self, fact):
+        args = fact[1]
+        return tuple(args[pos] for _, pos in self.shared)
+
+    def bind(self, theta, fact):
+        if not self.binds:
+            return theta
+        theta = dict(theta)
+        args = fact[1]
+        for a, pos in self.binds.items():
+            theta[a] = args[pos]
+        return theta
+
+    def outputs(self):
+        """Every complete token this node currently produces."""
+        for key, tokens in self.left.items():
+            facts = self.right.get(key, ())
+            for token, theta in tokens.items():
+                for fact in facts:
+                    yield token + (fact,), self.bind(theta, fact)
+
+class ReteKB:
+    """Knowledge base that keeps its facts closed under the rules as they are added.
+
+    Rules are compiled into a Rete network: one alpha memory per distinct
+    antecedent pattern and a chain of join nodes per rule, with chains that
+    start with the same antecedents shared. Adding a fact only propagates the
+    matches it takes part in, so its cost depends on how many rules and
+    partial matches it touches rather than on the size of the KB.
+
+    Each fact counts its supports (the complete rule matches deriving it,
+    plus one if it was given). Retracting a given fact removes every match
+    it took part in and, transitively, the facts left without support.
+    Facts supporting each other through a cycle of recursive rules keep
+    each other alive, as with any counting-based maintenance.
+    """
+    def __init__(self):
+        self.facts = {}        # fact -> number of rule matches deriving it
+        self.given = set()
+        self.by_pred = {}      # (pred, arity) -> {fact: None}
+        self.rules = []
+        self.alphas = {}       # (pred, arity) -> {alpha key: AlphaMemory}
+        self.prefixes = {}     # antecedent prefix -> JoinNode
+        self.matches = {}      # (rule, token) -> inferred fact
+        self.tokens_with = {}  # fact -> {(node or rule, token): key}
+        self.agenda = deque()
+        self.derived_steps = []
+
+    # ----- Building the network -----
+    def _alpha(self, pred, pattern):
+        names = {}
+        key = tuple((var, names.setdefault(a, len(names)) if var else a) for var, a in pattern)
+        memories = self.alphas.setdefault((pred, len(pattern)), {})
+        alpha = memories.get(key)
+        if alpha is None:
+            alpha = memories[key] = AlphaMemory(pattern)
+            for fact in self.by_pred.get((pred, len(pattern)), ()):
+                if alpha.test(fact[1]):
+                    alpha.items[fact] = None
+        return alpha
+
+    def add_rule(self, rule):
+        self.rules.append(rule)
+        node, bound, created = None, set(), []
+        for k, (pred, pattern) in enumerate(rule.patterns):
+            prefix = tuple(rule.antecedents[:k + 1])
+            child = self.prefixes.get(prefix)
+            if child is None:
+                alpha = self._alpha(pred, pattern)
+                child = self.prefixes[prefix] = JoinNode(node, alpha, pattern, bound)
+                for fact in alpha.items:
+                    child.right.setdefault(child.key_of(fact), {})[fact] = None
+                alpha.successors.append(child)
+                if node is not None:
+                    node.children.append(child)
+                created.append(child)
+            node = child
+            bound.update(a for var, a in pattern if var)
+        node.rules.append(rule)
+
+        # bring the new part of the network up to date with the facts already known
+        if created:
+            first = created[0]
+            tokens = [((), {})] if first.parent is None else list(first.parent.outputs())
+            for token, theta in tokens:
+                self._left(first, token, theta)
+        else:
+            for token, theta in list(node.outputs()):
+                self._fire(rule, token, theta)
+        self._run()
+
+    # ----- Propagation -----
+    def _register(self, owner, token, key):
+        for fact in token:
+            self.tokens_with.setdefault(fact, {})[(owner, token)] = key
+
+    def _left(self, node, token, theta):
+        key = tuple(theta[a] for a, _ in node.shared)
+        node.left.setdefault(key, {})[token] = theta
+        self._register(node, token, key)
+        for fact in node.right.get(key, ()):
+            self._emit(node, token + (fact,), node.bind(theta, fact))
+
+    def _right(self, node, fact):
+        key = node.key_of(fact)
+        node.right.setdefault(key, {})[fact] = None
+        for token, theta in list(node.left.get(key, {}).items()):
+            self._emit(node, token + (fact,), node.bind(theta, fact))
+
+    def _emit(self, node, token, theta):
+        for child in node.children:
+            self._left(child, token, theta)
+        for rule in node.rules:
+            self._fire(rule, token, theta)
+
+    def _fire(self, rule, token, theta):
+        pred, args = rule.consequent
+        inferred = (pred, tuple(theta.get(a, a) for a in args))
+        self.matches[(rule, token)] = inferred
+        self._register(rule, token, None)
+        supports = self.facts.get(inferred)
+        if supports is None:
+            self.facts[inferred] = 1
+            self.agenda.append((inferred, f"from rule {rule} using {token}"))
+        else:
+            self.facts[inferred] = supports + 1
+
+    def _insert(self, fact, source):
+        self.by_pred.setdefault((fact[0], len(fact[1])), {})[fact] = None
+        self.derived_steps.append(f"Derived fact {fact} ({source})")
+        for alpha in self.alphas.get((fact[0], len(fact[1])), {}).values():
+            if alpha.test(fact[1]):
+                alpha.items[fact] = None
+                for node in alpha.successors:
+                    self._right(node, fact)
+
+    def _run(self):
+        while self.agenda:
+            self._insert(*self.agenda.popleft())
+
+    def add_fact(self, atom, source="given"):
+        if atom in self.given:
+            return False
+        self.given.add(atom)
+        if atom in self.facts:
+            return False
+        self.facts[atom] = 0
+        self.agenda.append((atom, source))
+        self._run()
+        return True
+
+    # ----- Retraction -----
+    def retract_fact(self, atom):
+        """Withdraw a given fact and everything that no longer has a derivation."""
+        if atom not in self.given:
+            return False
+        self.given.discard(atom)
+        pending = [atom] if self.facts[atom] == 0 else []
+        while pending:
+            fact = pending.pop()
+            del self.facts[fact]
+            del self.by_pred[(fact[0], len(fact[1]))][fact]
+            self.derived_steps.append(f"Retracted fact {fact}")
+            for alpha in self.alphas.get((fact[0], len(fact[1])), {}).values():
+                if fact in alpha.items:
+                    del alpha.items[fact]
+                    for node in alpha.successors:
+                        del node.right[node.key_of(fact)][fact]
+            for (owner, token), key in list(self.tokens_with.pop(fact, {}).items()):
+                for other in token:
+                    if other != fact:
+                        self.tokens_with.get(other, {}).pop((owner, token), None)
+                if isinstance(owner, JoinNode):
+                    owner.left[key].pop(token, None)
+                    continue
+                inferred = self.matches.pop((owner, token))
+                self.facts[inferred] -= 1
+                if self.facts[inferred] == 0 and inferred not in self.given:
+                    pending.append(inferred)
+        return True
+
+    # ----- Queries -----
+    def matching(self, atom):
+        """Yield the facts matching `atom` (which may contain variables)."""
+        pred, args = atom
+        pattern = tuple((is_variable(a), a) for a in args)
+        for fact in self.by_pred.get((pred, len(args)), ()):
+            if extend(pattern, fact[1], {}) is not None:
+                yield fact
+
+    def forward_chain(self, query=None, max_iter=None):
+        """The network is always at its fixpoint; only the query is left to check."""
+        return (query is None) or (next(self.matching(query), None) is not None)
 
 # -------------------- Build Knowledge Base --------------------
 
-file_citation = "Week-8-AI-lab-FOL-ForwardChaining.pdf"
+if __name__ == "__main__":
+    file_citation = "Week-8-AI-lab-FOL-ForwardChaining.pdf"
+
+    kb = FOLKB(provenance=True)
+
+    # Existential instantiation: ∃x Owns(A,x) ∧ Missile(x)
+    kb.add_fact(("Owns", ("A", "t1")), source=f"existential-instantiation {file_citation}")
+    kb.add_fact(("Missile", ("t1",)), source=f"existential-instantiation {file_citation}")
 
-kb = FOLKB()
+    # Given facts
+    kb.add_fact(("American", ("Robert",)), source=file_citation)
+    kb.add_fact(("Enemy", ("A", "America")), source=file_citation)
 
-# Existential instantiation: ∃x Owns(A,x) ∧ Missile(x)
-kb.add_fact(("Owns", ("A", "t1")), source=f"existential-instantiation {file_citation}")
-kb.add_fact(("Missile", ("t1",)), source=f"existential-instantiation {file_citation}")
+    # Rules from the lab slides
+    kb.add_rule(Rule([("Missile", ("x",))], ("Weapon", ("x",))))
+    kb.add_rule(Rule([("Enemy", ("x", "America"))], ("Hostile", ("x",))))
+    kb.add_rule(Rule([("Missile", ("x",)), ("Owns", ("A", "x"))], ("Sells", ("Robert", "x", "A"))))
+    kb.add_rule(Rule([("American", ("p",)), ("Weapon", ("q",)), ("Sells", ("p", "q", "r")), ("Hostile", ("r",))], ("Criminal", ("p",))))
 
-# Given facts
-kb.add_fact(("American", ("Robert",)), source=file_citation)
-kb.add_fact(("Enemy", ("A", "America")), source=file_citation)
+    # Query
+    query = ("Criminal", ("Robert",))
 
-# Rules from the lab slides
-kb.add_rule(Rule([("Missile", ("x",))], ("Weapon", ("x",))))
-kb.add_rule(Rule([("Enemy", ("x", "America"))], ("Hostile", ("x",))))
-kb.add_rule(Rule([("Missile", ("x",)), ("Owns", ("A", "x"))], ("Sells", ("Robert", "x", "A"))))
-kb.add_rule(Rule([("American", ("p",)), ("Weapon", ("q",)), ("Sells", ("p", "q", "r")), ("Hostile", ("r",))], ("Criminal", ("p",))))
+    # -------------------- Run Forward Chaining --------------------
 
-# Query
-query = ("Criminal", ("Robert",))
+    print("Knowledge base forward chaining run based on:", file_citation)
+    print("\nInitial Facts:")
+    for f in sorted(kb.facts):
+        print(" ", f)
 
-# -------------------- Run Forward Chaining --------------------
+    print("\nRules:")
+    for r in kb.rules:
+        print(" ", r)
 
-print("Knowledge base forward chaining run based on:", file_citation)
-print("\nInitial Facts:")
-for f in sorted(kb.facts):
-    print(" ", f)
+    print("\nRunning forward chaining... (showing derivation steps)\n")
+    result = kb.forward_chain(query=query)
 
-print("\nRules:")
-for r in kb.rules:
-    print(" ", r)
+    for step in kb.derived_steps:
+        print(step)
 
-print("\nRunning forward chaining... (showing derivation steps)\n")
-result = kb.forward_chain(query=query)
+    print("\nFinal Facts in KB:")
+    for f in sorted(kb.facts):
+        print(" ", f)
 
-for step in kb.derived_steps:
-    print(step)
+    print(f"\nQuery {query} proved? -> {result}")
 
-print("\nFinal Facts in KB:")
-for f in sorted(kb.facts):
-    print(" ", f)
+    # -------------------- Incremental Matching (Rete) --------------------
 
-print(f"\nQuery {query} proved? -> {result}")
+    print("\nSame KB in a Rete network, rules first, then facts one at a time:")
+    rete = ReteKB()
+    for r in kb.rules:
+        rete.add_rule(r)
+    for f in [("American", ("Robert",)), ("Enemy", ("A", "America")),
+              ("Owns", ("A", "t1")), ("Missile", ("t1",))]:
+        rete.add_fact(f)
+        print(f"  after {f}: query proved? -> {rete.forward_chain(query)}")
+    rete.retract_fact(("Missile", ("t1",)))
+    print(f"  after retracting ('Missile', ('t1',)): query proved? -> {rete.forward_chain(query)}")
@@ -0,0 +1,188 @@
+"""Compact storage for large sets of ground facts.
+
+Predicates and constants are interned to integer ids. Each (predicate,
+arity) relation keeps its facts as array-backed columns of ids, one column
+per argument position, plus
+
+  * a hash of the packed argument ids for duplicate checks and membership,
+  * per position, an index from constant id to the rows holding it (a bare
+    int while there is only one, an array once there are more),
+  * the global id of every row (facts are numbered in insertion order across
+    all relations), so "facts added before id n" is a bisectable prefix.
+
+A fact costs a few machine words instead of a set entry holding nested
+tuples of strings, and relations can be bulk-loaded from CSV/TSV files.
+"""
+
+import csv
+from array import array
+from bisect import bisect_left
+
+class Symbols:
+    """Interning table between names and dense integer ids."""
+    def __init__(self):
+        self.ids = {}
+        self.names = []
+
+    def intern(self, name):
+        sid = self.ids.get(name)
+        if sid is None:
+            sid = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return sid
+
+    def get(self, name):
+        return self.ids.get(name)
+
+    def __len__(self):
+        return len(self.names)
+
+class Relation:
+    """All facts of one (predicate, arity), stored column-wise."""
+    def __init__(self, pred, arity):
+        self.pred = pred
+        self.arity = arity
+        self.columns = [array('i') for _ in range(arity)]
+        self.stamps = array('q')   # global fact id of each row
+        self.keys = {}             # packed argument ids -> row
+        self.index = [{} for _ in range(arity)]  # position -> {constant id: row or rows}
+
+    def __len__(self):
+        return len(self.stamps)
+
+    @staticmethod
+    def pack(values):
+        key = 0
+        for v in values:
+            key = (key << 32) | v
+        return key
+
+    def find(self, values):
+        return self.keys.get(self.pack(values))
+
+    def add(self, values, stamp):
+        """Append a row unless it is already present; returns the row or None."""
+        key = self.pack(values)
+        if key in self.keys:
+            return None
+        row = len(self.stamps)
+        self.keys[key] = row
+        self.stamps.append(stamp)
+        for pos, v in enumerate(values):
+            self.columns[pos].append(v)
+            index = self.index[pos]
+            rows = index.get(v)
+            if rows is None:
+                index[v] = row
+            elif type(rows) is int:
+                index[v] = array('i', (rows, row))
+            else:
+                rows.append(row)
+        return row
+
+    def rows_with(self, pos, value):
+        """Ascending rows holding `value` at `pos`."""
+        rows = self.index[pos].get(value)
+        if rows is None:
+            return ()
+        return (rows,) if type(rows) is int else rows
+
+    def row(self, r):
+        return tuple(column[r] for column in self.columns)
+
+    def rows_between(self, lo, hi):
+        """Row range holding the facts with global ids in [lo, hi)."""
+        stamps = self.stamps
+        start = bisect_left(stamps, lo) if lo else 0
+        stop = bisect_left(stamps, hi) if stamps and hi <= stamps[-1] else len(stamps)
+        return start, stop
+
+class FactStore:
+    """Interned, column-oriented set of ground atoms (pred, (arg, ...))."""
+    def __init__(self):
+        self.symbols = Symbols()
+        self.relations = {}        # (pred id, arity) -> Relation
+        self.owners = []           # global id -> Relation
+        self.owner_rows = array('i')
+
+    def __len__(self):
+        return len(self.owner_rows)
+
+    def relation(self, pred_id, arity, create=False):
+        rel = self.relations.get((pred_id, arity))
+        if rel is None and create:
+            rel = self.relations[(pred_id, arity)] = Relation(pred_id, arity)
+        return rel
+
+    def add_ids(self, pred_id, values):
+        """Insert a fact given as ids; returns its global id, or None if already known."""
+        rel = self.relation(pred_id, len(values), create=True)
+        fid = len(self.owner_rows)
+        row = rel.add(values, fid)
+        if row is None:
+            return None
+        self.owners.append(rel)
+        self.owner_rows.append(row)
+        return fid
+
+    def add(self, atom):
+        intern = self.symbols.intern
+        pred, args = atom
+        return self.add_ids(intern(pred), tuple(intern(a) for a in args))
+
+    def encode(self, atom):
+        """(pred id, arg ids) for an atom, or None if it uses an unknown symbol."""
+        get = self.symbols.get
+        pred, args = atom
+        ids = tuple(get(a) for a in args)
+        pred_id = get(pred)
+        if pred_id is None or None in ids:
+            return None
+        return pred_id, ids
+
+    def decode(self, pred_id, values):
+        names = self.symbols.names
+        return (names[pred_id], tuple(names[v] for v in values))
+
+    def fact(self, fid):
+        """The atom with global id `fid`."""
+        rel = self.owners[fid]
+        return self.decode(rel.pred, rel.row(self.owner_rows[fid]))
+
+    def __contains__(self, atom):
+        encoded = self.encode(atom)
+        if encoded is None:
+            return False
+        rel = self.relation(encoded[0], len(encoded[1]))
+        return rel is not None and rel.find(encoded[1]) is not None
+
+    def __iter__(self):
+        for fid in range(len(self.owner_rows)):
+            yield self.fact(fid)
+
+    # -------------------- Bulk loading --------------------
+
+    def load(self, path, pred=None, delimiter=None):
+        """Add every row of a CSV/TSV file; returns how many facts were new.
+
+        Without `pred`, the first column names the predicate and the rest are
+        its arguments; with it, every column is an argument. The delimiter
+        defaults to a tab for .tsv files and a comma otherwise.
+        """
+        if delimiter is None:
+            delimiter = "\t" if path.endswith(".tsv") else ","
+        intern = self.symbols.intern
+        pred_id = None if pred is None else intern(pred)
+        added = 0
+        with open(path, newline="") as f:
+            for fields in csv.reader(f, delimiter=delimiter):
+                if not fields:
+                    continue
+                fields = [field.strip() for field in fields]
+                if pred_id is None:
+                    row_pred, fields = intern(fields[0]), fields[1:]
+                else:
+                    row_pred = pred_id
+                if self.add_ids(row_pred, tuple(intern(a) for a in fields)) is not None:
+                    added += 1
+        return added
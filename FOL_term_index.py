@@ -0,0 +1,187 @@
+"""Discrimination-tree index over the terms of Unification_in_FOL.
+
+A term is stored along the path of its symbols in preorder, with every
+variable collapsed to the wildcard '*':
+
+    f(x, g(A))  ->  f/2  *  g/1  A
+
+Terms sharing a prefix share the path, so a lookup walks the query's
+symbols once through the tree instead of unifying against every stored
+term. A query variable skips one whole stored subterm and a stored
+variable skips one whole query subterm, which gives three retrievals:
+
+  * unifiable(q)       stored terms that may unify with q,
+  * instances(q)       stored terms that may be instances of q,
+  * generalizations(q) stored terms that may generalise q.
+
+Because every variable looks the same in the tree, repeated variables are
+not checked: results are candidates, to be confirmed with unify when a
+variable occurs twice. Insertion and deletion are incremental.
+"""
+
+from Unification_in_FOL import CONST, FUNC, VAR, Term, parse_term, unify
+
+STAR = '*'
+LEAF = None   # key of the {term: values} map in the node where a term ends
+
+def _arity(key):
+    return 0 if key == STAR else key[2]
+
+def preorder_keys(term):
+    """The tree path of a term: its symbols in preorder, variables as STAR."""
+    keys = []
+    stack = [term]
+    while stack:
+        t = stack.pop()
+        if t.kind == VAR:
+            keys.append(STAR)
+        else:
+            keys.append((t.kind, t.name, len(t.args)))
+            stack.extend(reversed(t.args))
+    return keys
+
+def flatten(term):
+    """Preorder keys of a term and, for each position, the index just past its subterm."""
+    keys = preorder_keys(term)
+    ends = [0] * len(keys)
+    done = []   # ends of the subterms completed so far, the leftmost on top
+    for i in range(len(keys) - 1, -1, -1):
+        end = i + 1
+        for _ in range(_arity(keys[i])):
+            end = done.pop()
+        ends[i] = end
+        done.append(end)
+    return keys, ends
+
+def _skip(node):
+    """Nodes reached from `node` by skipping exactly one stored subterm."""
+    stack = [(node, 1)]
+    while stack:
+        node, need = stack.pop()
+        if need == 0:
+            yield node
+            continue
+        for key, child in node.items():
+            if key is not LEAF:
+                stack.append((child, need - 1 + _arity(key)))
+
+class DiscriminationTree:
+    """Term index mapping each stored term to a set of values."""
+
+    def __init__(self):
+        self.root = {}
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, term):
+        node = self.root
+        for key in preorder_keys(term):
+            node = node.get(key)
+            if node is None:
+                return False
+        return term in node.get(LEAF, ())
+
+    def insert(self, term, value=None):
+        node = self.root
+        for key in preorder_keys(term):
+            child = node.get(key)
+            if child is None:
+                child = node[key] = {}
+            node = child
+        values = node.setdefault(LEAF, {}).setdefault(term, set())
+        if value not in values:
+            values.add(value)
+            self.size += 1
+
+    def delete(self, term, value=None):
+        """Remove one (term, value) entry, pruning branches left empty; False if absent."""
+        path = [self.root]
+        keys = preorder_keys(term)
+        for key in keys:
+            node = path[-1].get(key)
+            if node is None:
+                return False
+            path.append(node)
+        entries = path[-1].get(LEAF, {})
+        values = entries.get(term)
+        if values is None or value not in values:
+            return False
+        values.discard(value)
+        self.size -= 1
+        if not values:
+            del entries[term]
+            if not entries:
+                del path[-1][LEAF]
+            for i in range(len(keys) - 1, -1, -1):
+                if path[i + 1]:
+                    break
+                del path[i][keys[i]]
+        return True
+
+    # ----- Retrieval -----
+    def _retrieve(self, query, follow_star, skip_on_var):
+        keys, ends = flatten(query)
+        n = len(keys)
+        stack = [(self.root, 0)]
+        while stack:
+            node, i = stack.pop()
+            if i == n:
+                for term, values in node.get(LEAF, {}).items():
+                    for value in values:
+                        yield term, value
+                continue
+            key = keys[i]
+            if key == STAR and skip_on_var:
+                for after in _skip(node):
+                    stack.append((after, i + 1))
+                continue
+            child = node.get(key)
+            if child is not None:
+                stack.append((child, i + 1))
+            if follow_star and key != STAR:
+                child = node.get(STAR)
+                if child is not None:
+                    stack.append((child, ends[i]))
+
+    def unifiable(self, query):
+        """(term, value) for every stored term that may unify with `query`."""
+        return self._retrieve(query, follow_star=True, skip_on_var=True)
+
+    def instances(self, query):
+        """(term, value) for every stored term that may be an instance of `query`."""
+        return self._retrieve(query, follow_star=False, skip_on_var=True)
+
+    def generalizations(self, query):
+        """(term, value) for every stored term that may generalise `query`."""
+        return self._retrieve(query, follow_star=True, skip_on_var=False)
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    rng = random.Random(0)
+
+    def random_term(depth):
+        r = rng.random()
+        if depth == 0 or r < 0.25:
+            return Term(VAR, rng.choice("xyzw")) if r < 0.1 else Term(CONST, f"C{rng.randrange(50)}")
+        name = rng.choice(["f", "g", "h"])
+        return Term(FUNC, name, tuple(random_term(depth - 1) for _ in range({"f": 1, "g": 2, "h": 3}[name])))
+
+    terms = {random_term(4) for _ in range(100_000)}
+    index = DiscriminationTree()
+    began = time.perf_counter()
+    for t in terms:
+        index.insert(t)
+    print(f"Indexed {len(index)} terms in {time.perf_counter() - began:.2f}s")
+
+    query = parse_term("h(C3, g(x, C7), y)")
+    began = time.perf_counter()
+    found = [t for t, _ in index.unifiable(query) if unify(query, t) is not None]
+    indexed = time.perf_counter() - began
+    began = time.perf_counter()
+    brute = [t for t in terms if unify(query, t) is not None]
+    print(f"Unifiable with {query}: {len(found)} via the index in {indexed * 1000:.1f} ms, "
+          f"{len(brute)} by brute force in {(time.perf_counter() - began) * 1000:.1f} ms")
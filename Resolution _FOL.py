@@ -1,82 +1,758 @@
+import functools
+import heapq
+import itertools
+import re
 
-from collections import deque
-import pandas as pd
+from FOL_term_index import STAR, DiscriminationTree, preorder_keys
+from Unification_in_FOL import CONST, FUNC, VAR, Term, apply_subs, term_to_str, unify
 
 # ---------- Utility Functions ----------
-def neg(lit):
-    """Return negation of literal"""
-    return lit[1:] if lit.startswith('-') else '-' + lit
-
 def clause_to_str(clause):
     """Readable string for a clause"""
     return " ∨ ".join(sorted(clause, key=lambda x: x.strip('-'))) if clause else "{} (empty clause)"
 
-# ---------- Knowledge Base ----------
-# Clauses from grounded example (Anil, peanuts)
-clauses = [
-    frozenset(['Alive_Anil']),                                    # C1
-    frozenset(['-Alive_Anil', 'NotKilled_Anil']),                 # C2
-    frozenset(['Eats_Anil_Peanuts']),                             # C3
-    frozenset(['-Eats_Anil_Peanuts', '-NotKilled_Anil', 'Food_Peanuts']), # C4
-    frozenset(['-Food_Peanuts', 'John_likes_peanuts']),           # C5
-    frozenset(['-John_likes_peanuts'])                            # C6 (negated goal)
-]
-
-# ---------- Resolution Function ----------
-def resolve(ci, cj):
-    resolvents = set()
-    for li in ci:
-        comp = neg(li)
-        if comp in cj:
-            new_clause = set(ci.union(cj))
-            new_clause.discard(li)
-            new_clause.discard(comp)
-            resolvents.add(frozenset(new_clause))
-    return resolvents
-
-# ---------- Resolution Process ----------
-clauses_list = list(clauses)
-clause_indices = {clauses_list[i]: i + 1 for i in range(len(clauses_list))}
-derived_steps = []
-step = 0
-
-print("\n=== INITIAL CLAUSES ===")
-for c in clauses_list:
-    print(f"C{clause_indices[c]}: {clause_to_str(c)}")
-
-print("\n=== STARTING RESOLUTION ===\n")
-new_added = True
-max_steps = 200
-
-while new_added and step < max_steps:
-    new_added = False
-    current = list(clauses_list)
-    for i in range(len(current)):
-        for j in range(i + 1, len(current)):
-            ci, cj = current[i], current[j]
-            resolvents = resolve(ci, cj)
-            for r in resolvents:
-                step += 1
-                # skip tautologies
-                if any(neg(l) in r for l in r):
+def is_tautology(clause):
+    """True if an integer clause holds a literal and its negation."""
+    return any(-l in clause for l in clause if l > 0)
+
+# ---------- Integer Literals ----------
+class Symbols:
+    """Symbol names interned to 1, 2, ...; literal n is the symbol, -n its negation (as in DIMACS)."""
+
+    def __init__(self):
+        self.ids = {}
+        self.names = [None]   # variable 0 is unused, since -0 == 0
+
+    def __len__(self):
+        return len(self.names) - 1
+
+    def encode(self, lit):
+        """'-Alive_Anil' -> -k, interning the symbol on first sight."""
+        negative = lit.startswith('-')
+        name = lit[1:] if negative else lit
+        v = self.ids.get(name)
+        if v is None:
+            v = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return -v if negative else v
+
+    def decode(self, lit):
+        name = self.names[abs(lit)]
+        return '-' + name if lit < 0 else name
+
+    def encode_clause(self, clause):
+        """A clause of string literals as a sorted tuple of ints."""
+        return tuple(sorted({self.encode(l) for l in clause}, key=abs))
+
+    def decode_clause(self, clause):
+        return frozenset(self.decode(l) for l in clause)
+
+# ---------- DIMACS CNF ----------
+def read_dimacs(path):
+    """(number of variables, clauses as sorted int tuples) from a DIMACS CNF file."""
+    num_vars, clauses, current = 0, [], []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line[0] == 'c':
+                continue
+            if line[0] == '%':   # end marker of the SATLIB benchmark files
+                break
+            if line[0] == 'p':
+                num_vars = int(line.split()[2])
+                continue
+            for token in line.split():
+                lit = int(token)
+                if lit:
+                    current.append(lit)
+                else:
+                    clauses.append(tuple(sorted(set(current), key=abs)))
+                    current = []
+    if current:
+        clauses.append(tuple(sorted(set(current), key=abs)))
+    return max(num_vars, max((abs(l) for c in clauses for l in c), default=0)), clauses
+
+def write_dimacs(path, clauses, symbols=None):
+    """Write integer clauses as DIMACS CNF, with a comment naming each variable if `symbols` is given."""
+    num_vars = max((abs(l) for c in clauses for l in c), default=0)
+    if symbols is not None:
+        num_vars = max(num_vars, len(symbols))
+    with open(path, 'w') as f:
+        if symbols is not None:
+            for v in range(1, len(symbols) + 1):
+                f.write(f"c {v} {symbols.names[v]}\n")
+        f.write(f"p cnf {num_vars} {len(clauses)}\n")
+        for clause in clauses:
+            f.write(" ".join(map(str, sorted(clause, key=abs))) + " 0\n")
+
+# ---------- Proof ----------
+class Proof:
+    """Outcome of a resolution run: every kept clause, numbered C1, C2, ... in
+    the order it was kept, with the parents of each derived one. Clauses are
+    frozensets of int literals; `symbols` turns them back into names."""
+
+    def __init__(self, symbols=None):
+        self.symbols = symbols
+        self.clauses = {}     # number -> clause
+        self.parents = {}     # number -> (given clause, partner clause, resolved literal)
+        self.empty = None     # number of the empty clause once derived
+        self.saturated = False
+        self.generated = 0    # resolvents produced, before any deletion
+        self.subsumed = 0     # clauses dropped by forward or backward subsumption
+
+    @property
+    def proved(self):
+        return self.empty is not None
+
+    def literal(self, lit):
+        return self.symbols.decode(lit) if self.symbols is not None else str(lit)
+
+    def clause_str(self, clause):
+        if self.symbols is not None:
+            return clause_to_str(self.symbols.decode_clause(clause))
+        return " ∨ ".join(map(str, sorted(clause, key=abs))) if clause else "{} (empty clause)"
+
+    def steps(self):
+        """(Derived, From, With, ResolvedLiteral, Clause) for each clause the refutation uses."""
+        if self.empty is None:
+            return []
+        needed, stack = set(), [self.empty]
+        while stack:
+            n = stack.pop()
+            if n in self.parents and n not in needed:
+                needed.add(n)
+                stack.extend(p for p in self.parents[n][:2] if p is not None)
+        return [(n, g, partner, self.literal(l), self.clause_str(self.clauses[n]))
+                for n, (g, partner, l) in sorted((n, self.parents[n]) for n in needed)]
+
+    def table(self):
+        """The derivation as a pandas DataFrame (pandas is only imported here)."""
+        import pandas as pd
+        return pd.DataFrame(self.steps(), columns=["Derived", "From", "With", "ResolvedLiteral", "Clause"])
+
+# ---------- Given-Clause Resolution ----------
+def prove(clauses, goal=(), max_clauses=10000, trace=False):
+    """Refute `clauses` plus the negated-goal clauses `goal` by resolution.
+
+    Literals are either strings ('-Alive_Anil') or DIMACS ints (-3); string
+    clauses are interned through Symbols first, so the search itself only
+    negates, hashes and compares small ints.
+
+    Set of support: the KB clauses are never resolved with each other, only
+    with clauses descending from the goal (with no goal, every clause is
+    supported). The shortest supported clause is processed next (unit
+    preference) and resolved only against processed clauses holding a
+    complementary literal, found through a literal index. Tautologies and
+    clauses subsumed by a kept clause are dropped, and a new clause deletes
+    the kept clauses it subsumes. Stops at the empty clause, when nothing is
+    left to process (saturated), or after `max_clauses` kept clauses.
+    """
+    first = next((l for c in (*clauses, *goal) for l in c), None)
+    symbols = Symbols() if isinstance(first, str) else None
+    if symbols is not None:
+        clauses = [symbols.encode_clause(c) for c in clauses]
+        goal = [symbols.encode_clause(c) for c in goal]
+    proof = Proof(symbols)
+    occurs = {}          # literal -> numbers of the kept clauses containing it
+    heads = {}           # literal -> numbers of the kept clauses whose smallest literal it is
+    usable = {}          # literal -> numbers of the processed clauses containing it
+    queue = []           # (length, number) of the supported clauses waiting to be processed
+    live = set()
+
+    def subsumed(clause):
+        # a kept clause inside `clause` has its smallest literal there, so each is tried once
+        for l in clause:
+            for n in heads.get(l, ()):
+                if proof.clauses[n] <= clause:
+                    return True
+        return False
+
+    def keep(clause, supported):
+        # drop every kept clause the new one subsumes
+        if clause:
+            rarest = min(clause, key=lambda l: len(occurs.get(l, ())))
+            victims = [n for n in occurs.get(rarest, ()) if clause <= proof.clauses[n]]
+            for n in victims:
+                live.discard(n)
+                proof.subsumed += 1
+                heads[min(proof.clauses[n])].discard(n)
+                for l in proof.clauses[n]:
+                    occurs[l].discard(n)
+                    usable.get(l, set()).discard(n)
+        n = len(proof.clauses) + 1
+        proof.clauses[n] = clause
+        live.add(n)
+        for l in clause:
+            occurs.setdefault(l, set()).add(n)
+        if clause:
+            heads.setdefault(min(clause), set()).add(n)
+        if supported:
+            heapq.heappush(queue, (len(clause), n))
+        else:
+            for l in clause:
+                usable.setdefault(l, set()).add(n)
+        return n
+
+    for clause in clauses:
+        clause = frozenset(clause)
+        if not is_tautology(clause) and not subsumed(clause):
+            keep(clause, supported=not goal)
+    for clause in goal:
+        clause = frozenset(clause)
+        if not is_tautology(clause) and not subsumed(clause):
+            keep(clause, supported=True)
+    for n, clause in proof.clauses.items():
+        if not clause and n in live:
+            proof.empty = n
+            return proof
+
+    while queue and len(proof.clauses) < max_clauses:
+        _, g = heapq.heappop(queue)
+        if g not in live:
+            continue   # deleted by backward subsumption while waiting
+        given = proof.clauses[g]
+        for l in given:
+            usable.setdefault(l, set()).add(g)
+        for l in sorted(given, key=abs):
+            for partner in sorted(usable.get(-l, ())):
+                if g not in live:
+                    break
+                if partner not in live:
+                    continue   # deleted by backward subsumption earlier in this loop
+                resolvent = (given - {l}) | (proof.clauses[partner] - {-l})
+                proof.generated += 1
+                if is_tautology(resolvent):
+                    continue
+                if subsumed(resolvent):
+                    proof.subsumed += 1
+                    continue
+                n = keep(resolvent, supported=True)
+                proof.parents[n] = (g, partner, l)
+                if trace:
+                    print(f"Step {len(proof.parents)}: Resolve C{g} and C{partner} on '{proof.literal(l)}'")
+                    print(f"    Derived C{n}: {proof.clause_str(resolvent)}\n")
+                if not resolvent:
+                    proof.empty = n
+                    return proof
+    proof.saturated = not queue
+    return proof
+
+# ---------- First-Order Sentences ----------
+SENTENCE_TOKEN = re.compile(r'\s*(<->|->|[~&|(),.]|\w+)')
+
+def parse_sentence(s):
+    """Parse a first-order sentence into nested tuples.
+
+    Atoms are Terms (predicates are read like function applications) and the
+    connectives are ('not', f), ('and', f, g), ('or', f, g), ('implies', f, g),
+    ('iff', f, g), ('forall', var, f) and ('exists', var, f). Binding from
+    loosest to tightest: <->, -> (to the right), |, &, ~. A quantifier reads
+    'forall x y. body' and its body extends as far right as possible.
+    Lowercase names are variables, as in parse_term.
+    """
+    tokens = SENTENCE_TOKEN.findall(s)
+    if ''.join(tokens) != ''.join(s.split()):
+        raise ValueError(f"unexpected character in {s!r}")
+    pos = 0
+
+    def peek():
+        return tokens[pos] if pos < len(tokens) else None
+
+    def take(expected=None):
+        nonlocal pos
+        token = peek()
+        if token is None or (expected is not None and token != expected):
+            raise ValueError(f"expected {expected or 'more input'} at token {pos} of {s!r}")
+        pos += 1
+        return token
+
+    def iff():
+        f = implies()
+        while peek() == '<->':
+            take()
+            f = ('iff', f, implies())
+        return f
+
+    def implies():
+        f = disjunction()
+        if peek() == '->':
+            take()
+            return ('implies', f, implies())
+        return f
+
+    def disjunction():
+        f = conjunction()
+        while peek() == '|':
+            take()
+            f = ('or', f, conjunction())
+        return f
+
+    def conjunction():
+        f = unary()
+        while peek() == '&':
+            take()
+            f = ('and', f, unary())
+        return f
+
+    def unary():
+        token = take()
+        if token == '~':
+            return ('not', unary())
+        if token in ('forall', 'exists'):
+            names = []
+            while peek() != '.':
+                names.append(take())
+            take('.')
+            body = iff()
+            for name in reversed(names):
+                body = (token, name, body)
+            return body
+        if token == '(':
+            f = iff()
+            take(')')
+            return f
+        if not (token[0].isalpha() or token[0] == '_'):
+            raise ValueError(f"unexpected {token!r} in {s!r}")
+        atom = term(token)
+        return atom if atom.kind == FUNC else Term(CONST, token)   # a bare name is a proposition
+
+    def term(name):
+        if peek() != '(':
+            return Term(VAR if name[0].islower() else CONST, name)
+        take('(')
+        args = [term(take())]
+        while peek() == ',':
+            take()
+            args.append(term(take()))
+        take(')')
+        return Term(FUNC, name, tuple(args))
+
+    f = iff()
+    if peek() is not None:
+        raise ValueError(f"unexpected {peek()!r} in {s!r}")
+    return f
+
+def _variables(term):
+    """Names of the variables in a term, in preorder."""
+    names = []
+    stack = [term]
+    while stack:
+        t = stack.pop()
+        if t.ground:
+            continue
+        if t.kind == VAR:
+            names.append(t.name)
+        else:
+            stack.extend(reversed(t.args))
+    return names
+
+def _rename(term, mapping):
+    """Replace variables by name in one pass (unlike apply_subs, replacements are not chased)."""
+    if term.ground or not mapping:
+        return term
+    if term.kind == VAR:
+        return mapping.get(term.name, term)
+    return Term(FUNC, term.name, tuple(_rename(a, mapping) for a in term.args))
+
+def _free_variables(f, bound=frozenset()):
+    if isinstance(f, Term):
+        return {name for name in _variables(f) if name not in bound}
+    if f[0] in ('forall', 'exists'):
+        return _free_variables(f[2], bound | {f[1]})
+    return set().union(*(_free_variables(g, bound) for g in f[1:]))
+
+# ---------- CNF and Skolemization ----------
+_fresh_ids = itertools.count(1)   # shared, so Skolem symbols never clash across sentences
+
+def _nnf(f, positive=True):
+    """Eliminate -> and <-> and push negations down to the atoms."""
+    if isinstance(f, Term):
+        return f if positive else ('not', f)
+    op = f[0]
+    if op == 'not':
+        return _nnf(f[1], not positive)
+    if op == 'implies':
+        return _nnf(('or', ('not', f[1]), f[2]), positive)
+    if op == 'iff':
+        return _nnf(('and', ('implies', f[1], f[2]), ('implies', f[2], f[1])), positive)
+    if op in ('and', 'or'):
+        if not positive:
+            op = 'or' if op == 'and' else 'and'
+        return (op, _nnf(f[1], positive), _nnf(f[2], positive))
+    if op in ('forall', 'exists'):
+        if not positive:
+            op = 'exists' if op == 'forall' else 'forall'
+        return (op, f[1], _nnf(f[2], positive))
+    raise ValueError(f"unknown connective {op!r}")
+
+def _skolemize(f, env, universals):
+    """Drop the quantifiers of an NNF formula: each universal variable gets a fresh
+    name, each existential one a Skolem term over the universals in scope."""
+    if isinstance(f, Term):
+        return (True, _rename(f, env))
+    op = f[0]
+    if op == 'not':
+        return (False, _rename(f[1], env))
+    if op == 'forall':
+        var = Term(VAR, f"{f[1]}'{next(_fresh_ids)}")
+        return _skolemize(f[2], {**env, f[1]: var}, universals + (var,))
+    if op == 'exists':
+        name = f"Sk{next(_fresh_ids)}"
+        skolem = Term(FUNC, name, universals) if universals else Term(CONST, name)
+        return _skolemize(f[2], {**env, f[1]: skolem}, universals)
+    return (op, _skolemize(f[1], env, universals), _skolemize(f[2], env, universals))
+
+def _distribute(f):
+    """Clauses of a quantifier-free NNF formula (| distributed over &)."""
+    if isinstance(f[0], bool):
+        return [frozenset([f])]
+    left, right = _distribute(f[1]), _distribute(f[2])
+    if f[0] == 'and':
+        return left + right
+    return [a | b for a in left for b in right]
+
+def literal_to_str(lit):
+    sign, atom = lit
+    return ('' if sign else '-') + term_to_str(atom)
+
+def fol_clause_to_str(clause):
+    """Readable string for a first-order clause"""
+    if not clause:
+        return "{} (empty clause)"
+    return " ∨ ".join(sorted(map(literal_to_str, clause), key=lambda x: x.lstrip('-')))
+
+def normalize_clause(literals, prefix='x'):
+    """A first-order clause with its variables renamed x1, x2, ... in order of appearance."""
+    ordered = sorted(set(literals), key=literal_to_str)
+    mapping = {}
+    for _, atom in ordered:
+        for name in _variables(atom):
+            if name not in mapping:
+                mapping[name] = Term(VAR, f"{prefix}{len(mapping) + 1}")
+    return frozenset((sign, _rename(atom, mapping)) for sign, atom in ordered)
+
+def is_fol_tautology(clause):
+    return any((not sign, atom) in clause for sign, atom in clause if sign)
+
+def to_cnf(sentence):
+    """Clauses (frozensets of (sign, atom) literals) satisfiable exactly when the sentence is.
+
+    Free variables are read as universally quantified over the whole sentence.
+    """
+    if isinstance(sentence, str):
+        sentence = parse_sentence(sentence)
+    for name in sorted(_free_variables(sentence), reverse=True):
+        sentence = ('forall', name, sentence)
+    clauses = _distribute(_skolemize(_nnf(sentence), {}, ()))
+    return [normalize_clause(c) for c in clauses if not is_fol_tautology(c)]
+
+# ---------- Lifted Resolution ----------
+def match(pattern, term, subs):
+    """Extend `subs` so that pattern instantiated by it is `term`, whose variables
+    stay fixed; returns the new substitution or None."""
+    subs = dict(subs)
+    stack = [(pattern, term)]
+    while stack:
+        p, t = stack.pop()
+        if p.ground:
+            if p is not t:
+                return None
+        elif p.kind == VAR:
+            bound = subs.setdefault(p.name, t)
+            if bound is not t:
+                return None
+        elif t.kind != FUNC or p.name != t.name or len(p.args) != len(t.args):
+            return None
+        else:
+            stack.extend(zip(p.args, t.args))
+    return subs
+
+@functools.lru_cache(maxsize=1 << 16)
+def _matches(pattern, term):
+    # terms are hash-consed, so the same pairs come back across subsumption tests
+    return match(pattern, term, {}) is not None
+
+def subsumes(c, d, max_matches=5000):
+    """True if some instance of clause c is contained in clause d, and c is no longer than d.
+
+    Theta-subsumption is NP-complete (long chains of binary literals are the
+    bad case), so after `max_matches` literal matches the test gives up and
+    answers False: the prover then merely keeps a redundant clause.
+    """
+    if len(c) > len(d):
+        return False
+    budget = max_matches
+    # for each literal of c, the literals of d it matches on its own
+    options = []
+    for sign, atom in c:
+        found = [other for other_sign, other in d if other_sign == sign and _matches(atom, other)]
+        if not found:
+            return False
+        options.append((atom, found))
+
+    def extend(options, subs):
+        nonlocal budget
+        # bind the literal with the fewest matches left under `subs` first
+        best = None
+        for k, (atom, found) in enumerate(options):
+            budget -= len(found)
+            if budget < 0:
+                return False
+            fits = [bound for bound in (match(atom, other, subs) for other in found) if bound is not None]
+            if not fits:
+                return False
+            if best is None or len(fits) < len(best[1]):
+                best = (k, fits)
+                if len(fits) == 1:
+                    break
+        if best is None:
+            return True
+        k, fits = best
+        rest = options[:k] + options[k + 1:]
+        return any(extend(rest, bound) for bound in fits)
+    return extend(options, {})
+
+def _weight(clause):
+    return sum(len(preorder_keys(atom)) for _, atom in clause)
+
+def _head(clause):
+    """The literal a clause is indexed under for subsumption: its most specific one."""
+    return max(clause, key=lambda lit: (sum(key != STAR for key in preorder_keys(lit[1])), literal_to_str(lit)))
+
+class FOLProof(Proof):
+    """Proof whose clauses hold (sign, atom) literals. A clause derived by
+    factoring has no partner: its parents entry is (given, None, literal)."""
+
+    def literal(self, lit):
+        return literal_to_str(lit)
+
+    def clause_str(self, clause):
+        return fol_clause_to_str(clause)
+
+def prove_fol(clauses, goal=(), max_clauses=10000, trace=False):
+    """Refute first-order `clauses` plus the negated-goal clauses `goal`.
+
+    The given-clause loop of prove(), lifted: resolution is binary resolution
+    on most general unifiers, with the partner clause standardised apart
+    (its variables renamed y1, y2, ... against the given clause's x1, x2, ...),
+    and every clause is also factored: given clauses when they are picked,
+    and, with a `goal` (set of support), the others as they are kept.
+    Partners, subsuming and subsumed clauses are looked up through
+    discrimination trees on the atoms, and subsumption is theta-subsumption. Without an empty clause
+    the search may go on forever, so it stops after `max_clauses` kept clauses.
+    """
+    proof = FOLProof()
+    occurs = {True: DiscriminationTree(), False: DiscriminationTree()}   # atoms of the kept clauses
+    heads = {True: DiscriminationTree(), False: DiscriminationTree()}    # the head literal of each kept clause
+    usable = {True: DiscriminationTree(), False: DiscriminationTree()}   # atoms of the processed clauses
+    head_of = {}
+    processed = set()
+    queue = []
+    live = set()
+
+    def subsumed(clause):
+        # a kept clause inside `clause` has its head literal matched there
+        candidates = {n for sign, atom in clause for _, n in heads[sign].generalizations(atom)}
+        # short clauses are the cheapest to test and the likeliest to subsume
+        return any(subsumes(proof.clauses[n], clause)
+                   for n in sorted(candidates, key=lambda n: (len(proof.clauses[n]), n)))
+
+    def delete(n):
+        live.discard(n)
+        proof.subsumed += 1
+        for sign, atom in proof.clauses[n]:
+            occurs[sign].delete(atom, n)
+            if n in processed:
+                usable[sign].delete(atom, n)
+        heads[head_of[n][0]].delete(head_of[n][1], n)
+
+    def keep(clause, supported):
+        if clause:
+            head = _head(clause)
+            victims = {n for _, n in occurs[head[0]].instances(head[1])}
+            for n in sorted(victims):
+                if subsumes(clause, proof.clauses[n]):
+                    delete(n)
+        n = len(proof.clauses) + 1
+        proof.clauses[n] = clause
+        live.add(n)
+        for sign, atom in clause:
+            occurs[sign].insert(atom, n)
+        if clause:
+            head_of[n] = head
+            heads[head[0]].insert(head[1], n)
+        if supported:
+            heapq.heappush(queue, (len(clause), _weight(clause), n))
+        else:
+            process(n)
+        return n
+
+    def process(n):
+        processed.add(n)
+        for sign, atom in proof.clauses[n]:
+            usable[sign].insert(atom, n)
+
+    def factor(g, supported=True):
+        """Derive the factors of clause g; True once one is the empty clause."""
+        given = proof.clauses[g]
+        ordered = sorted(given, key=literal_to_str)
+        for i, lit in enumerate(ordered):
+            for other in ordered[i + 1:]:
+                if other[0] == lit[0] and g in live:
+                    subs = unify(lit[1], other[1])
+                    if subs is not None and derive({(s, apply_subs(a, subs)) for s, a in given},
+                                                   g, None, lit, supported):
+                        return True
+        return False
+
+    def derive(clause, g, partner, lit, supported=True):
+        """Keep a new clause unless redundant; True once it is the empty clause."""
+        clause = normalize_clause(clause)
+        proof.generated += 1
+        if is_fol_tautology(clause):
+            return False
+        if subsumed(clause):
+            proof.subsumed += 1
+            return False
+        n = keep(clause, supported)
+        proof.parents[n] = (g, partner, lit)
+        if trace:
+            if partner is None:
+                print(f"Step {len(proof.parents)}: Factor C{g} on '{literal_to_str(lit)}'")
+            else:
+                print(f"Step {len(proof.parents)}: Resolve C{g} and C{partner} on '{literal_to_str(lit)}'")
+            print(f"    Derived C{n}: {proof.clause_str(clause)}\n")
+        if not clause:
+            proof.empty = n
+            return True
+        if not supported:
+            factor(n, supported=False)
+        return False
+
+    for clause in clauses:
+        clause = normalize_clause(clause)
+        if not is_fol_tautology(clause) and not subsumed(clause):
+            n = keep(clause, supported=not goal)
+            if goal:
+                factor(n, supported=False)   # never given, so factored now
+    for clause in goal:
+        clause = normalize_clause(clause)
+        if not is_fol_tautology(clause) and not subsumed(clause):
+            keep(clause, supported=True)
+    for n, clause in proof.clauses.items():
+        if not clause and n in live:
+            proof.empty = n
+            return proof
+
+    while queue and len(proof.clauses) < max_clauses:
+        g = heapq.heappop(queue)[2]
+        if g not in live:
+            continue   # deleted by backward subsumption while waiting
+        if factor(g):
+            return proof
+        given = proof.clauses[g]
+        process(g)
+        for lit in sorted(given, key=literal_to_str):
+            sign, atom = lit
+            for partner in sorted({n for _, n in usable[not sign].unifiable(atom)}):
+                if g not in live:
+                    break
+                if partner not in live:
                     continue
-                if r not in clause_indices:
-                    clauses_list.append(r)
-                    clause_indices[r] = len(clause_indices) + 1
-                    resolved_lit = next((l for l in ci if neg(l) in cj), "?")
-                    derived_steps.append((clause_indices[r], clause_indices[ci], clause_indices[cj], resolved_lit, clause_to_str(r)))
-                    print(f"Step {step}: Resolve C{clause_indices[ci]} and C{clause_indices[cj]} on '{resolved_lit}'")
-                    print(f"    Derived C{clause_indices[r]}: {clause_to_str(r)}\n")
-                    new_added = True
-                    # check for contradiction
-                    if len(r) == 0:
-                        print(">>> Empty clause {} derived. CONTRADICTION reached!")
-                        print(">>> Therefore, the KB entails the query: John_likes_peanuts ✅\n")
-                        # create proof table
-                        df = pd.DataFrame(derived_steps, columns=["Derived", "From", "With", "ResolvedLiteral", "Clause"])
-                        print("=== DERIVATION TABLE ===")
-                        print(df.to_string(index=False))
-                        exit()
-
-print("Resolution finished without deriving the empty clause (no proof found).")
+                names = {name for _, a in proof.clauses[partner] for name in _variables(a)}
+                apart = {name: Term(VAR, 'y' + name[1:]) for name in names}
+                renamed = [(s, _rename(a, apart)) for s, a in proof.clauses[partner]]
+                for comp in renamed:
+                    if comp[0] == sign:
+                        continue
+                    subs = unify(atom, comp[1])
+                    if subs is None:
+                        continue
+                    resolvent = {(s, apply_subs(a, subs)) for s, a in given if (s, a) != lit}
+                    resolvent.update((s, apply_subs(a, subs)) for s, a in renamed if (s, a) != comp)
+                    if derive(resolvent, g, partner, lit):
+                        return proof
+    proof.saturated = not queue
+    return proof
+
+def entails_fol(kb, query, max_clauses=10000, trace=False):
+    """Refute the sentences of `kb` together with the negated `query` sentence.
+
+    Free variables in the query are read existentially, so 'Likes(John, x)'
+    asks whether John likes something.
+    """
+    clauses = [c for sentence in kb for c in to_cnf(sentence)]
+    if isinstance(query, str):
+        query = parse_sentence(query)
+    # to_cnf quantifies the free variables outside the negation: forall x ~Q(x) == ~exists x Q(x)
+    return prove_fol(clauses, to_cnf(('not', query)), max_clauses, trace)
+
+# ---------- Knowledge Base ----------
+if __name__ == "__main__":
+    # Clauses from grounded example (Anil, peanuts)
+    clauses = [
+        frozenset(['Alive_Anil']),                                    # C1
+        frozenset(['-Alive_Anil', 'NotKilled_Anil']),                 # C2
+        frozenset(['Eats_Anil_Peanuts']),                             # C3
+        frozenset(['-Eats_Anil_Peanuts', '-NotKilled_Anil', 'Food_Peanuts']), # C4
+        frozenset(['-Food_Peanuts', 'John_likes_peanuts']),           # C5
+    ]
+    goal = [frozenset(['-John_likes_peanuts'])]                       # C6 (negated goal)
+
+    print("\n=== INITIAL CLAUSES ===")
+    for i, c in enumerate(clauses + goal, 1):
+        print(f"C{i}: {clause_to_str(c)}")
+
+    print("\n=== STARTING RESOLUTION ===\n")
+    proof = prove(clauses, goal, trace=True)
+
+    if proof.proved:
+        print(">>> Empty clause {} derived. CONTRADICTION reached!")
+        print(">>> Therefore, the KB entails the query: John_likes_peanuts ✅\n")
+        print("=== DERIVATION TABLE ===")
+        print(proof.table().to_string(index=False))
+    else:
+        print("Resolution finished without deriving the empty clause (no proof found).")
+
+    # the same problem through a DIMACS file, solved on the integer literals directly
+    import os
+    import tempfile
+    symbols = Symbols()
+    cnf = [symbols.encode_clause(c) for c in clauses + goal]
+    path = os.path.join(tempfile.mkdtemp(), "peanuts.cnf")
+    write_dimacs(path, cnf, symbols)
+    num_vars, loaded = read_dimacs(path)
+    print(f"\n=== DIMACS ROUND TRIP ===\n{open(path).read()}")
+    print(f"Read back {len(loaded)} clauses over {num_vars} variables; "
+          f"refuted: {prove(loaded[:-1], loaded[-1:]).proved}")
+
+    print("\n=== LIFTED FIRST-ORDER RESOLUTION ===\n")
+    kb = [
+        "forall x. Food(x) -> Likes(John, x)",
+        "Food(Apple) & Food(Vegetables)",
+        "forall x y. Eats(x, y) & ~Killed(x) -> Food(y)",
+        "Eats(Anil, Peanuts) & Alive(Anil)",
+        "forall x. Eats(Anil, x) -> Eats(Harry, x)",
+        "forall x. ~Killed(x) -> Alive(x)",
+        "forall x. Alive(x) -> ~Killed(x)",
+    ]
+    for sentence in kb:
+        print(f"{sentence}\n    CNF: {' ; '.join(fol_clause_to_str(c) for c in to_cnf(sentence))}")
+    print()
+    proof = entails_fol(kb, "Likes(John, Peanuts)", trace=True)
+    print(f">>> KB entails Likes(John, Peanuts): {proof.proved}\n")
+    print("=== DERIVATION TABLE ===")
+    print(proof.table().to_string(index=False))
+
+    # existentials become Skolem terms: everybody loves somebody, so Anil loves somebody
+    sentence = "forall x. exists y. Loves(x, y)"
+    print(f"\n{sentence}\n    CNF: {' ; '.join(fol_clause_to_str(c) for c in to_cnf(sentence))}")
+    proof = entails_fol([sentence], "exists y. Loves(Anil, y)")
+    print(f">>> Entails 'exists y. Loves(Anil, y)': {proof.proved} "
+          f"({proof.generated} resolvents, {len(proof.clauses)} clauses kept)")
 
+    # only a factor of the first KB clause, P(u), resolves the query: KB clauses need factoring too
+    kb = ["forall u v. P(u) | P(v)", "forall u. P(u) -> Q(u, B)"]
+    proof = entails_fol(kb, "P(B) & Q(A, B)")
+    assert proof.proved and not proof.saturated
+    print(f">>> {' ; '.join(kb)} entails 'P(B) & Q(A, B)': {proof.proved}")
@@ -3,138 +3,224 @@
 # ---------------------------------------------------------------
 
 import re
+import weakref
+
+# ---------- Terms ----------
+
+VAR, CONST, FUNC = 'var', 'const', 'func'
+
+class Term:
+    """Immutable, hash-consed term: a variable, a constant or a function application.
+
+    Building a term that already exists returns the existing object, so
+    equal terms are identical, == and hashing are identity-based, and shared
+    subterms are stored once. `ground` is computed once at construction.
+    """
+    __slots__ = ('kind', 'name', 'args', 'ground', '__weakref__')
+    _table = weakref.WeakValueDictionary()
+
+    def __new__(cls, kind, name, args=()):
+        key = (kind, name, args)
+        term = cls._table.get(key)
+        if term is None:
+            term = object.__new__(cls)
+            term.kind, term.name, term.args = kind, name, args
+            term.ground = kind == CONST or (kind == FUNC and all(a.ground for a in args))
+            cls._table[key] = term
+        return term
+
+    def __reduce__(self):
+        return (Term, (self.kind, self.name, self.args))
+
+    def __repr__(self):
+        return term_to_str(self)
 
 # ---------- Helper functions ----------
 
-def split_args(s):
-    """Split comma-separated arguments considering nested parentheses."""
-    args, cur, depth = [], '', 0
-    for ch in s:
-        if ch == '(':
-            depth += 1
-        elif ch == ')':
-            depth -= 1
-        if ch == ',' and depth == 0:
-            args.append(cur.strip())
-            cur = ''
-        else:
-            cur += ch
-    if cur.strip():
-        args.append(cur.strip())
-    return args
+TOKEN = re.compile(r'\s*([^\s(),]+|[(),])')
 
 def parse_term(s):
-    """Parse a term like f(x,g(y)) or X."""
-    s = s.strip()
-    if '(' not in s:
-        if s[0].islower():   # variable if starts lowercase
-            return ('var', s)
-        else:                # constant if uppercase
-            return ('const', s)
-    name, inside = s.split('(', 1)
-    args = split_args(inside[:-1])
-    return ('func', name.strip(), tuple(parse_term(a) for a in args))
+    """Parse a term like f(x,g(y)) or X (lowercase names are variables)."""
+    stack = [[]]     # argument lists of the applications being read
+    names = []
+    pending = None   # name just read, not yet known to be a function
+    for token in TOKEN.findall(s):
+        if token == '(':
+            names.append(pending)
+            stack.append([])
+            pending = None
+            continue
+        if pending is not None:
+            stack[-1].append(Term(VAR if pending[0].islower() else CONST, pending))
+            pending = None
+        if token == ')':
+            args = tuple(stack.pop())
+            stack[-1].append(Term(FUNC, names.pop(), args))
+        elif token != ',':
+            pending = token
+    if pending is not None:
+        stack[-1].append(Term(VAR if pending[0].islower() else CONST, pending))
+    if len(stack) != 1 or len(stack[0]) != 1:
+        raise ValueError(f"malformed term: {s!r}")
+    return stack[0][0]
 
 def term_to_str(t):
-    """Convert parsed term back to string."""
-    if t[0] == 'var':
-        return t[1]
-    if t[0] == 'const':
-        return t[1]
-    return f"{t[1]}({', '.join(term_to_str(a) for a in t[2])})"
+    """Convert a term back to string."""
+    out = []
+    stack = [t]
+    while stack:
+        t = stack.pop()
+        if isinstance(t, str):
+            out.append(t)
+        elif t.kind != FUNC:
+            out.append(t.name)
+        else:
+            out.append(f"{t.name}(")
+            stack.append(")")
+            for i in range(len(t.args) - 1, -1, -1):
+                stack.append(t.args[i])
+                if i:
+                    stack.append(", ")
+    return ''.join(out)
+
+def walk(term, subs):
+    """Dereference a variable through a triangular substitution, compressing the chain."""
+    if term.kind != VAR or term.name not in subs:
+        return term
+    chain = []
+    while term.kind == VAR and term.name in subs:
+        chain.append(term.name)
+        term = subs[term.name]
+    for name in chain[:-1]:
+        subs[name] = term
+    return term
 
 def apply_subs(term, subs):
-    """Apply substitutions recursively."""
-    if term[0] == 'var':
-        if term[1] in subs:
-            return apply_subs(subs[term[1]], subs)
+    """Apply a (triangular) substitution all the way down."""
+    if term.ground or not subs:
         return term
-    elif term[0] == 'func':
-        return ('func', term[1], tuple(apply_subs(a, subs) for a in term[2]))
-    return term
+    done = {}
+    stack = [term]
+    while stack:
+        t = stack[-1]
+        if t in done:
+            stack.pop()
+        elif t.ground:
+            done[t] = t
+            stack.pop()
+        elif t.kind == VAR:
+            bound = subs.get(t.name)
+            if bound is None:
+                done[t] = t
+                stack.pop()
+            elif bound in done:
+                done[t] = done[bound]
+                stack.pop()
+            else:
+                stack.append(bound)
+        else:
+            missing = [a for a in t.args if a not in done]
+            if missing:
+                stack.extend(missing)
+            else:
+                done[t] = Term(FUNC, t.name, tuple(done[a] for a in t.args))
+                stack.pop()
+    return done[term]
 
 def occurs_check(var, term, subs):
     """Prevent infinite loops like x = f(x)."""
-    term = apply_subs(term, subs)
-    if term[0] == 'var':
-        return term[1] == var
-    elif term[0] == 'func':
-        return any(occurs_check(var, a, subs) for a in term[2])
+    seen = set()
+    stack = [term]
+    while stack:
+        t = walk(stack.pop(), subs)
+        if t.ground or t in seen:
+            continue
+        if t.kind == VAR:
+            if t.name == var:
+                return True
+        else:
+            seen.add(t)
+            stack.extend(t.args)
     return False
 
 # ---------- Core Unification Algorithm ----------
 
 def unify(t1, t2, subs=None, trace=None):
+    """Most general unifier of t1 and t2, extending `subs` in place; None if there is none.
+
+    The substitution is triangular: a binding may mention variables that are
+    bound themselves (read it with apply_subs). Pairs are taken from an
+    explicit worklist, so deep terms do not recurse. Pass a list as `trace`
+    to have the steps appended to it.
+    """
     if subs is None:
         subs = {}
-    if trace is None:
-        trace = []
-
-    t1 = apply_subs(t1, subs)
-    t2 = apply_subs(t2, subs)
-
-    trace.append(f"Trying to unify {term_to_str(t1)} with {term_to_str(t2)}")
-
-    # identical
-    if t1 == t2:
-        trace.append(" → Terms identical. No substitution needed.")
-        return subs, trace
-
-    # variable case
-    if t1[0] == 'var':
-        return unify_var(t1[1], t2, subs, trace)
-    if t2[0] == 'var':
-        return unify_var(t2[1], t1, subs, trace)
-
-    # constant conflict
-    if t1[0] == 'const' and t2[0] == 'const':
-        trace.append(f" ✗ Conflict: constants {t1[1]} and {t2[1]} do not match.")
-        return None, trace
-
-    # function or predicate
-    if t1[0] == 'func' and t2[0] == 'func':
-        if t1[1] != t2[1] or len(t1[2]) != len(t2[2]):
-            trace.append(" ✗ Function name or arity mismatch.")
-            return None, trace
-        for a1, a2 in zip(t1[2], t2[2]):
-            subs, trace = unify(a1, a2, subs, trace)
-            if subs is None:
-                return None, trace
-        return subs, trace
-
-    trace.append(" ✗ Cannot unify terms.")
-    return None, trace
-
-def unify_var(var, term, subs, trace):
-    if var in subs:
-        trace.append(f" {var} already substituted by {term_to_str(subs[var])}. Continuing...")
-        return unify(subs[var], term, subs, trace)
-    if occurs_check(var, term, subs):
-        trace.append(f" ✗ Occurs check failed: {var} appears in {term_to_str(term)}")
-        return None, trace
-    subs[var] = term
-    trace.append(f" ✓ Substitute {var} → {term_to_str(term)}")
-    return subs, trace
+    stack = [(t1, t2)]
+    while stack:
+        a, b = stack.pop()
+        a, b = walk(a, subs), walk(b, subs)
+        if trace is not None:
+            trace.append(f"Trying to unify {term_to_str(a)} with {term_to_str(b)}")
+        if a is b:
+            if trace is not None:
+                trace.append(" → Terms identical. No substitution needed.")
+            continue
+        if a.kind != VAR and b.kind == VAR:
+            a, b = b, a
+        if a.kind == VAR:
+            if not b.ground and occurs_check(a.name, b, subs):
+                if trace is not None:
+                    trace.append(f" ✗ Occurs check failed: {a.name} appears in {term_to_str(apply_subs(b, subs))}")
+                return None
+            subs[a.name] = b
+            if trace is not None:
+                trace.append(f" ✓ Substitute {a.name} → {term_to_str(b)}")
+        elif a.kind == FUNC and b.kind == FUNC:
+            if a.name != b.name or len(a.args) != len(b.args):
+                if trace is not None:
+                    trace.append(" ✗ Function name or arity mismatch.")
+                return None
+            stack.extend(zip(reversed(a.args), reversed(b.args)))
+        else:
+            if trace is not None:
+                if a.kind == CONST and b.kind == CONST:
+                    trace.append(f" ✗ Conflict: constants {a.name} and {b.name} do not match.")
+                else:
+                    trace.append(" ✗ Cannot unify terms.")
+            return None
+    return subs
 
 # ---------- Example Execution ----------
 
-examples = [
-    ("Eats(x, Apple)", "Eats(Riya, y)"),
-    ("Knows(John, x)", "Knows(x, Elisabeth)"),
-    ("likes(John, z)", "likes(x, f(y))"),
-    ("f(x)", "f(g(x))")
-]
-
-for s1, s2 in examples:
-    print("="*70)
-    print(f"Unifying: {s1}  AND  {s2}\n")
-    t1, t2 = parse_term(s1), parse_term(s2)
-    subs, trace = unify(t1, t2)
-    for step in trace:
-        print("  " + step)
-    if subs:
-        result = {k: term_to_str(v) for k,v in subs.items()}
-        print("\n✅ Final Substitutions:", result)
-    else:
-        print("\n❌ Unification failed.")
-    print("="*70 + "\n")
+if __name__ == "__main__":
+    examples = [
+        ("Eats(x, Apple)", "Eats(Riya, y)"),
+        ("Knows(John, x)", "Knows(x, Elisabeth)"),
+        ("likes(John, z)", "likes(x, f(y))"),
+        ("f(x)", "f(g(x))")
+    ]
+
+    for s1, s2 in examples:
+        print("="*70)
+        print(f"Unifying: {s1}  AND  {s2}\n")
+        t1, t2 = parse_term(s1), parse_term(s2)
+        trace = []
+        subs = unify(t1, t2, trace=trace)
+        for step in trace:
+            print("  " + step)
+        if subs:
+            result = {k: term_to_str(apply_subs(v, subs)) for k,v in subs.items()}
+            print("\n✅ Final Substitutions:", result)
+        else:
+            print("\n❌ Unification failed.")
+        print("="*70 + "\n")
+
+    # deep terms: no recursion, and shared subterms are built once
+    import time
+    depth = 100_000
+    began = time.perf_counter()
+    t1 = parse_term("f(" * depth + "x" + ")" * depth)
+    t2 = parse_term("f(" * depth + "g(y)" + ")" * depth)
+    subs = unify(t1, t2)
+    print(f"Unified two terms nested {depth} deep in {time.perf_counter() - began:.2f}s:",
+          {k: term_to_str(v) for k, v in subs.items()})
@@ -1,47 +1,100 @@
 import math
 
+from game_search import AlphaBetaSearch, Game
+
 # Alpha-Beta Pruning function
-def alpha_beta(depth, node_index, maximizing_player, values, alpha, beta, max_depth, path):
+def alpha_beta(depth, node_index, maximizing_player, values, alpha, beta, max_depth, trace=False):
     indent = "  " * depth  # for clear step indentation
     if depth == max_depth:
-        print(f"{indent}Reached leaf node {values[node_index]} (Depth {depth})")
+        if trace:
+            print(f"{indent}Reached leaf node {values[node_index]} (Depth {depth})")
         return values[node_index]
 
     if maximizing_player:
-        print(f"{indent}MAX node at depth {depth}, alpha={alpha}, beta={beta}")
+        if trace:
+            print(f"{indent}MAX node at depth {depth}, alpha={alpha}, beta={beta}")
         max_eval = -math.inf
         for i in range(2):  # assuming binary tree
             value = alpha_beta(depth + 1, node_index * 2 + i, False,
-                               values, alpha, beta, max_depth, path)
-            print(f"{indent}MAX node considers child {node_index * 2 + i} → value={value}")
+                               values, alpha, beta, max_depth, trace)
+            if trace:
+                print(f"{indent}MAX node considers child {node_index * 2 + i} → value={value}")
             max_eval = max(max_eval, value)
             alpha = max(alpha, max_eval)
             if beta <= alpha:
-                print(f"{indent}Pruned remaining branches at MAX node (alpha={alpha}, beta={beta})")
+                if trace:
+                    print(f"{indent}Pruned remaining branches at MAX node (alpha={alpha}, beta={beta})")
                 break  # beta cut-off
         return max_eval
 
     else:
-        print(f"{indent}MIN node at depth {depth}, alpha={alpha}, beta={beta}")
+        if trace:
+            print(f"{indent}MIN node at depth {depth}, alpha={alpha}, beta={beta}")
         min_eval = math.inf
         for i in range(2):
             value = alpha_beta(depth + 1, node_index * 2 + i, True,
-                               values, alpha, beta, max_depth, path)
-            print(f"{indent}MIN node considers child {node_index * 2 + i} → value={value}")
+                               values, alpha, beta, max_depth, trace)
+            if trace:
+                print(f"{indent}MIN node considers child {node_index * 2 + i} → value={value}")
             min_eval = min(min_eval, value)
             beta = min(beta, min_eval)
             if beta <= alpha:
-                print(f"{indent}Pruned remaining branches at MIN node (alpha={alpha}, beta={beta})")
+                if trace:
+                    print(f"{indent}Pruned remaining branches at MIN node (alpha={alpha}, beta={beta})")
                 break  # alpha cut-off
         return min_eval
 
 
-# Example game tree leaf values
-values = [3, 5, 6, 9, 1, 2, 0, -1]
-max_depth = 3
+# The same binary game tree behind the generic engine's Game interface
+class TreeGame(Game):
+    """Complete binary tree with leaf `values`; MAX moves at even depths."""
+    def __init__(self, values, max_depth):
+        self.values = values
+        self.max_depth = max_depth
+        self.path = []  # children chosen from the root
+
+    def node_index(self):
+        index = 0
+        for i in self.path:
+            index = index * 2 + i
+        return index
+
+    def moves(self):
+        return [0, 1]
+
+    def apply(self, move):
+        self.path.append(move)
+
+    def undo(self, move):
+        self.path.pop()
+
+    def is_terminal(self):
+        return len(self.path) == self.max_depth
+
+    def evaluate(self):
+        # negamax: score for the player to move (MAX when the depth is even)
+        value = self.values[self.node_index()]
+        return value if len(self.path) % 2 == 0 else -value
+
+    def key(self):
+        return (1 << len(self.path)) + self.node_index()
+
+
+if __name__ == "__main__":
+    # Example game tree leaf values
+    values = [3, 5, 6, 9, 1, 2, 0, -1]
+    max_depth = 3
+
+    print("===== Alpha-Beta Pruning Trace =====\n")
+    best_value = alpha_beta(0, 0, True, values, -math.inf, math.inf, max_depth, trace=True)
+    print("\n===== Final Result =====")
+    print(f"Value of the root node (Optimal value): {best_value}")
+    print("===================================")
 
-print("===== Alpha-Beta Pruning Trace =====\n")
-best_value = alpha_beta(0, 0, True, values, -math.inf, math.inf, max_depth, [])
-print("\n===== Final Result =====")
-print(f"Value of the root node (Optimal value): {best_value}")
-print("===================================")
+    engine = AlphaBetaSearch(TreeGame(values, max_depth))
+    move, value, depth = engine.search(max_depth)
+    stats = engine.stats()
+    print("\n===== Generic Engine (iterative deepening + PVS + TT) =====")
+    print(f"Best move from the root: {'left' if move == 0 else 'right'} child, value={value}")
+    print(f"Nodes searched: {stats['nodes']}, cutoffs: {stats['cutoffs']}, "
+          f"cutoff ratio: {stats['cutoff_ratio']:.2f}")
@@ -0,0 +1,156 @@
+"""Bidirectional search for the 8-puzzle over packed boards (see A_star.py).
+
+Both modes grow one frontier from the start and one from the goal and keep
+every reached state in a single hash index keyed by the packed board, so a
+meeting is detected with one dict lookup. The path is stitched from the two
+sets of parent pointers. For a d-move instance this expands roughly
+2*b**(d/2) nodes instead of b**d.
+"""
+
+import heapq
+import itertools
+import math
+
+from A_star import (BLANK_SHIFT, goal_distance_table, move_table, pack_state,
+                    packed_manhattan, print_state, unpack_state)
+from n_puzzle import is_solvable
+
+FORWARD, BACKWARD = 0, 1
+
+def stitch(index, meet):
+    """Join the start->meet and meet->goal parent chains into one list of boards."""
+    path = []
+    code = meet
+    while code is not None:
+        path.append(code)
+        code = index[code][1]
+    path.reverse()
+    code = index[meet][3]
+    while code is not None:
+        path.append(code)
+        code = index[code][3]
+    return [unpack_state(code) for code in path]
+
+# ----- Bidirectional BFS -----
+def bidirectional_bfs(start_state, goal_state, stats=None):
+    """Breadth-first from both ends, always growing the smaller frontier by one full layer."""
+    if not is_solvable(start_state, goal_state):
+        return None
+    start, goal = pack_state(start_state), pack_state(goal_state)
+    # Shared index: state -> [forward g, forward parent, backward g, backward parent]
+    index = {start: [0, None, None, None]}
+    if goal in index:
+        index[goal][2] = 0
+    else:
+        index[goal] = [None, None, 0, None]
+    frontiers = {FORWARD: [start], BACKWARD: [goal]}
+    expanded = 0
+    best, meet = (0, start) if start == goal else (math.inf, None)
+
+    while meet is None and frontiers[FORWARD] and frontiers[BACKWARD]:
+        side = FORWARD if len(frontiers[FORWARD]) <= len(frontiers[BACKWARD]) else BACKWARD
+        g_slot, p_slot = (0, 1) if side == FORWARD else (2, 3)
+        other = 2 if side == FORWARD else 0
+        layer = []
+        for code in frontiers[side]:
+            expanded += 1
+            g_new = index[code][g_slot] + 1
+            for cell, cell_shift, blank_shift, blank_delta in move_table[code >> BLANK_SHIFT]:
+                tile = (code >> cell_shift) & 0xF
+                child = code + (tile << blank_shift) - (tile << cell_shift) + blank_delta
+                entry = index.get(child)
+                if entry is None:
+                    entry = index[child] = [None, None, None, None]
+                if entry[g_slot] is not None:
+                    continue
+                entry[g_slot], entry[p_slot] = g_new, code
+                layer.append(child)
+                if entry[other] is not None and g_new + entry[other] < best:
+                    # finish the layer so the cheapest meeting in it is kept
+                    best, meet = g_new + entry[other], child
+        frontiers[side] = layer
+
+    if stats is not None:
+        stats["expanded"] = expanded
+    return stitch(index, meet) if meet is not None else None
+
+# ----- Bidirectional (front-to-end) A* -----
+def bidirectional_a_star(start_state, goal_state, stats=None):
+    """A* from both ends, each side guided by Manhattan distance to the opposite end.
+
+    Stops once the cheapest meeting found, mu, is no larger than the best f
+    on either open list, which is optimal for consistent heuristics.
+    """
+    if not is_solvable(start_state, goal_state):
+        return None
+    start, goal = pack_state(start_state), pack_state(goal_state)
+    tables = {FORWARD: goal_distance_table(goal), BACKWARD: goal_distance_table(start)}
+    index = {start: [0, None, None, None]}
+    if goal in index:
+        index[goal][2] = 0
+    else:
+        index[goal] = [None, None, 0, None]
+    tie = itertools.count()
+    h_start = packed_manhattan(start, tables[FORWARD])
+    h_goal = packed_manhattan(goal, tables[BACKWARD])
+    open_sets = {FORWARD: [(h_start, next(tie), start, 0, h_start)],
+                 BACKWARD: [(h_goal, next(tie), goal, 0, h_goal)]}
+    expanded = 0
+    best, meet = (0, start) if start == goal else (math.inf, None)
+
+    while open_sets[FORWARD] and open_sets[BACKWARD]:
+        if max(open_sets[FORWARD][0][0], open_sets[BACKWARD][0][0]) >= best:
+            break
+        side = FORWARD if len(open_sets[FORWARD]) <= len(open_sets[BACKWARD]) else BACKWARD
+        g_slot, p_slot = (0, 1) if side == FORWARD else (2, 3)
+        other = 2 if side == FORWARD else 0
+        table = tables[side]
+        open_set = open_sets[side]
+
+        f, _, code, g, h = heapq.heappop(open_set)
+        if g > index[code][g_slot]:
+            continue  # stale entry
+        expanded += 1
+        blank = code >> BLANK_SHIFT
+        g_new = g + 1
+        for cell, cell_shift, blank_shift, blank_delta in move_table[blank]:
+            tile = (code >> cell_shift) & 0xF
+            child = code + (tile << blank_shift) - (tile << cell_shift) + blank_delta
+            entry = index.get(child)
+            if entry is None:
+                entry = index[child] = [None, None, None, None]
+            if entry[g_slot] is not None and entry[g_slot] <= g_new:
+                continue
+            entry[g_slot], entry[p_slot] = g_new, code
+            h_new = h + table[tile][blank] - table[tile][cell]
+            heapq.heappush(open_set, (g_new + h_new, next(tie), child, g_new, h_new))
+            if entry[other] is not None and g_new + entry[other] < best:
+                best, meet = g_new + entry[other], child
+
+    if stats is not None:
+        stats["expanded"] = expanded
+    return stitch(index, meet) if meet is not None else None
+
+def input_state(prompt):
+    print(prompt)
+    state = []
+    for _ in range(3):
+        row = input("Enter 3 numbers separated by spaces (use 0 for blank): ").split()
+        state.append(list(map(int, row)))
+    return state
+
+if __name__ == "__main__":
+    start = input_state("Enter START state:")
+    goal = input_state("Enter GOAL state:")
+
+    for name, search in (("bidirectional BFS", bidirectional_bfs),
+                         ("bidirectional A*", bidirectional_a_star)):
+        stats = {}
+        solution = search(start, goal, stats=stats)
+        if solution is None:
+            print(f"\n{name}: no solution (the goal is unreachable from this start).")
+            continue
+        print(f"\n{name}: {len(solution) - 1} moves, {stats['expanded']} nodes expanded\n")
+        for step, board in enumerate(solution):
+            print(f"Step {step}:")
+            print_state(board)
@@ -0,0 +1,253 @@
+"""Game-agnostic alpha-beta search.
+
+Any two-player, zero-sum, perfect-information game can be searched by
+implementing the small `Game` interface below. The engine adds iterative
+deepening, a Zobrist-hashed transposition table with exact/lower/upper
+bounds, killer and history move ordering and principal-variation search,
+and counts nodes and cutoffs so pruning efficiency can be measured.
+"""
+
+import math
+import random
+import time
+
+EXACT, LOWER, UPPER = 0, 1, 2
+CHECK_PERIOD = 0.002  # seconds between clock checks while a deadline is set
+
+# ----- Game Interface -----
+class Game:
+    """Interface the engine searches through (negamax convention).
+
+    `evaluate` scores the position for the player to move, so it should
+    return integers, and a win for the side to move is positive. Moves must
+    be hashable. `key` should be a Zobrist hash kept up to date by
+    `apply`/`undo` (see `Zobrist`).
+    """
+
+    def moves(self):
+        raise NotImplementedError
+
+    def apply(self, move):
+        raise NotImplementedError
+
+    def undo(self, move):
+        raise NotImplementedError
+
+    def playout_moves(self):
+        """Legal moves in any order, for random playouts; override with
+        something cheaper than `moves` when its ordering is costly."""
+        return self.moves()
+
+    def is_terminal(self):
+        raise NotImplementedError
+
+    def evaluate(self):
+        raise NotImplementedError
+
+    def key(self):
+        raise NotImplementedError
+
+class Zobrist:
+    """Random 64-bit keys per position feature, e.g. (cell, player), created on first use.
+
+    A key depends only on the seed and the feature's repr, not on the order
+    features are first seen, so copies of a game (e.g. pickled to worker
+    processes) agree on every key and can share a transposition table.
+    """
+
+    def __init__(self, seed=0):
+        self.seed = seed
+        self.keys = {}
+
+    def __getitem__(self, feature):
+        key = self.keys.get(feature)
+        if key is None:
+            key = self.keys[feature] = random.Random(f"{self.seed}:{feature!r}").getrandbits(64)
+        return key
+
+class SearchTimeout(Exception):
+    pass
+
+# ----- Search Engine -----
+class AlphaBetaSearch:
+    """Iterative-deepening principal-variation search over a `Game`.
+
+    `tt_size` bounds the transposition table (oldest entries are dropped
+    first). With trace=True every node is printed; with tracing off the
+    search never builds a trace string.
+    """
+
+    def __init__(self, game, tt_size=1 << 20, trace=False):
+        self.game = game
+        self.tt_size = tt_size
+        self.trace = trace
+        self.table = {}      # key -> (depth, value, flag, best move)
+        self.killers = {}    # ply -> [move, move]
+        self.history = {}    # move -> score
+        self.deadline = None
+        self.root_move = None
+        self.reset_stats()
+        self.start_clock(None)
+
+    def start_clock(self, time_limit):
+        """Set the deadline `time_limit` seconds from now (None: no limit), checking
+        the clock again from the next node."""
+        self.last_check = time.perf_counter()
+        self.deadline = None if time_limit is None else self.last_check + time_limit
+        self.check_interval = 1  # nodes between clock checks, scaled to the cost of a node
+        self.checked_at = self.nodes
+        self.next_check = 0
+
+    def reset_stats(self):
+        self.nodes = 0
+        self.checked_at = self.next_check = 0  # the node count restarts, so must the clock schedule
+        self.interior = 0
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.tt_hits = 0
+        self.researches = 0
+
+    def stats(self):
+        """Node counts and pruning ratios of the searches since the last reset."""
+        return {
+            "nodes": self.nodes,
+            "interior": self.interior,
+            "cutoffs": self.cutoffs,
+            "cutoff_ratio": self.cutoffs / self.interior if self.interior else 0.0,
+            "first_move_cutoff_ratio": self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0,
+            "tt_hits": self.tt_hits,
+            "pvs_researches": self.researches,
+        }
+
+    def search(self, max_depth, time_limit=None):
+        """Deepen one ply at a time up to `max_depth` or until `time_limit` seconds pass.
+
+        Returns (best move, value, depth reached); the result of the last
+        completed iteration is kept when time runs out.
+        """
+        self.start_clock(time_limit)
+        best_move, best_value, reached = None, None, 0
+        for depth in range(1, max_depth + 1):
+            self.root_move = None
+            try:
+                value = self._negamax(depth, -math.inf, math.inf, 0)
+            except SearchTimeout:
+                break
+            if self.root_move is None:  # answered straight from the table
+                self.root_move = self.table[self.game.key()][3]
+            best_move, best_value, reached = self.root_move, value, depth
+            if self.trace:
+                print(f"Depth {depth}: value={value}, best move={best_move}")
+            if self.game.is_terminal() or abs(value) == math.inf:
+                break
+        return best_move, best_value, reached
+
+    def search_value(self, depth, alpha=-math.inf, beta=math.inf, ply=0):
+        """Fixed-depth value of the current position inside the (alpha, beta) window.
+
+        Raises SearchTimeout once the deadline set by `start_clock` passes.
+        """
+        return self._negamax(depth, alpha, beta, ply)
+
+    def _ordered(self, moves, tt_move, ply):
+        killers = self.killers.get(ply, ())
+        history = self.history
+
+        def rank(move):
+            if move == tt_move:
+                return (0, 0)
+            if move in killers:
+                return (1, 0)
+            return (2, -history.get(move, 0))
+        return sorted(moves, key=rank)
+
+    def _store(self, key, depth, value, flag, move):
+        table = self.table
+        if key not in table and len(table) >= self.tt_size:
+            del table[next(iter(table))]
+        table[key] = (depth, value, flag, move)
+
+    def _check_clock(self):
+        """Raise SearchTimeout past the deadline; otherwise schedule the next check
+        about CHECK_PERIOD seconds of nodes ahead, whatever a node costs in this game."""
+        now = time.perf_counter()
+        if now > self.deadline:
+            raise SearchTimeout
+        elapsed, done = now - self.last_check, self.nodes - self.checked_at
+        if elapsed > 0 and done > 0:
+            # at most double each time, so a few cheap nodes cannot stretch the interval
+            estimate = int(CHECK_PERIOD * done / elapsed)
+            self.check_interval = max(1, min(estimate, 2 * self.check_interval, 4096))
+        self.last_check, self.checked_at = now, self.nodes
+        self.next_check = self.nodes + self.check_interval
+
+    def _negamax(self, depth, alpha, beta, ply):
+        game = self.game
+        self.nodes += 1
+        if self.deadline is not None and self.nodes >= self.next_check:
+            self._check_clock()
+        trace = self.trace
+        if trace:
+            print(f"{'  ' * ply}node depth={depth} alpha={alpha} beta={beta}")
+
+        alpha_orig = alpha
+        key = game.key()
+        entry = self.table.get(key)
+        tt_move = None
+        if entry is not None:
+            tt_move = entry[3]
+            if entry[0] >= depth:
+                self.tt_hits += 1
+                value, flag = entry[1], entry[2]
+                if flag == EXACT:
+                    return value
+                if flag == LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        if depth == 0 or game.is_terminal():
+            value = game.evaluate()
+            if trace:
+                print(f"{'  ' * ply}leaf value={value}")
+            return value
+
+        self.interior += 1
+        best, best_move = -math.inf, None
+        for i, move in enumerate(self._ordered(game.moves(), tt_move, ply)):
+            game.apply(move)
+            try:
+                if i == 0:
+                    score = -self._negamax(depth - 1, -beta, -alpha, ply + 1)
+                else:
+                    # null window first; only a fail-high inside (alpha, beta) is re-searched
+                    score = -self._negamax(depth - 1, -alpha - 1, -alpha, ply + 1)
+                    if alpha < score < beta:
+                        self.researches += 1
+                        score = -self._negamax(depth - 1, -beta, -score, ply + 1)
+            finally:
+                game.undo(move)
+            if score > best:
+                best, best_move = score, move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                self.cutoffs += 1
+                if i == 0:
+                    self.first_move_cutoffs += 1
+                killers = self.killers.setdefault(ply, [])
+                if move not in killers:
+                    killers.insert(0, move)
+                    del killers[2:]
+                self.history[move] = self.history.get(move, 0) + depth * depth
+                if trace:
+                    print(f"{'  ' * ply}cutoff after move {move} (alpha={alpha}, beta={beta})")
+                break
+
+        flag = UPPER if best <= alpha_orig else LOWER if best >= beta else EXACT
+        self._store(key, depth, best, flag, best_move)
+        if ply == 0:
+            self.root_move = best_move
+        return best
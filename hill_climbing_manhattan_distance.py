@@ -37,37 +37,49 @@ def print_state(state):
         print(' '.join(str(x) for x in row))
     print()
 
-def hill_climb(start, goal):
+def hill_climb(start, goal, trace=False, stats=None, batch_heuristic=None):
+    """Steepest-ascent hill climbing; `batch_heuristic(boards, goal)` may score
+    all neighbours in one call (e.g. vectorized_heuristics.batch_manhattan)."""
     current = start
     current_h = manhattan_distance(current, goal)
     path = []
-    print("Start State:")
-    print_state(current)
+    expanded = 0
+    if trace:
+        print("Start State:")
+        print_state(current)
     while True:
-        neighbors = []
+        expanded += 1
+        if stats is not None:
+            stats["expanded"] = expanded
+        candidates = []
         for move_dir in directions:
             new_state = move(current, move_dir)
             if new_state:
-                h = manhattan_distance(new_state, goal)
-                neighbors.append((h, new_state, move_dir))
-        neighbors.sort()
+                candidates.append((new_state, move_dir))
+        if batch_heuristic is None:
+            scores = [manhattan_distance(new_state, goal) for new_state, _ in candidates]
+        else:
+            scores = batch_heuristic([new_state for new_state, _ in candidates], goal)
+        neighbors = sorted((h, new_state, move_dir) for h, (new_state, move_dir) in zip(scores, candidates))
         if neighbors and neighbors[0][0] < current_h:
             current_h = neighbors[0][0]
             current = neighbors[0][1]
             move_made = neighbors[0][2]
             path.append(move_made)
-            print(f"Move: {move_made}")
-            print_state(current)
+            if trace:
+                print(f"Move: {move_made}")
+                print_state(current)
             if current == goal:
                 return path
         else:
             return path
 
-print("Enter the start state row by row (use 0 for blank):")
-start_state = [list(map(int, input().split())) for _ in range(3)]
+if __name__ == "__main__":
+    print("Enter the start state row by row (use 0 for blank):")
+    start_state = [list(map(int, input().split())) for _ in range(3)]
 
-print("Enter the goal state row by row (use 0 for blank):")
-goal_state = [list(map(int, input().split())) for _ in range(3)]
+    print("Enter the goal state row by row (use 0 for blank):")
+    goal_state = [list(map(int, input().split())) for _ in range(3)]
 
-solution = hill_climb(start_state, goal_state)
-print("Sequence of moves:", solution)
+    solution = hill_climb(start_state, goal_state, trace=True)
+    print("Sequence of moves:", solution)
@@ -0,0 +1,243 @@
+"""Local search for sliding-tile puzzles: an anytime alternative to the
+hill-climbing scripts.
+
+Strategies: steepest-ascent hill climbing with optional sideways moves,
+first-choice hill climbing and simulated annealing, each wrapped in random
+restarts that can run in parallel worker processes sharing the best solution
+length found so far.
+
+Boards are flat row-major lists with 0 as the blank. A heuristic is a cost
+table, table[tile][cell], so scoring a neighbour is one table difference
+instead of a full re-evaluation of the board.
+"""
+
+import math
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from n_puzzle import board_size, distance_table, flatten, move_table
+
+# ----- Heuristics -----
+def misplaced_table(goal):
+    """table[tile][cell] = 1 if `tile` does not belong at `cell` (the blank never counts)."""
+    cells = len(goal)
+    table = [[0] * cells for _ in range(cells)]
+    for tile in range(1, cells):
+        for k in range(cells):
+            table[tile][k] = 0 if goal[k] == tile else 1
+    return table
+
+HEURISTICS = {
+    "manhattan": distance_table,
+    "misplaced": misplaced_table,
+}
+
+# ----- Search State -----
+class PuzzleState:
+    """A board mutated in place, its heuristic value and the blank's trail.
+
+    The trail lists the blank's cells from the start; a move straight back
+    pops it instead of growing it, so it stays a path with no immediate reversals.
+    """
+
+    def __init__(self, board, table):
+        self.board = list(board)
+        self.table = table
+        self.n = board_size(self.board)
+        self.neighbors = move_table(self.n)
+        self.blank = self.board.index(0)
+        self.h = sum(table[tile][k] for k, tile in enumerate(self.board) if tile != 0)
+        self.trail = [self.blank]
+
+    def delta(self, cell):
+        """Change in h if the tile at `cell` slides into the blank."""
+        tile = self.board[cell]
+        return self.table[tile][self.blank] - self.table[tile][cell]
+
+    def move(self, cell):
+        tile = self.board[cell]
+        self.h += self.table[tile][self.blank] - self.table[tile][cell]
+        self.board[self.blank], self.board[cell] = tile, 0
+        self.blank = cell
+        if len(self.trail) >= 2 and self.trail[-2] == cell:
+            self.trail.pop()
+        else:
+            self.trail.append(cell)
+
+    def length(self):
+        return len(self.trail) - 1
+
+    def directions(self):
+        """The trail as the hill-climbing scripts' move names (direction the blank moves)."""
+        names = {-self.n: 'up', self.n: 'down', -1: 'left', 1: 'right'}
+        return [names[b - a] for a, b in zip(self.trail, self.trail[1:])]
+
+# ----- Strategies -----
+def hill_climb(state, rng, max_steps=1000, max_length=math.inf, sideways=0):
+    """Steepest ascent; up to `sideways` equal-valued moves may cross plateaus."""
+    for _ in range(max_steps):
+        if state.h == 0 or state.length() >= max_length:
+            return
+        deltas = [(state.delta(cell), cell) for cell in state.neighbors[state.blank]]
+        best = min(d for d, _ in deltas)
+        if best > 0 or (best == 0 and sideways <= 0):
+            return
+        if best == 0:
+            sideways -= 1
+        state.move(rng.choice([cell for d, cell in deltas if d == best]))
+
+def first_choice(state, rng, max_steps=1000, max_length=math.inf, sideways=0):
+    """Take the first improving neighbour in random order."""
+    for _ in range(max_steps):
+        if state.h == 0 or state.length() >= max_length:
+            return
+        cells = list(state.neighbors[state.blank])
+        rng.shuffle(cells)
+        level = None
+        for cell in cells:
+            d = state.delta(cell)
+            if d < 0:
+                state.move(cell)
+                break
+            if d == 0 and level is None:
+                level = cell
+        else:
+            if level is None or sideways <= 0:
+                return
+            sideways -= 1
+            state.move(level)
+
+def simulated_annealing(state, rng, max_steps=1000, max_length=math.inf,
+                        temperature=2.0, cooling=0.995, min_temperature=0.01):
+    """Random neighbour, accepted if not worse or with probability exp(-delta / T)."""
+    for _ in range(max_steps):
+        if state.h == 0 or state.length() >= max_length or temperature < min_temperature:
+            return
+        cell = rng.choice(state.neighbors[state.blank])
+        d = state.delta(cell)
+        if d <= 0 or rng.random() < math.exp(-d / temperature):
+            state.move(cell)
+        temperature *= cooling
+
+STRATEGIES = {
+    "hill": hill_climb,
+    "first-choice": first_choice,
+    "annealing": simulated_annealing,
+}
+
+# ----- Random Restarts -----
+_shared_best = None
+
+def _better(a, b):
+    """Lower h first (0 means solved), then the shorter path."""
+    if b is None:
+        return True
+    return (a["h"], len(a["path"])) < (b["h"], len(b["path"]))
+
+def random_restarts(start, goal, heuristic="manhattan", strategy="hill", restarts=100,
+                    walk=10, time_limit=None, seed=None, batch=False, **options):
+    """Run `strategy` from the start and then from random walks of `walk` moves.
+
+    Returns the best result seen as a dict with the move names ("path"), the
+    final heuristic value ("h", 0 when solved), "solved", "restarts" and
+    "seconds". Stops early when `time_limit` seconds have passed, but always
+    finishes the first climb so there is a result to return.
+
+    With batch=True all the climbs run in lockstep with NumPy instead (see
+    vectorized_heuristics.batched_hill_climb). That only supports the "hill"
+    strategy with a named heuristic and the `sideways`/`max_steps` options,
+    and `time_limit` then stops every climb after its current step.
+    """
+    if batch:
+        if strategy != "hill" or not isinstance(heuristic, str):
+            raise ValueError("batch=True needs strategy='hill' and a named heuristic")
+        from vectorized_heuristics import batched_hill_climb
+        began = time.perf_counter()
+        best = batched_hill_climb(start, goal, climbs=max(restarts, 1), heuristic=heuristic, walk=walk,
+                                  seed=seed, time_limit=time_limit, **options)
+        best["seconds"] = time.perf_counter() - began
+        return best
+    start, goal = flatten(start), flatten(goal)
+    table = HEURISTICS[heuristic](goal) if isinstance(heuristic, str) else heuristic(goal)
+    search = STRATEGIES[strategy]
+    rng = random.Random(seed)
+    began = time.perf_counter()
+    best = None
+    done = 0
+    for restart in range(max(restarts, 1)):
+        if restart and time_limit is not None and time.perf_counter() - began > time_limit:
+            break
+        max_length = _shared_best.value if _shared_best is not None else math.inf
+        if best is not None and best["h"] == 0:
+            max_length = min(max_length, len(best["path"]))
+        state = PuzzleState(start, table)
+        if restart:
+            for _ in range(walk):
+                state.move(rng.choice(state.neighbors[state.blank]))
+        search(state, rng, max_length=max_length, **options)
+        done += 1
+        result = {"path": state.directions(), "h": state.h}
+        if _better(result, best):
+            best = result
+            if state.h == 0 and _shared_best is not None:
+                with _shared_best.get_lock():
+                    if state.length() < _shared_best.value:
+                        _shared_best.value = state.length()
+    best["solved"] = best["h"] == 0
+    best["restarts"] = done
+    best["seconds"] = time.perf_counter() - began
+    return best
+
+def _init_worker(shared_best):
+    global _shared_best
+    _shared_best = shared_best
+
+def parallel_restarts(start, goal, workers=None, restarts=1000, seed=None, **options):
+    """Split random restarts over worker processes sharing the best solution length.
+
+    Workers stop a climb as soon as its path is no shorter than the best
+    solution any worker has found.
+    """
+    workers = workers or os.cpu_count() or 1
+    seed = random.randrange(2 ** 32) if seed is None else seed
+    restarts = max(restarts, 1)   # every submitted share returns a result
+    shared_best = multiprocessing.Value('i', 2 ** 31 - 1)
+    began = time.perf_counter()
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(shared_best,)) as pool:
+        share, extra = divmod(restarts, workers)
+        futures = [pool.submit(random_restarts, start, goal, restarts=share + (i < extra),
+                               seed=seed + i, **options)
+                   for i in range(workers) if share + (i < extra)]
+        results = [f.result() for f in futures]
+    best = None
+    for result in results:
+        if _better(result, best):
+            best = result
+    best["restarts"] = sum(r["restarts"] for r in results)
+    best["seconds"] = time.perf_counter() - began
+    return best
+
+if __name__ == "__main__":
+    print("Enter the start state row by row (use 0 for blank):")
+    start_state = [list(map(int, input().split())) for _ in range(3)]
+
+    print("Enter the goal state row by row (use 0 for blank):")
+    goal_state = [list(map(int, input().split())) for _ in range(3)]
+
+    runs = [
+        ("hill climbing + sideways", dict(strategy="hill", sideways=20)),
+        ("first-choice", dict(strategy="first-choice", sideways=20)),
+        ("simulated annealing", dict(strategy="annealing", max_steps=5000)),
+    ]
+    for name, options in runs:
+        for heuristic in HEURISTICS:
+            result = random_restarts(start_state, goal_state, heuristic=heuristic,
+                                     restarts=200, seed=0, **options)
+            rate = result["restarts"] / result["seconds"] if result["seconds"] else float("inf")
+            status = f"solved in {len(result['path'])} moves" if result["solved"] else f"stuck at h={result['h']}"
+            print(f"{name} ({heuristic}): {status}, {rate:.0f} restarts/s")
+            if result["solved"]:
+                print("  Sequence of moves:", result["path"])
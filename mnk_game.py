@@ -0,0 +1,207 @@
+"""Generalised m,n,k-games (tic-tac-toe is 3,3,3; gomoku is 15,15,5) with an AI player.
+
+The board keeps, for every run of k cells ("window"), how many stones each
+player has in it. Placing or removing a stone only touches the windows
+through that cell, which gives:
+  * win detection that looks only at lines through the last move (a window
+    reaching k stones), and
+  * an incrementally updated threat score: each window owned by a single
+    player is worth more the fuller it is.
+The AI searches with game_search.AlphaBetaSearch under a wall-clock budget,
+considering only empty cells near existing stones.
+"""
+
+from game_search import AlphaBetaSearch, Game, Zobrist
+
+WIN = 10 ** 9
+EMPTY, X, O = 0, 1, 2
+SYMBOLS = {EMPTY: ".", X: "X", O: "O"}
+
+class MNKGame(Game):
+    """m rows, n columns, k in a row to win; X (1) moves first."""
+
+    def __init__(self, m=15, n=15, k=5, radius=1, max_candidates=None):
+        self.m, self.n, self.k = m, n, k
+        self.radius = radius
+        self.max_candidates = max_candidates
+        self.cells = [EMPTY] * (m * n)
+        self.player = X
+        self.history = []
+        self.winner = None
+        self.hash = 0
+        self.zobrist = Zobrist()
+        self.weights = [0] + [8 ** c for c in range(k - 1)] + [WIN]
+
+        # every k-long line on the board, and the windows through each cell
+        self.windows = []
+        for r in range(m):
+            for c in range(n):
+                for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    er, ec = r + dr * (k - 1), c + dc * (k - 1)
+                    if 0 <= er < m and 0 <= ec < n:
+                        self.windows.append(tuple((r + dr * i) * n + c + dc * i for i in range(k)))
+        self.cell_windows = [[] for _ in range(m * n)]
+        for w, window in enumerate(self.windows):
+            for cell in window:
+                self.cell_windows[cell].append(w)
+        self.counts = [[0, 0, 0] for _ in self.windows]  # [unused, X stones, O stones]
+        self.score = 0  # threat score from X's point of view
+
+        # near[cell] = stones within `radius`; candidate moves are empty cells with near > 0
+        self.near = [0] * (m * n)
+        self.around = []
+        for r in range(m):
+            for c in range(n):
+                self.around.append(tuple(rr * n + cc
+                                         for rr in range(max(0, r - radius), min(m, r + radius + 1))
+                                         for cc in range(max(0, c - radius), min(n, c + radius + 1))
+                                         if (rr, cc) != (r, c)))
+
+    # ----- Window bookkeeping -----
+    def _value(self, counts):
+        """Threat value of one window for X (positive) or O (negative)."""
+        if counts[O] == 0:
+            return self.weights[counts[X]]
+        if counts[X] == 0:
+            return -self.weights[counts[O]]
+        return 0
+
+    def apply(self, move):
+        player = self.player
+        self.cells[move] = player
+        self.hash ^= self.zobrist[(move, player)]
+        won = False
+        for w in self.cell_windows[move]:
+            counts = self.counts[w]
+            self.score -= self._value(counts)
+            counts[player] += 1
+            self.score += self._value(counts)
+            if counts[player] == self.k:
+                won = True
+        for cell in self.around[move]:
+            self.near[cell] += 1
+        self.history.append((move, self.winner))
+        if won:
+            self.winner = player
+        self.player = O if player == X else X
+
+    def undo(self, move):
+        _, self.winner = self.history.pop()
+        player = O if self.player == X else X
+        self.player = player
+        self.cells[move] = EMPTY
+        self.hash ^= self.zobrist[(move, player)]
+        for w in self.cell_windows[move]:
+            counts = self.counts[w]
+            self.score -= self._value(counts)
+            counts[player] -= 1
+            self.score += self._value(counts)
+        for cell in self.around[move]:
+            self.near[cell] -= 1
+
+    # ----- Game interface -----
+    def moves(self):
+        """Empty cells next to a stone, most threatening (for either side) first."""
+        if not self.history:
+            return [(self.m // 2) * self.n + self.n // 2]
+        cells, near = self.cells, self.near
+        candidates = [cell for cell in range(self.m * self.n) if near[cell] and cells[cell] == EMPTY]
+        weights, counts = self.weights, self.counts
+
+        def priority(cell):
+            total = 0
+            for w in self.cell_windows[cell]:
+                x, o = counts[w][X], counts[w][O]
+                if o == 0:
+                    total += weights[x + 1]
+                if x == 0:
+                    total += weights[o + 1]
+            return -total
+        candidates.sort(key=priority)
+        if self.max_candidates:
+            del candidates[self.max_candidates:]
+        return candidates
+
+    def playout_moves(self):
+        """The same cells as `moves`, unsorted and uncapped."""
+        if not self.history:
+            return self.moves()
+        cells, near = self.cells, self.near
+        return [cell for cell in range(self.m * self.n) if near[cell] and cells[cell] == EMPTY]
+
+    def is_terminal(self):
+        return self.winner is not None or len(self.history) == self.m * self.n
+
+    def evaluate(self):
+        if self.winner is not None:
+            # the previous player just won; prefer faster wins and slower losses
+            return -WIN + len(self.history)
+        return self.score if self.player == X else -self.score
+
+    def key(self):
+        return self.hash if self.player == X else self.hash ^ self.zobrist["O to move"]
+
+    def print_board(self):
+        print("    " + " ".join(f"{c + 1:2d}" for c in range(self.n)))
+        for r in range(self.m):
+            row = self.cells[r * self.n:(r + 1) * self.n]
+            print(f"{r + 1:2d}  " + " ".join(f"{SYMBOLS[v]:>2}" for v in row))
+        print()
+
+class AIPlayer:
+    """Alpha-beta player that answers within `time_limit` seconds."""
+
+    def __init__(self, game, time_limit=2.0, max_depth=12):
+        self.game = game
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.engine = AlphaBetaSearch(game)
+
+    def choose(self):
+        self.engine.reset_stats()
+        move, value, depth = self.engine.search(self.max_depth, time_limit=self.time_limit)
+        if move is None:  # not even depth 1 finished in time
+            move = self.game.moves()[0]
+        return move, value, depth
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Play an m,n,k-game (default: 15x15 gomoku).")
+    parser.add_argument("--rows", type=int, default=15)
+    parser.add_argument("--cols", type=int, default=15)
+    parser.add_argument("--k", type=int, default=5, help="stones in a row needed to win")
+    parser.add_argument("--time", type=float, default=2.0, help="AI time budget per move in seconds")
+    parser.add_argument("--computer", choices=["X", "O", "both", "none"], default="O")
+    args = parser.parse_args()
+
+    game = MNKGame(args.rows, args.cols, args.k)
+    ai = AIPlayer(game, time_limit=args.time)
+    computer = {"X": {X}, "O": {O}, "both": {X, O}, "none": set()}[args.computer]
+
+    while not game.is_terminal():
+        game.print_board()
+        if game.player in computer:
+            began = time.perf_counter()
+            move, value, depth = ai.choose()
+            stats = ai.engine.stats()
+            print(f"Computer ({SYMBOLS[game.player]}) plays {move // game.n + 1} {move % game.n + 1} "
+                  f"(depth {depth}, {stats['nodes']} nodes, {time.perf_counter() - began:.2f}s)")
+        else:
+            try:
+                r, c = map(int, input(f"Player {SYMBOLS[game.player]} (row col): ").split())
+            except ValueError:
+                print("Enter a row and a column, e.g. 8 8")
+                continue
+            move = (r - 1) * game.n + (c - 1)
+            if not (0 < r <= game.m and 0 < c <= game.n) or game.cells[move] != EMPTY:
+                print("That spot is not available! Try again.")
+                continue
+        game.apply(move)
+
+    game.print_board()
+    if game.winner is not None:
+        print(f"Player {SYMBOLS[game.winner]} wins!")
+    else:
+        print("It's a draw!")
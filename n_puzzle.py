@@ -0,0 +1,202 @@
+"""Size-parametric sliding-tile puzzle (3x3, 4x4, 5x5, ...) with an IDA* solver.
+
+Boards are flat row-major lists of n*n tiles with 0 as the blank; lists of
+rows are accepted wherever a board is passed in.
+"""
+
+import functools
+import math
+
+# ----- Board Utilities -----
+def flatten(board):
+    """Accept a flat sequence or a list of rows."""
+    if board and isinstance(board[0], (list, tuple)):
+        return [x for row in board for x in row]
+    return list(board)
+
+def board_size(cells):
+    n = int(round(len(cells) ** 0.5))
+    if n * n != len(cells):
+        raise ValueError(f"board with {len(cells)} cells is not square")
+    return n
+
+def cell_neighbors(n):
+    """neighbors[cell] = cells one orthogonal step away."""
+    neighbors = []
+    for k in range(n * n):
+        x, y = divmod(k, n)
+        around = []
+        for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < n and 0 <= ny < n:
+                around.append(nx * n + ny)
+        neighbors.append(tuple(around))
+    return neighbors
+
+def goal_board(n):
+    """Tiles 1..n*n-1 in order with the blank last."""
+    return list(range(1, n * n)) + [0]
+
+def find_zero(board):
+    return board.index(0)
+
+@functools.lru_cache(maxsize=None)
+def move_table(n):
+    """move_table(n)[cell] = cells the blank can move to from `cell`."""
+    return tuple(cell_neighbors(n))
+
+def distance_table(goal):
+    """table[tile][cell] = Manhattan distance of `tile` at `cell` from its goal cell."""
+    n = board_size(goal)
+    cells = n * n
+    table = [[0] * cells for _ in range(cells)]
+    for target, tile in enumerate(goal):
+        if tile != 0:
+            for k in range(cells):
+                table[tile][k] = abs(k // n - target // n) + abs(k % n - target % n)
+    return table
+
+def manhattan_distance(board, goal):
+    table = distance_table(goal)
+    return sum(table[tile][k] for k, tile in enumerate(board) if tile != 0)
+
+def to_rows(board):
+    n = board_size(board)
+    return [list(board[i:i + n]) for i in range(0, n * n, n)]
+
+def print_board(board):
+    for row in to_rows(board):
+        print(' '.join(f"{x:2d}" if x != 0 else '  ' for x in row))
+    print()
+
+# ----- Solvability -----
+def permutation_parity(board, goal):
+    """Parity of the permutation taking `goal` to `board`, by cycle decomposition."""
+    where = {tile: k for k, tile in enumerate(goal)}
+    mapping = [where[tile] for tile in board]
+    seen = [False] * len(board)
+    parity = 0
+    for k in range(len(board)):
+        length = 0
+        while not seen[k]:
+            seen[k] = True
+            k = mapping[k]
+            length += 1
+        if length:
+            parity ^= (length - 1) & 1
+    return parity
+
+def is_solvable(start, goal):
+    """Every move is one transposition and moves the blank one cell, so the
+    permutation parity must match the parity of the blank's Manhattan distance."""
+    start, goal = flatten(start), flatten(goal)
+    if sorted(start) != sorted(goal):
+        return False
+    n = board_size(start)
+    a, b = start.index(0), goal.index(0)
+    blank_parity = (abs(a // n - b // n) + abs(a % n - b % n)) & 1
+    return permutation_parity(start, goal) == blank_parity
+
+# ----- IDA* Search -----
+def ida_star(start, goal=None, heuristic=None, stats=None):
+    """Solve with IDA*; returns the list of boards (as rows) or None if unsolvable.
+
+    Memory is O(depth): one board mutated in place plus the stack of blank
+    cells. Moves that undo the previous move are skipped. `heuristic` is an
+    optional callable on flat boards (e.g. a pattern database); by default the
+    Manhattan distance is updated incrementally. If a `stats` dict is given,
+    the expanded node count and number of iterations are stored in it.
+    """
+    board = flatten(start)
+    n = board_size(board)
+    goal = goal_board(n) if goal is None else flatten(goal)
+    if sorted(board) != list(range(n * n)) or sorted(goal) != list(range(n * n)):
+        raise ValueError(f"boards must hold the tiles 0..{n * n - 1} exactly once")
+    if not is_solvable(board, goal):
+        return None
+
+    neighbors = move_table(n)
+    table = distance_table(goal)
+    initial = list(board)
+    path = [board.index(0)]  # blank cell after each move
+    expanded = 0
+    found = -1
+
+    def search(blank, prev, g, h, bound):
+        nonlocal expanded
+        f = g + h
+        if f > bound:
+            return f
+        if h == 0 and board == goal:
+            return found
+        expanded += 1
+        minimum = math.inf
+        for cell in neighbors[blank]:
+            if cell == prev:
+                continue
+            tile = board[cell]
+            board[blank], board[cell] = tile, 0
+            if heuristic is None:
+                h_new = h + table[tile][blank] - table[tile][cell]
+            else:
+                h_new = heuristic(board)
+            path.append(cell)
+            result = search(cell, blank, g + 1, h_new, bound)
+            if result == found:
+                return found
+            path.pop()
+            board[blank], board[cell] = 0, tile
+            if result < minimum:
+                minimum = result
+        return minimum
+
+    if heuristic is None:
+        h = sum(table[tile][k] for k, tile in enumerate(board) if tile != 0)
+    else:
+        h = heuristic(board)
+    bound = h
+    iterations = 0
+    while True:
+        iterations += 1
+        result = search(path[0], -1, 0, h, bound)
+        if result == found or result == math.inf:
+            break
+        bound = result
+
+    if stats is not None:
+        stats["expanded"] = expanded
+        stats["iterations"] = iterations
+    if result != found:
+        return None
+    boards = [to_rows(initial)]
+    for blank, cell in zip(path, path[1:]):
+        initial[blank], initial[cell] = initial[cell], 0
+        boards.append(to_rows(initial))
+    return boards
+
+def input_board(prompt, n):
+    print(prompt)
+    board = []
+    for _ in range(n):
+        row = input(f"Enter {n} numbers separated by spaces (use 0 for blank): ").split()
+        board.extend(map(int, row))
+    return board
+
+if __name__ == "__main__":
+    n = int(input("Board size (3 for the 8-puzzle, 4 for the 15-puzzle): "))
+    start = input_board("Enter START state:", n)
+    goal = goal_board(n)
+    if input("Use the standard goal (tiles in order, blank last)? (y/n): ").strip().lower() != "y":
+        goal = input_board("Enter GOAL state:", n)
+
+    if not is_solvable(start, goal):
+        print("\nThis start state cannot reach the goal (permutation parity mismatch).")
+    else:
+        print("\nSearching with IDA*...\n")
+        stats = {}
+        solution = ida_star(start, goal, stats=stats)
+        print(f"Solution found in {len(solution) - 1} moves "
+              f"({stats['expanded']} nodes expanded, {stats['iterations']} iterations):\n")
+        for step, rows in enumerate(solution):
+            print(f"Step {step}:")
+            print_board([x for row in rows for x in row])
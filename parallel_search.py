@@ -0,0 +1,268 @@
+"""Parallel players for any game_search.Game: root-split alpha-beta and Monte Carlo tree search.
+
+Every player gets a wall-clock budget, returns its best move and reports
+how many nodes (alpha-beta) or playouts (MCTS) it managed per second.
+
+  * root_parallel_alpha_beta: iterative deepening where the root moves of
+    each iteration are split over a process pool; workers share the best
+    root value found so far, so later moves are searched with a raised alpha.
+  * root_parallel_mcts: independent UCT trees in worker processes whose
+    root visit counts are summed.
+  * tree_parallel_mcts: threads sharing one UCT tree, with virtual loss
+    steering concurrent selections apart. Under CPython's GIL the threads
+    interleave rather than run at once, so this mode only scales on a
+    free-threaded interpreter.
+"""
+
+import copy
+import math
+import multiprocessing
+import os
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from game_search import AlphaBetaSearch, SearchTimeout
+
+# ----- Root-parallel alpha-beta -----
+_shared_alpha = None
+_engine = None
+
+def _init_alpha_worker(shared_alpha):
+    global _shared_alpha
+    _shared_alpha = shared_alpha
+
+def _search_root_moves(game, moves, depth, time_left):
+    """Worker: value each root move at `depth`, searching against the shared alpha.
+
+    Returns ([(move, value, exact)], nodes), or (None, nodes) if `time_left`
+    seconds passed (a duration, as perf_counter() values are not comparable
+    between processes). A move that fails low only gets an upper bound
+    (exact=False). The worker's engine, and so its transposition table, killers and history,
+    carries over from one iteration to the next.
+    """
+    global _engine
+    if _engine is None:
+        _engine = AlphaBetaSearch(game)
+    engine = _engine
+    engine.game = game
+    engine.reset_stats()
+    engine.start_clock(time_left)
+    results = []
+    try:
+        for move in moves:
+            alpha = _shared_alpha.value
+            game.apply(move)
+            try:
+                value = -engine.search_value(depth - 1, -math.inf, -alpha, ply=1)
+            finally:
+                game.undo(move)
+            results.append((move, value, value > alpha))
+            if value > alpha:
+                with _shared_alpha.get_lock():
+                    if value > _shared_alpha.value:
+                        _shared_alpha.value = value
+    except SearchTimeout:
+        return None, engine.nodes
+    return results, engine.nodes
+
+def root_parallel_alpha_beta(game, time_limit, workers=None, max_depth=20):
+    """Iterative deepening with each iteration's root moves split across processes."""
+    workers = workers or os.cpu_count() or 1
+    shared_alpha = multiprocessing.Value('d', -math.inf)
+    began = time.perf_counter()
+    deadline = began + time_limit
+    moves = list(game.moves())
+    best_move, best_value, reached, nodes = moves[0], None, 0, 0
+
+    with ProcessPoolExecutor(workers, initializer=_init_alpha_worker, initargs=(shared_alpha,)) as pool:
+        for depth in range(1, max_depth + 1):
+            shared_alpha.value = -math.inf
+            # deal the moves round-robin so every worker gets some of the best-ordered ones
+            time_left = deadline - time.perf_counter()
+            futures = [pool.submit(_search_root_moves, game, moves[i::workers], depth, time_left)
+                       for i in range(min(workers, len(moves)))]
+            results, timed_out = [], False
+            for future in futures:
+                part, part_nodes = future.result()
+                nodes += part_nodes
+                if part is None:
+                    timed_out = True
+                else:
+                    results.extend(part)
+            if timed_out:
+                break
+            results.sort(key=lambda r: (-r[1], not r[2]))
+            best_move, best_value, _ = results[0]
+            reached = depth
+            moves = [move for move, _, _ in results]  # best first for the next iteration
+            if abs(best_value) == math.inf or time.perf_counter() > deadline:
+                break
+
+    elapsed = time.perf_counter() - began
+    return {"move": best_move, "value": best_value, "depth": reached, "nodes": nodes,
+            "seconds": elapsed, "nodes_per_second": nodes / elapsed if elapsed else 0.0}
+
+# ----- Monte Carlo tree search -----
+class Node:
+    """UCT node; `wins` are credited to the player who made `move`."""
+
+    __slots__ = ("move", "parent", "children", "untried", "visits", "wins", "virtual")
+
+    def __init__(self, move, parent, moves):
+        self.move = move
+        self.parent = parent
+        self.children = []
+        self.untried = list(moves)
+        self.visits = 0
+        self.wins = 0.0
+        self.virtual = 0
+
+    def select(self, c):
+        log_n = math.log(max(self.visits + self.virtual, 1))
+
+        def uct(child):
+            n = child.visits + child.virtual
+            if n == 0:  # still in its first playout on another thread (no virtual loss)
+                return math.inf
+            # a pending virtual visit counts as a loss until its playout is backed up
+            return child.wins / n + c * math.sqrt(log_n / n)
+        return max(self.children, key=uct)
+
+def _outcome(game):
+    """+1/0/-1 for the player to move at a terminal position."""
+    value = game.evaluate()
+    return (value > 0) - (value < 0)
+
+def _playout(game, rng):
+    """Random moves to the end; returns the result for the player to move at the start."""
+    played = []
+    while not game.is_terminal():
+        move = rng.choice(game.playout_moves())
+        game.apply(move)
+        played.append(move)
+    result = _outcome(game)
+    if len(played) % 2:
+        result = -result
+    for move in reversed(played):
+        game.undo(move)
+    return result
+
+def _iteration(root, game, rng, c, lock=None, virtual_loss=0):
+    """Select, expand, simulate and back up once. With a lock, the tree walk and
+    the back-up are serialised and virtual loss marks the path in between."""
+    path = []
+    if lock:
+        lock.acquire()
+    node = root
+    while not node.untried and node.children:
+        node = node.select(c)
+        game.apply(node.move)
+        path.append(node)
+    if node.untried and not game.is_terminal():
+        move = node.untried.pop(rng.randrange(len(node.untried)))
+        game.apply(move)
+        child = Node(move, node, () if game.is_terminal() else game.moves())
+        node.children.append(child)
+        node = child
+        path.append(node)
+    for visited in path:
+        visited.virtual += virtual_loss
+    root.virtual += virtual_loss
+    if lock:
+        lock.release()
+
+    result = _playout(game, rng)  # for the player to move at `node`
+
+    if lock:
+        lock.acquire()
+    for visited in reversed(path):
+        visited.virtual -= virtual_loss
+        visited.visits += 1
+        visited.wins += (1 - result) / 2  # win for the player who moved into `visited`
+        result = -result
+        game.undo(visited.move)
+    root.virtual -= virtual_loss
+    root.visits += 1
+    if lock:
+        lock.release()
+
+def _run_mcts(game, time_limit, c, seed):
+    """Grow one UCT tree until the budget runs out; returns ({move: (visits, wins)}, playouts)."""
+    rng = random.Random(seed)
+    root = Node(None, None, game.moves())
+    deadline = time.perf_counter() + time_limit
+    playouts = 0
+    while time.perf_counter() < deadline:
+        _iteration(root, game, rng, c)
+        playouts += 1
+    return {child.move: (child.visits, child.wins) for child in root.children}, playouts
+
+def _summary(stats, playouts, began):
+    move = max(stats, key=lambda m: stats[m][0])
+    visits, wins = stats[move]
+    elapsed = time.perf_counter() - began
+    return {"move": move, "win_rate": wins / visits if visits else 0.0, "playouts": playouts,
+            "seconds": elapsed, "playouts_per_second": playouts / elapsed if elapsed else 0.0}
+
+def mcts(game, time_limit, c=1.4, seed=None):
+    """Single-threaded UCT; the most visited root move is returned."""
+    began = time.perf_counter()
+    stats, playouts = _run_mcts(game, time_limit, c, seed)
+    return _summary(stats, playouts, began)
+
+def root_parallel_mcts(game, time_limit, workers=None, c=1.4, seed=None):
+    """Independent trees per process, merged by summing root visit counts."""
+    workers = workers or os.cpu_count() or 1
+    seed = random.randrange(2 ** 32) if seed is None else seed
+    began = time.perf_counter()
+    with ProcessPoolExecutor(workers) as pool:
+        futures = [pool.submit(_run_mcts, game, time_limit, c, seed + i) for i in range(workers)]
+        merged, playouts = {}, 0
+        for future in futures:
+            stats, count = future.result()
+            playouts += count
+            for move, (visits, wins) in stats.items():
+                total = merged.get(move, (0, 0.0))
+                merged[move] = (total[0] + visits, total[1] + wins)
+    return _summary(merged, playouts, began)
+
+def tree_parallel_mcts(game, time_limit, threads=None, c=1.4, virtual_loss=1, seed=None):
+    """Threads sharing one tree; each thread plays on its own copy of the game."""
+    threads = threads or os.cpu_count() or 1
+    seed = random.randrange(2 ** 32) if seed is None else seed
+    root = Node(None, None, game.moves())
+    lock = threading.Lock()
+    deadline = time.perf_counter() + time_limit
+    counts = [0] * threads
+    began = time.perf_counter()
+
+    def work(index):
+        local = copy.deepcopy(game)
+        rng = random.Random(seed + index)
+        while time.perf_counter() < deadline:
+            _iteration(root, local, rng, c, lock, virtual_loss)
+            counts[index] += 1
+
+    pool = [threading.Thread(target=work, args=(i,)) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    stats = {child.move: (child.visits, child.wins) for child in root.children}
+    return _summary(stats, sum(counts), began)
+
+if __name__ == "__main__":
+    from mnk_game import MNKGame
+
+    game = MNKGame(3, 3, 3, radius=2)
+    print("Tic-tac-toe, empty board, 1 s per player:")
+    result = root_parallel_alpha_beta(game, 1.0)
+    print(f"  root-parallel alpha-beta: move {result['move'] + 1}, value {result['value']}, "
+          f"depth {result['depth']}, {result['nodes_per_second']:.0f} nodes/s")
+    for name, player in (("MCTS", mcts), ("root-parallel MCTS", root_parallel_mcts),
+                         ("tree-parallel MCTS", tree_parallel_mcts)):
+        result = player(game, 1.0)
+        print(f"  {name}: move {result['move'] + 1}, win rate {result['win_rate']:.2f}, "
+              f"{result['playouts_per_second']:.0f} playouts/s")
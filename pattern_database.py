@@ -0,0 +1,170 @@
+"""Additive disjoint pattern databases for the sliding-tile puzzles (8 and 15 puzzle).
+
+Each database covers a group of tiles and stores, for every placement of those
+tiles, the minimum number of moves *of those tiles* needed to reach the goal.
+Moves of other tiles are free, so the values of disjoint groups can be added
+and the sum is still an admissible heuristic.
+
+Boards are flat sequences of n*n tiles in row-major order with 0 as the blank.
+"""
+
+import mmap
+import os
+import struct
+
+from n_puzzle import board_size, cell_neighbors, flatten
+
+MAGIC = b"PDB1"
+UNSEEN = 255
+
+# ----- Helpers -----
+def default_partition(goal, group_size=None):
+    """Split the goal's tiles, in row-major order, into groups (4-4 for 3x3, 5-5-5 for 4x4)."""
+    goal = flatten(goal)
+    if group_size is None:
+        group_size = 4 if len(goal) <= 9 else 5
+    tiles = [t for t in goal if t != 0]
+    return [tuple(tiles[i:i + group_size]) for i in range(0, len(tiles), group_size)]
+
+# ----- Pattern Database -----
+class PatternDatabase:
+    """Distance table for one tile group, indexed by the group's cell positions.
+
+    A placement is indexed as sum(position[tile_i] * cells**i), so the table
+    has cells**k one-byte entries; placements with clashing positions stay unused.
+    """
+
+    def __init__(self, goal, pattern, table):
+        self.goal = tuple(flatten(goal))
+        self.n = board_size(self.goal)
+        self.cells = self.n * self.n
+        self.pattern = tuple(pattern)
+        self.weights = tuple(self.cells ** i for i in range(len(self.pattern)))
+        self.table = table
+
+    @classmethod
+    def build(cls, goal, pattern):
+        """Backwards 0-1 BFS from the goal over (pattern placement, blank cell) states."""
+        goal = flatten(goal)
+        n = board_size(goal)
+        cells = n * n
+        pattern = tuple(pattern)
+        weights = [cells ** i for i in range(len(pattern))]
+        neighbors = cell_neighbors(n)
+
+        table = bytearray([UNSEEN]) * (cells ** len(pattern))
+        seen = bytearray(len(table) * cells)
+        start_index = sum(goal.index(t) * w for t, w in zip(pattern, weights))
+        layer = [start_index * cells + goal.index(0)]
+        depth = 0
+        while layer:
+            next_layer = []
+            stack = layer
+            while stack:
+                state = stack.pop()
+                if seen[state]:
+                    continue
+                seen[state] = 1
+                index, blank = divmod(state, cells)
+                if table[index] == UNSEEN:
+                    table[index] = depth  # layers are popped in cost order, so this is the minimum
+                positions = [(index // w) % cells for w in weights]
+                for cell in neighbors[blank]:
+                    if cell in positions:
+                        # a pattern tile slides into the blank: costs one move
+                        slot = positions.index(cell)
+                        nxt = (index + (blank - cell) * weights[slot]) * cells + cell
+                        if not seen[nxt]:
+                            next_layer.append(nxt)
+                    else:
+                        nxt = index * cells + cell
+                        if not seen[nxt]:
+                            stack.append(nxt)
+            layer = next_layer
+            depth += 1
+        return cls(goal, pattern, table)
+
+    def save(self, path):
+        """Write header (magic, n, k, pattern, goal) followed by the raw table."""
+        with open(path, "wb") as f:
+            f.write(MAGIC + struct.pack("BB", self.n, len(self.pattern)))
+            f.write(bytes(self.pattern) + bytes(self.goal))
+            f.write(self.table)
+
+    @classmethod
+    def load(cls, path):
+        """Memory-map a saved database; pages are read lazily on lookup."""
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if data[:4] != MAGIC:
+            raise ValueError(f"{path} is not a pattern database file")
+        n, k = struct.unpack_from("BB", data, 4)
+        offset = 6
+        pattern = tuple(data[offset:offset + k])
+        goal = tuple(data[offset + k:offset + k + n * n])
+        return cls(goal, pattern, memoryview(data)[offset + k + n * n:])
+
+    def lookup(self, where):
+        """Value for a board given as where[tile] = cell."""
+        return self.table[sum(where[t] * w for t, w in zip(self.pattern, self.weights))]
+
+    def __call__(self, board):
+        where = [0] * self.cells
+        for cell, tile in enumerate(flatten(board)):
+            where[tile] = cell
+        return self.lookup(where)
+
+class AdditivePatternDatabase:
+    """Sum of disjoint pattern databases; call it with a flat board to get h."""
+
+    def __init__(self, databases):
+        self.databases = list(databases)
+        self.cells = self.databases[0].cells
+
+    def __call__(self, board):
+        where = [0] * self.cells
+        for cell, tile in enumerate(board):
+            where[tile] = cell
+        return sum(db.lookup(where) for db in self.databases)
+
+def database_path(directory, goal, pattern):
+    goal = flatten(goal)
+    n = board_size(goal)
+    name = f"pdb_{n}x{n}_{''.join(format(t, 'x') for t in goal)}_{'-'.join(map(str, pattern))}.bin"
+    return os.path.join(directory, name)
+
+def load_or_build(goal, partition=None, directory="pdb"):
+    """Load the additive database for `goal` from `directory`, building missing parts first."""
+    partition = partition or default_partition(goal)
+    os.makedirs(directory, exist_ok=True)
+    databases = []
+    for pattern in partition:
+        path = database_path(directory, goal, pattern)
+        if not os.path.exists(path):
+            PatternDatabase.build(goal, pattern).save(path)
+        databases.append(PatternDatabase.load(path))
+    return AdditivePatternDatabase(databases)
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from A_star import a_star, goal_state
+
+    parser = argparse.ArgumentParser(description="Build pattern databases and compare them with Manhattan distance.")
+    parser.add_argument("--directory", default="pdb", help="where database files are stored")
+    args = parser.parse_args()
+
+    began = time.perf_counter()
+    pdb = load_or_build(goal_state, directory=args.directory)
+    print(f"Pattern databases ready in {time.perf_counter() - began:.2f}s")
+
+    start = [[5, 6, 7],
+             [4, 0, 8],
+             [3, 2, 1]]
+    for name, heuristic in (("Manhattan", None), ("Pattern DB", pdb)):
+        stats = {}
+        began = time.perf_counter()
+        path = a_star(start, heuristic=heuristic, stats=stats)
+        print(f"{name}: {len(path) - 1} moves, {stats['expanded']} nodes expanded, "
+              f"{time.perf_counter() - began:.3f}s")
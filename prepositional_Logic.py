@@ -1,5 +1,7 @@
 import itertools
 
+from sat_solver import Solver
+
 # ----- Step 1: Define propositional symbols -----
 symbols = ['R', 'W']  # R: It rains, W: Ground is wet
 
@@ -17,43 +19,157 @@ def QUERY(model):
     return model['W']
 
 # ----- Step 4: Truth table enumeration algorithm -----
-def entails(KB, QUERY, symbols):
-    print("Truth Table Evaluation:\n")
-    print("R\tW\tKB\tQ\tModel Valid?")
-    print("-"*40)
-    all_models = list(itertools.product([True, False], repeat=len(symbols)))
+def entails(KB, QUERY, symbols, verbose=True):
+    """Check every one of the 2^n models; kept as the reference oracle for small inputs."""
+    if verbose:
+        print("Truth Table Evaluation:\n")
+        print("\t".join(symbols) + "\tKB\tQ\tModel Valid?")
+        print("-"*40)
 
     kb_true_models = []
     entailment_holds = True
 
-    for values in all_models:
+    for values in itertools.product([True, False], repeat=len(symbols)):
         model = dict(zip(symbols, values))
         kb_val = KB(model)
         q_val = QUERY(model)
 
-        print(f"{model['R']}\t{model['W']}\t{kb_val}\t{q_val}", end='\t')
+        if verbose:
+            print("\t".join(str(v) for v in values) + f"\t{kb_val}\t{q_val}", end='\t')
 
         if kb_val:
-            kb_true_models.append(model)
+            if verbose:
+                kb_true_models.append(model)
             if not q_val:
                 entailment_holds = False
-                print("❌")
-            else:
+                if verbose:
+                    print("❌")
+                else:
+                    return False
+            elif verbose:
                 print("✅")
-        else:
+        elif verbose:
             print("-")
 
-    print("\nModels where KB is True:")
-    for m in kb_true_models:
-        print(m)
+    if verbose:
+        print("\nModels where KB is True:")
+        for m in kb_true_models:
+            print(m)
 
     return entailment_holds
 
+# ----- Formulas -----
+# A formula is a symbol name or a tuple: ('not', f), ('and', f, g, ...),
+# ('or', f, g, ...), ('implies', f, g) or ('iff', f, g).
+
+def evaluate(formula, model):
+    """Truth value of a formula in a model {symbol: bool}."""
+    if isinstance(formula, str):
+        return model[formula]
+    op, args = formula[0], formula[1:]
+    if op == 'not':
+        return not evaluate(args[0], model)
+    if op == 'and':
+        return all(evaluate(f, model) for f in args)
+    if op == 'or':
+        return any(evaluate(f, model) for f in args)
+    if op == 'implies':
+        return not evaluate(args[0], model) or evaluate(args[1], model)
+    if op == 'iff':
+        return evaluate(args[0], model) == evaluate(args[1], model)
+    raise ValueError(f"unknown connective {op!r}")
+
+def formula_symbols(formula):
+    """Sorted symbol names of a formula."""
+    found = set()
+    stack = [formula]
+    while stack:
+        f = stack.pop()
+        if isinstance(f, str):
+            found.add(f)
+        else:
+            stack.extend(f[1:])
+    return sorted(found)
+
+# ----- Tseitin CNF -----
+def tseitin(formula):
+    """Equisatisfiable CNF of a formula as DIMACS int clauses, plus {symbol: variable}.
+
+    Every connective gets a fresh variable defined by a few clauses, so the
+    CNF stays linear in the size of the formula instead of blowing up as
+    distributing | over & would; negation only flips a sign, and the root is
+    asserted by a unit clause. Symbols are numbered first, from 1.
+    """
+    ids = {name: i for i, name in enumerate(formula_symbols(formula), 1)}
+    top = len(ids)
+    clauses = []
+    lits = {}    # id(subformula) -> literal standing for it
+
+    def literal(f):
+        return ids[f] if isinstance(f, str) else lits[id(f)]
+
+    stack = [(formula, False)]
+    while stack:
+        f, ready = stack.pop()
+        if isinstance(f, str) or id(f) in lits:
+            continue
+        if not ready:
+            stack.append((f, True))
+            stack.extend((g, False) for g in f[1:])
+            continue
+        op = f[0]
+        children = [literal(g) for g in f[1:]]
+        if op == 'not':
+            lits[id(f)] = -children[0]
+            continue
+        if op == 'implies':
+            op, children = 'or', [-children[0], children[1]]
+        top += 1
+        v = top
+        if op == 'and':
+            clauses.extend((-v, c) for c in children)
+            clauses.append((v, *(-c for c in children)))
+        elif op == 'or':
+            clauses.extend((v, -c) for c in children)
+            clauses.append((-v, *children))
+        elif op == 'iff':
+            a, b = children
+            clauses.extend([(-v, -a, b), (-v, a, -b), (v, a, b), (v, -a, -b)])
+        else:
+            raise ValueError(f"unknown connective {op!r}")
+        lits[id(f)] = v
+    clauses.append((literal(formula),))
+    return clauses, ids
+
+# ----- CDCL entailment -----
+def sat_entails(kb, query):
+    """KB ⊨ query, decided as KB ∧ ¬query being unsatisfiable by the CDCL solver.
+
+    `kb` is a formula or a list of formulas (their conjunction).
+    """
+    if isinstance(kb, list):
+        kb = ('and', *kb)
+    clauses, _ = tseitin(('and', kb, ('not', query)))
+    return Solver(clauses).solve() is False
+
 # ----- Step 5: Run entailment check -----
-result = entails(KB, QUERY, symbols)
+if __name__ == "__main__":
+    result = entails(KB, QUERY, symbols)
+
+    print("\nRESULT:")
+    if result:
+        print("✅ Query is ENTAILED by the Knowledge Base.")
+    else:
+        print("❌ Query is NOT entailed by the Knowledge Base.")
+
+    # the same KB as a formula, decided by the CDCL solver
+    kb = ('and', ('implies', 'R', 'W'), 'R')
+    print(f"\nCDCL: KB ⊨ W? {sat_entails(kb, 'W')}   KB ⊨ ¬R? {sat_entails(kb, ('not', 'R'))}")
 
-print("\nRESULT:")
-if result:
-    print("✅ Query is ENTAILED by the Knowledge Base.")
-else:
-    print("❌ Query is NOT entailed by the Knowledge Base.")
+    # a chain of 500 implications: 2^500 rows for the truth table, a moment for CDCL
+    import time
+    chain = [f"P{i}" for i in range(500)]
+    kb = [chain[0]] + [('implies', a, b) for a, b in zip(chain, chain[1:])]
+    began = time.perf_counter()
+    print(f"CDCL: P0 ∧ (P0 → P1) ∧ ... ∧ (P498 → P499) ⊨ P499? {sat_entails(kb, chain[-1])} "
+          f"in {time.perf_counter() - began:.3f}s")
@@ -0,0 +1,198 @@
+"""Batch 8-puzzle solving over a process pool.
+
+Reads start/goal pairs from a JSONL or CSV file and writes one JSON line per
+instance, in input order:
+
+    {"index": 0, "solver": "astar", "moves": 5, "expanded": 6, "seconds": 0.0001}
+
+JSONL input lines look like {"start": [[2, 8, 3], [1, 6, 4], [7, 0, 5]], "goal": ...}
+(boards may also be flat lists of 9). CSV input needs a "start" column and an
+optional "goal" column, each holding the nine tiles, e.g. "283164705" or
+"2 8 3 1 6 4 7 0 5". A missing goal means the A* goal_state.
+
+    python puzzle_batch.py instances.jsonl --solver astar --workers 8 --chunksize 256
+"""
+
+import argparse
+import csv
+import importlib.util
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# ----- Solver loading (once per worker process) -----
+_modules = {}
+
+def load_script(filename):
+    """Import one of the lab scripts by file name (some names are not valid identifiers)."""
+    if filename not in _modules:
+        name = re.sub(r"\W", "_", os.path.splitext(filename)[0])
+        spec = importlib.util.spec_from_file_location(name, os.path.join(HERE, filename))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[filename] = module
+    return _modules[filename]
+
+def solve_astar(start, goal, options):
+    stats = {}
+    path = load_script("A_star.py").a_star(start, goal, stats=stats)
+    return (len(path) - 1 if path else None), stats.get("expanded", 0)
+
+def solve_bibfs(start, goal, options):
+    stats = {}
+    path = load_script("bidirectional_search.py").bidirectional_bfs(start, goal, stats=stats)
+    return (len(path) - 1 if path else None), stats.get("expanded", 0)
+
+def solve_biastar(start, goal, options):
+    stats = {}
+    path = load_script("bidirectional_search.py").bidirectional_a_star(start, goal, stats=stats)
+    return (len(path) - 1 if path else None), stats.get("expanded", 0)
+
+def solve_iddfs(start, goal, options):
+    stats = {}
+    path = load_script("8 puzzle_iddfs.py").iddfs(start, goal, options["max_depth"], stats=stats)
+    return (len(path) - 1 if path else None), stats.get("expanded", 0)
+
+def solve_dfs(start, goal, options):
+    stats = {}
+    path = load_script("8puzzle_dfs.py").dfs(start, goal, options["node_budget"],
+                                             options["memory_budget"], stats=stats)
+    return (len(path) - 1 if path else None), stats.get("expanded", 0)
+
+def solve_idastar(start, goal, options):
+    stats = {}
+    path = load_script("n_puzzle.py").ida_star(start, goal, stats=stats)
+    return (len(path) - 1 if path else None), stats.get("expanded", 0)
+
+def _solve_hill(filename, start, goal):
+    module = load_script(filename)
+    stats = {}
+    path = module.hill_climb(start, goal, stats=stats)
+    state = start
+    for direction in path:
+        state = module.move(state, direction)
+    return (len(path) if state == goal else None), stats.get("expanded", 0)
+
+def solve_hill_manhattan(start, goal, options):
+    return _solve_hill("hill_climbing_manhattan_distance.py", start, goal)
+
+def solve_hill_misplaced(start, goal, options):
+    return _solve_hill("hill_climbing_no_of_misplaced_tiles.py", start, goal)
+
+SOLVERS = {
+    "astar": ("A_star.py", solve_astar),
+    "idastar": ("n_puzzle.py", solve_idastar),
+    "bibfs": ("bidirectional_search.py", solve_bibfs),
+    "biastar": ("bidirectional_search.py", solve_biastar),
+    "iddfs": ("8 puzzle_iddfs.py", solve_iddfs),
+    "dfs": ("8puzzle_dfs.py", solve_dfs),
+    "hill-manhattan": ("hill_climbing_manhattan_distance.py", solve_hill_manhattan),
+    "hill-misplaced": ("hill_climbing_no_of_misplaced_tiles.py", solve_hill_misplaced),
+}
+
+_worker = {}
+
+def init_worker(solver, options):
+    """Process-pool initializer: import the solver so its goal tables are built once."""
+    load_script(SOLVERS[solver][0])
+    _worker["solve"] = SOLVERS[solver][1]
+    _worker["solver"] = solver
+    _worker["options"] = options
+    _worker["default_goal"] = load_script("A_star.py").goal_state
+
+def solve_chunk(chunk):
+    """Solve a list of (index, start, goal) instances inside a worker."""
+    solve = _worker["solve"]
+    options = _worker["options"]
+    results = []
+    for index, start, goal in chunk:
+        goal = goal or _worker["default_goal"]
+        began = time.perf_counter()
+        moves, expanded = solve(start, goal, options)
+        results.append({
+            "index": index,
+            "solver": _worker["solver"],
+            "moves": moves,
+            "expanded": expanded,
+            "seconds": round(time.perf_counter() - began, 6),
+        })
+    return results
+
+# ----- Input -----
+def to_board(value):
+    """Accept a 3x3 list, a flat list of 9 or a string of 9 digits."""
+    if isinstance(value, str):
+        value = [int(x) for x in re.findall(r"\d", value)]
+    elif value and isinstance(value[0], list):
+        value = [x for row in value for x in row]
+    if len(value) != 9 or sorted(value) != list(range(9)):
+        raise ValueError(f"not an 8-puzzle board: {value!r}")
+    return [list(value[0:3]), list(value[3:6]), list(value[6:9])]
+
+def read_instances(path):
+    """Yield (index, start, goal) from a JSONL or CSV file; goal is None when omitted."""
+    with open(path, newline="") as f:
+        if path.endswith(".csv"):
+            rows = csv.DictReader(f)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+        for index, row in enumerate(rows):
+            goal = row.get("goal")
+            yield index, to_board(row["start"]), (to_board(goal) if goal else None)
+
+# ----- Dispatch -----
+def solve_batch(instances, solver="astar", workers=None, chunksize=256, max_depth=20,
+                node_budget=None, memory_budget=None):
+    """Solve instances on a process pool and yield result dicts in input order.
+
+    Work is sent in chunks of `chunksize` instances and at most a few chunks per
+    worker are in flight, so arbitrarily large inputs stream with bounded memory.
+    """
+    if solver not in SOLVERS:
+        raise ValueError(f"unknown solver {solver!r}, choose from {sorted(SOLVERS)}")
+    workers = workers or os.cpu_count() or 1
+    options = {"max_depth": max_depth, "node_budget": node_budget, "memory_budget": memory_budget}
+    instances = iter(instances)
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(solver, options)) as pool:
+        pending = deque()
+        while True:
+            while len(pending) < 4 * workers:
+                chunk = list(islice(instances, chunksize))
+                if not chunk:
+                    break
+                pending.append(pool.submit(solve_chunk, chunk))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve a file of 8-puzzle instances in parallel.")
+    parser.add_argument("input", help="JSONL or CSV file of start/goal pairs")
+    parser.add_argument("--solver", choices=sorted(SOLVERS), default="astar")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunksize", type=int, default=256, help="instances per dispatched task")
+    parser.add_argument("--max-depth", type=int, default=20, help="depth limit for iddfs")
+    parser.add_argument("--node-budget", type=int, default=None, help="max states pushed by dfs")
+    parser.add_argument("--memory-budget", type=int, default=None, help="max visited states kept by dfs")
+    parser.add_argument("--output", default="-", help="output JSONL file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        results = solve_batch(read_instances(args.input), args.solver, args.workers,
+                              args.chunksize, args.max_depth, args.node_budget, args.memory_budget)
+        for result in results:
+            out.write(json.dumps(result) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+"""Conflict-driven clause learning (CDCL) SAT solver.
+
+Clauses are DIMACS-style sequences of non-zero ints: 3 is variable 3 and -3
+its negation. The search follows the MiniSat recipe:
+
+  * two watched literals per clause, so a clause is only looked at when one
+    of its two watched literals becomes false, and backtracking costs nothing;
+  * VSIDS branching: variables met in conflict analysis are bumped, every
+    activity decays geometrically, and the most active unassigned variable
+    is decided next, with the value it last had (phase saving);
+  * first-UIP conflict analysis with learnt-clause minimisation and
+    non-chronological backjumping;
+  * Luby restarts, with learnt clauses that span many decision levels
+    (high LBD) periodically forgotten.
+
+Internally literal v is 2v and -v is 2v + 1, so negation is `lit ^ 1` and
+values are looked up per literal.
+"""
+
+import heapq
+
+class Clause(list):
+    """Internal literals of a clause; the first two are the watched ones."""
+    __slots__ = ("learnt", "lbd", "deleted")
+
+    def __init__(self, lits, learnt=False, lbd=0):
+        super().__init__(lits)
+        self.learnt = learnt
+        self.lbd = lbd
+        self.deleted = False
+
+def luby(i):
+    """Term i (from 0) of the Luby sequence 1 1 2 1 1 2 4 1 1 2 ..."""
+    size, exponent = 1, 0
+    while size < i + 1:
+        exponent += 1
+        size = 2 * size + 1
+    while size - 1 != i:
+        size = (size - 1) >> 1
+        exponent -= 1
+        i %= size
+    return 1 << exponent
+
+class Solver:
+    """Incremental CDCL solver: add clauses, call solve(), read `model`."""
+
+    def __init__(self, clauses=(), num_vars=0, restart_base=100, var_decay=0.95):
+        self.num_vars = 0
+        self.value = [0, 0]      # per literal: 1 true, -1 false, 0 unassigned
+        self.level = [0]         # per variable
+        self.reason = [None]     # per variable: the clause that implied it
+        self.activity = [0.0]
+        self.phase = [False]     # per variable: last value it was assigned
+        self.seen = bytearray(1)
+        self.watches = [[], []]  # per literal: clauses watching it
+        self.clauses = []
+        self.learnts = []
+        self.trail = []
+        self.trail_lim = []      # trail length at each decision
+        self.qhead = 0
+        self.heap = []           # (-activity, var); stale entries are skipped
+        self.var_inc = 1.0
+        self.var_decay = var_decay
+        self.restart_base = restart_base
+        self.max_learnts = 0
+        self.ok = True           # False once the clauses are known to be unsatisfiable
+        self.model = None
+        self.stats = {"decisions": 0, "propagations": 0, "conflicts": 0, "restarts": 0, "learnt": 0}
+        self._grow(num_vars)
+        for clause in clauses:
+            self.add_clause(clause)
+
+    def _grow(self, num_vars):
+        extra = num_vars - self.num_vars
+        if extra <= 0:
+            return
+        self.value.extend([0] * (2 * extra))
+        self.level.extend([0] * extra)
+        self.reason.extend([None] * extra)
+        self.activity.extend([0.0] * extra)
+        self.phase.extend([False] * extra)
+        self.seen.extend(bytes(extra))
+        self.watches.extend([] for _ in range(2 * extra))
+        self.num_vars = num_vars
+
+    # ----- Clauses -----
+    def add_clause(self, clause):
+        """Add a clause of DIMACS ints; returns False once the clause set is unsatisfiable."""
+        if not self.ok:
+            return False
+        self._cancel_until(0)
+        lits = set()
+        for x in clause:
+            if x == 0:
+                raise ValueError("0 is not a literal")
+            self._grow(abs(x))
+            lit = 2 * abs(x) + (x < 0)
+            if lit ^ 1 in lits or self.value[lit] == 1:
+                return True      # a tautology, or already satisfied
+            if self.value[lit] == 0:
+                lits.add(lit)
+        if not lits:
+            self.ok = False
+        elif len(lits) == 1:
+            self._assign(lits.pop(), None)
+            self.ok = self._propagate() is None
+        else:
+            c = Clause(sorted(lits))
+            self.clauses.append(c)
+            self.watches[c[0]].append(c)
+            self.watches[c[1]].append(c)
+        return self.ok
+
+    # ----- Assignment -----
+    def _assign(self, lit, reason):
+        self.value[lit] = 1
+        self.value[lit ^ 1] = -1
+        var = lit >> 1
+        self.level[var] = len(self.trail_lim)
+        self.reason[var] = reason
+        self.trail.append(lit)
+
+    def _cancel_until(self, level):
+        if len(self.trail_lim) <= level:
+            return
+        start = self.trail_lim[level]
+        value, reason, phase, activity, heap = self.value, self.reason, self.phase, self.activity, self.heap
+        for lit in self.trail[start:]:
+            var = lit >> 1
+            value[lit] = value[lit ^ 1] = 0
+            reason[var] = None
+            phase[var] = not lit & 1
+            heapq.heappush(heap, (-activity[var], var))
+        del self.trail[start:]
+        del self.trail_lim[level:]
+        self.qhead = start
+
+    def _propagate(self):
+        """Unit propagation over the watch lists; returns a conflicting clause or None."""
+        value, watches, trail = self.value, self.watches, self.trail
+        while self.qhead < len(trail):
+            false_lit = trail[self.qhead] ^ 1
+            self.qhead += 1
+            self.stats["propagations"] += 1
+            watchers = watches[false_lit]
+            kept = []
+            i, n = 0, len(watchers)
+            while i < n:
+                clause = watchers[i]
+                i += 1
+                if clause.deleted:
+                    continue
+                if clause[0] == false_lit:
+                    clause[0], clause[1] = clause[1], false_lit
+                first = clause[0]
+                if value[first] == 1:
+                    kept.append(clause)
+                    continue
+                for k in range(2, len(clause)):
+                    lit = clause[k]
+                    if value[lit] != -1:
+                        clause[1], clause[k] = lit, false_lit
+                        watches[lit].append(clause)
+                        break
+                else:
+                    kept.append(clause)
+                    if value[first] == -1:
+                        kept.extend(watchers[i:])
+                        watches[false_lit] = kept
+                        return clause
+                    self._assign(first, clause)
+            watches[false_lit] = kept
+        return None
+
+    # ----- Conflict analysis -----
+    def _bump(self, var):
+        self.activity[var] += self.var_inc
+        if self.activity[var] > 1e100:
+            self.activity = [a * 1e-100 for a in self.activity]
+            self.var_inc *= 1e-100
+            self.heap = [(-self.activity[v], v) for v in range(1, self.num_vars + 1) if not self.value[2 * v]]
+            heapq.heapify(self.heap)
+        elif not self.value[2 * var]:
+            heapq.heappush(self.heap, (-self.activity[var], var))
+
+    def _analyze(self, conflict):
+        """First-UIP learnt clause (asserting literal first), backjump level and LBD."""
+        seen, level, trail, reason = self.seen, self.level, self.trail, self.reason
+        current = len(self.trail_lim)
+        learnt = [0]
+        pending = 0              # seen literals of the current level not yet resolved away
+        lit = -1
+        index = len(trail) - 1
+        clause = conflict
+        while True:
+            for q in (clause if lit < 0 else clause[1:]):  # a reason's first literal is the one it implied
+                var = q >> 1
+                if not seen[var] and level[var] > 0:
+                    seen[var] = 1
+                    self._bump(var)
+                    if level[var] >= current:
+                        pending += 1
+                    else:
+                        learnt.append(q)
+            while not seen[trail[index] >> 1]:
+                index -= 1
+            lit = trail[index]
+            index -= 1
+            clause = reason[lit >> 1]
+            seen[lit >> 1] = 0
+            pending -= 1
+            if pending == 0:
+                break
+        learnt[0] = lit ^ 1
+
+        # drop literals whose reason lies entirely inside the learnt clause
+        kept = [learnt[0]]
+        for q in learnt[1:]:
+            r = reason[q >> 1]
+            if r is None or any(not seen[x >> 1] and level[x >> 1] > 0 for x in r[1:]):
+                kept.append(q)
+        for q in learnt[1:]:
+            seen[q >> 1] = 0
+        learnt = kept
+
+        if len(learnt) == 1:
+            return learnt, 0, 1
+        top = max(range(1, len(learnt)), key=lambda k: level[learnt[k] >> 1])
+        learnt[1], learnt[top] = learnt[top], learnt[1]
+        return learnt, level[learnt[1] >> 1], len({level[q >> 1] for q in learnt})
+
+    def _reduce(self):
+        """Forget the half of the learnt clauses with the highest LBD, keeping reasons and glue clauses."""
+        self.learnts.sort(key=lambda c: c.lbd)
+        for c in self.learnts[len(self.learnts) // 2:]:
+            locked = self.reason[c[0] >> 1] is c and self.value[c[0]] == 1
+            if c.lbd > 2 and not locked:
+                c.deleted = True   # dropped from the watch lists as propagation meets it
+        self.learnts = [c for c in self.learnts if not c.deleted]
+
+    # ----- Search -----
+    def _search(self, budget):
+        """CDCL until a model, a refutation (True/False) or `budget` conflicts (None)."""
+        conflicts = 0
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                conflicts += 1
+                self.stats["conflicts"] += 1
+                if not self.trail_lim:
+                    return False
+                learnt, back, lbd = self._analyze(conflict)
+                self._cancel_until(back)
+                if len(learnt) == 1:
+                    self._assign(learnt[0], None)
+                else:
+                    c = Clause(learnt, learnt=True, lbd=lbd)
+                    self.learnts.append(c)
+                    self.watches[c[0]].append(c)
+                    self.watches[c[1]].append(c)
+                    self._assign(learnt[0], c)
+                self.stats["learnt"] += 1
+                self.var_inc /= self.var_decay
+                continue
+            if conflicts and conflicts >= budget:
+                self._cancel_until(0)
+                return None
+            if len(self.learnts) - len(self.trail) >= self.max_learnts:
+                self._reduce()
+            lit = self._decide()
+            if lit is None:
+                return True
+            self.stats["decisions"] += 1
+            self.trail_lim.append(len(self.trail))
+            self._assign(lit, None)
+
+    def _decide(self):
+        value, heap = self.value, self.heap
+        while heap:
+            var = heapq.heappop(heap)[1]
+            if not value[2 * var]:
+                return 2 * var + (not self.phase[var])
+        return None
+
+    def solve(self, max_conflicts=None):
+        """True (satisfiable, see `model`), False (unsatisfiable) or None if
+        `max_conflicts` ran out first."""
+        self.model = None
+        if not self.ok:
+            return False
+        self._cancel_until(0)
+        if self._propagate() is not None:
+            self.ok = False
+            return False
+        self.heap = [(-self.activity[v], v) for v in range(1, self.num_vars + 1) if not self.value[2 * v]]
+        heapq.heapify(self.heap)
+        self.max_learnts = max(len(self.clauses) / 3, 100)
+        status, restarts, start = None, 0, self.stats["conflicts"]
+        while status is None:
+            budget = luby(restarts) * self.restart_base
+            if max_conflicts is not None:
+                left = max_conflicts - (self.stats["conflicts"] - start)
+                if left <= 0 and restarts:
+                    break
+                budget = min(budget, left)
+            status = self._search(budget)
+            if status is None:
+                restarts += 1
+                self.stats["restarts"] += 1
+                self.max_learnts *= 1.1
+        if status:
+            self.model = {v: self.value[2 * v] == 1 for v in range(1, self.num_vars + 1)}
+        elif status is False:
+            self.ok = False
+        self._cancel_until(0)
+        return status
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # random 3-SAT at the satisfiability threshold (4.26 clauses per variable)
+    rng = random.Random(0)
+    for n in (50, 100, 150, 200):
+        clauses = [[v if rng.random() < 0.5 else -v for v in rng.sample(range(1, n + 1), 3)]
+                   for _ in range(int(4.26 * n))]
+        solver = Solver(clauses)
+        began = time.perf_counter()
+        result = solver.solve()
+        elapsed = time.perf_counter() - began
+        if result:
+            assert all(any(solver.model[abs(x)] == (x > 0) for x in c) for c in clauses)
+        print(f"{n} variables, {len(clauses)} clauses: {'SAT' if result else 'UNSAT'} in {elapsed:.2f}s "
+              f"({solver.stats['conflicts']} conflicts, {solver.stats['restarts']} restarts)")
@@ -0,0 +1,66 @@
+import random
+from collections import deque
+
+import pytest
+
+from A_star import a_star, goal_state, pack_state, unpack_state
+
+def flat(board):
+    return tuple(tile for row in board for tile in row)
+
+def slides(cells):
+    blank = cells.index(0)
+    r, c = divmod(blank, 3)
+    for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        if 0 <= r + dr < 3 and 0 <= c + dc < 3:
+            other = 3 * (r + dr) + c + dc
+            board = list(cells)
+            board[blank], board[other] = board[other], 0
+            yield tuple(board)
+
+def bfs_distance(start, goal):
+    start, goal = flat(start), flat(goal)
+    depth = {start: 0}
+    queue = deque([start])
+    while queue:
+        cells = queue.popleft()
+        if cells == goal:
+            return depth[cells]
+        for other in slides(cells):
+            if other not in depth:
+                depth[other] = depth[cells] + 1
+                queue.append(other)
+    return None
+
+def random_board(rng, goal=goal_state, walk=40):
+    cells = flat(goal)
+    for _ in range(walk):
+        cells = rng.choice(list(slides(cells)))
+    return [list(cells[i:i + 3]) for i in range(0, 9, 3)]
+
+def assert_valid_path(path, start, goal):
+    assert path[0] == start and path[-1] == goal
+    for before, after in zip(path, path[1:]):
+        assert flat(after) in set(slides(flat(before)))
+
+def test_pack_round_trip():
+    board = [[5, 6, 7], [4, 0, 8], [3, 2, 1]]
+    assert unpack_state(pack_state(board)) == board
+
+@pytest.mark.parametrize("seed", range(3))
+def test_a_star_is_optimal(seed):
+    rng = random.Random(seed)
+    for _ in range(10):
+        start = random_board(rng)
+        path = a_star(start)
+        assert_valid_path(path, start, goal_state)
+        assert len(path) - 1 == bfs_distance(start, goal_state)
+
+def test_a_star_with_other_goal():
+    goal = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+    start = random_board(random.Random(7), goal)
+    stats = {}
+    path = a_star(start, goal=goal, stats=stats)
+    assert_valid_path(path, start, goal)
+    assert len(path) - 1 == bfs_distance(start, goal)
+    assert stats["expanded"] >= len(path)
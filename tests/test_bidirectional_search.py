@@ -0,0 +1,21 @@
+import random
+
+import pytest
+
+from A_star import goal_state
+from bidirectional_search import bidirectional_a_star, bidirectional_bfs
+from test_a_star import assert_valid_path, bfs_distance, random_board
+
+@pytest.mark.parametrize("search", [bidirectional_bfs, bidirectional_a_star])
+def test_bidirectional_search_is_optimal(search):
+    rng = random.Random(0)
+    for walk in (0, 1, 2, 40, 40, 40, 80):
+        start = random_board(rng, walk=walk)
+        path = search(start, goal_state)
+        assert_valid_path(path, start, goal_state)
+        assert len(path) - 1 == bfs_distance(start, goal_state)
+
+@pytest.mark.parametrize("search", [bidirectional_bfs, bidirectional_a_star])
+def test_unsolvable_board(search):
+    start = [[2, 1, 3], [8, 0, 4], [7, 6, 5]]
+    assert search(start, goal_state) is None
@@ -0,0 +1,21 @@
+import random
+
+from A_star import goal_state
+from puzzle_batch import load_script
+from test_a_star import assert_valid_path, random_board
+
+dfs = load_script("8puzzle_dfs.py").dfs
+
+def test_dfs_finds_a_valid_path():
+    start = random_board(random.Random(0), walk=10)
+    stats = {}
+    path = dfs(start, goal_state, stats=stats)
+    assert_valid_path(path, start, goal_state)
+    assert stats["stopped"] is None
+
+def test_dfs_stops_at_its_budgets():
+    start = [[2, 1, 3], [8, 0, 4], [7, 6, 5]]  # unsolvable, so only a budget stops it
+    for budget in ("node_budget", "memory_budget"):
+        stats = {}
+        assert dfs(start, goal_state, stats=stats, **{budget: 500}) is None
+        assert stats["stopped"] == budget.replace("_", " ")
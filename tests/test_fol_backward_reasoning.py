@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from FOL_Backward_reasoning import BackwardChainer
+from FOL_Forward_reasoning import FOLKB, Rule
+from test_fol_forward_reasoning import CONSTANTS, PREDICATES, build, naive_closure, random_program
+
+def random_query(rng):
+    pred, arity = rng.choice(PREDICATES)
+    return (pred, tuple(rng.choice(CONSTANTS + ("u", "v", "u")) for _ in range(arity)))
+
+def expected_answers(closure, query):
+    pred, args = query
+    answers = set()
+    for fact_pred, values in closure:
+        if fact_pred != pred or len(values) != len(args):
+            continue
+        theta = {}
+        if all(theta.setdefault(a, v) == v if a.islower() else a == v for a, v in zip(args, values)):
+            answers.add(tuple(sorted(theta.items())))
+    return answers
+
+@pytest.mark.parametrize("seed", range(5))
+def test_ask_matches_the_naive_fixpoint(seed):
+    rng = random.Random(seed)
+    for _ in range(30):
+        rules, facts = random_program(rng)
+        chainer = BackwardChainer(build(FOLKB(), rules, facts))
+        closure = naive_closure(rules, facts)
+        for _ in range(5):
+            query = random_query(rng)
+            answers = {tuple(sorted(theta.items())) for theta in chainer.ask(query)}
+            assert answers == expected_answers(closure, query)
+            assert chainer.prove(query) == bool(answers)
+
+def test_left_recursive_transitive_closure_terminates():
+    kb = FOLKB()
+    for a, b in (("A", "B"), ("B", "C"), ("C", "A"), ("C", "D")):
+        kb.add_fact(("Edge", (a, b)))
+    kb.add_rule(Rule([("Path", ("x", "y")), ("Edge", ("y", "z"))], ("Path", ("x", "z"))))
+    kb.add_rule(Rule([("Edge", ("x", "y"))], ("Path", ("x", "y"))))
+    chainer = BackwardChainer(kb)
+    assert {theta["y"] for theta in chainer.ask(("Path", ("A", "y")))} == {"A", "B", "C", "D"}
+    assert not chainer.prove(("Path", ("D", "A")))
+
+def test_tables_are_dropped_when_the_kb_grows():
+    kb = FOLKB()
+    kb.add_fact(("Edge", ("A", "B")))
+    kb.add_rule(Rule([("Edge", ("x", "y"))], ("Path", ("x", "y"))))
+    chainer = BackwardChainer(kb)
+    assert not chainer.prove(("Path", ("B", "C")))
+    kb.add_fact(("Edge", ("B", "C")))
+    assert chainer.prove(("Path", ("B", "C")))
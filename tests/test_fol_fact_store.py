@@ -0,0 +1,44 @@
+import random
+
+from FOL_fact_store import FactStore
+
+def test_store_behaves_like_a_set_in_insertion_order():
+    rng = random.Random(0)
+    store, reference = FactStore(), []
+    for _ in range(500):
+        atom = (rng.choice("PQR"), tuple(rng.choice("ABCDE") for _ in range(rng.randint(0, 3))))
+        fid = store.add(atom)
+        if atom in reference:
+            assert fid is None
+        else:
+            assert fid == len(reference)
+            reference.append(atom)
+    assert list(store) == reference
+    assert len(store) == len(reference)
+    assert all(atom in store for atom in reference)
+    assert ("P", ("Z",)) not in store and ("S", ()) not in store
+    assert [store.fact(fid) for fid in range(len(store))] == reference
+
+def test_index_and_prefix_lookups():
+    store = FactStore()
+    atoms = [("Edge", (a, b)) for a, b in ("AB", "BC", "AC", "CA", "AA")]
+    for atom in atoms:
+        store.add(atom)
+    store.add(("Node", ("A",)))
+    pred, values = store.encode(("Edge", ("A", "A")))
+    rel = store.relation(pred, 2)
+    a = store.symbols.get("A")
+    assert [rel.row(r)[0] for r in rel.rows_with(0, a)] == [a, a, a]
+    assert rel.rows_between(0, 3) == (0, 3)
+    assert rel.rows_between(3, len(store)) == (3, 5)
+
+def test_load_csv_and_tsv(tmp_path):
+    csv = tmp_path / "facts.csv"
+    csv.write_text("Parent, Tom, Bob\nParent,Bob,Ann\n\nParent,Tom,Bob\n")
+    tsv = tmp_path / "edges.tsv"
+    tsv.write_text("A\tB\nB\tC\n")
+    store = FactStore()
+    assert store.load(str(csv)) == 2
+    assert store.load(str(tsv), pred="Edge") == 2
+    assert set(store) == {("Parent", ("Tom", "Bob")), ("Parent", ("Bob", "Ann")),
+                          ("Edge", ("A", "B")), ("Edge", ("B", "C"))}
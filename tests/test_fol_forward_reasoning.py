@@ -0,0 +1,118 @@
+import itertools
+import random
+
+import pytest
+
+from FOL_Forward_reasoning import FOLKB, ReteKB, Rule
+
+CONSTANTS = ("A", "B", "C")
+VARIABLES = ("x", "y", "z")
+PREDICATES = (("E", 2), ("F", 1), ("P", 2), ("Q", 1), ("R", 2))  # E and F only hold given facts
+
+def random_program(rng, recursive=True, num_rules=5, num_facts=12):
+    """Random range-restricted rules and ground facts. Without `recursive`,
+    a rule's head predicate comes after every body predicate."""
+    facts = set()
+    for _ in range(num_facts):
+        pred, arity = rng.choice(PREDICATES[:2])
+        facts.add((pred, tuple(rng.choice(CONSTANTS) for _ in range(arity))))
+    rules = []
+    while len(rules) < num_rules:
+        h = rng.randrange(2, len(PREDICATES))
+        allowed = PREDICATES if recursive else PREDICATES[:h]
+        body = [(pred, tuple(rng.choice(VARIABLES + CONSTANTS[:1]) for _ in range(arity)))
+                for pred, arity in (rng.choice(allowed) for _ in range(rng.randint(1, 3)))]
+        bound = sorted({a for _, args in body for a in args if a in VARIABLES})
+        if not bound:
+            continue
+        pred, arity = PREDICATES[h]
+        rules.append(Rule(body, (pred, tuple(rng.choice(bound + ["A"]) for _ in range(arity)))))
+    return rules, facts
+
+def naive_closure(rules, facts):
+    """Fixpoint by trying every assignment of constants to each rule's variables."""
+    closure = set(facts)
+    while True:
+        new = set()
+        for rule in rules:
+            names = sorted({a for _, args in rule.antecedents for a in args if a in VARIABLES})
+            for values in itertools.product(CONSTANTS, repeat=len(names)):
+                theta = dict(zip(names, values))
+                ground = lambda atom: (atom[0], tuple(theta.get(a, a) for a in atom[1]))
+                if all(ground(atom) in closure for atom in rule.antecedents):
+                    new.add(ground(rule.consequent))
+        if new <= closure:
+            return closure
+        closure |= new
+
+def build(kb, rules, facts):
+    for fact in sorted(facts):
+        kb.add_fact(fact)
+    for rule in rules:
+        kb.add_rule(rule)
+    return kb
+
+@pytest.mark.parametrize("seed", range(5))
+def test_forward_chain_reaches_the_naive_fixpoint(seed):
+    rng = random.Random(seed)
+    for _ in range(40):
+        rules, facts = random_program(rng)
+        kb = build(FOLKB(), rules, facts)
+        assert kb.forward_chain() is True
+        assert set(kb.facts) == naive_closure(rules, facts)
+
+def test_facts_added_after_chaining_are_joined_with_old_ones():
+    rng = random.Random(10)
+    for _ in range(40):
+        rules, facts = random_program(rng)
+        facts = sorted(facts)
+        kb = build(FOLKB(), rules, facts[:len(facts) // 2])
+        kb.forward_chain()
+        for fact in facts[len(facts) // 2:]:
+            kb.add_fact(fact)
+        kb.forward_chain()
+        assert set(kb.facts) == naive_closure(rules, set(facts))
+
+def test_query_and_provenance():
+    kb = FOLKB(provenance=True)
+    kb.add_fact(("Owns", ("A", "T1")))
+    kb.add_fact(("Missile", ("T1",)))
+    kb.add_fact(("American", ("Robert",)))
+    kb.add_fact(("Enemy", ("A", "America")))
+    kb.add_rule(Rule([("Missile", ("x",))], ("Weapon", ("x",))))
+    kb.add_rule(Rule([("Enemy", ("x", "America"))], ("Hostile", ("x",))))
+    kb.add_rule(Rule([("Missile", ("x",)), ("Owns", ("A", "x"))], ("Sells", ("Robert", "x", "A"))))
+    kb.add_rule(Rule([("American", ("p",)), ("Weapon", ("q",)), ("Sells", ("p", "q", "r")),
+                      ("Hostile", ("r",))], ("Criminal", ("p",))))
+    assert kb.forward_chain(query=("Criminal", ("Robert",)))
+    assert list(kb.matching(("Criminal", ("who",)))) == [("Criminal", ("Robert",))]
+    assert any("Criminal" in step and "from rule" in step for step in kb.derived_steps)
+    assert not kb.forward_chain(query=("Criminal", ("A",)))
+
+@pytest.mark.parametrize("seed", range(5))
+def test_rete_stays_at_the_fixpoint_whatever_the_order(seed):
+    rng = random.Random(100 + seed)
+    for _ in range(40):
+        rules, facts = random_program(rng)
+        facts = sorted(facts)
+        rete = ReteKB()
+        for fact in facts[::2]:
+            rete.add_fact(fact)
+        for rule in rules:
+            rete.add_rule(rule)
+        for fact in facts[1::2]:
+            rete.add_fact(fact)
+        assert set(rete.facts) == naive_closure(rules, set(facts))
+
+@pytest.mark.parametrize("seed", range(5))
+def test_rete_retraction_matches_a_rebuild(seed):
+    # without recursive rules no fact can keep itself alive through a cycle
+    rng = random.Random(200 + seed)
+    for _ in range(40):
+        rules, facts = random_program(rng, recursive=False)
+        rete = build(ReteKB(), rules, facts)
+        for fact in rng.sample(sorted(facts), len(facts) // 2):
+            assert rete.retract_fact(fact)
+            facts.discard(fact)
+            assert set(rete.facts) == naive_closure(rules, facts)
+        assert not rete.retract_fact(("Missing", ("A",)))
@@ -0,0 +1,29 @@
+import random
+
+import pytest
+
+from FOL_Forward_reasoning import FOLKB, Rule
+from FOL_parallel_chaining import parallel_forward_chain
+from test_fol_forward_reasoning import build, random_program
+
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_parallel_run_is_identical_to_serial(workers):
+    rng = random.Random(workers)
+    for _ in range(8):
+        rules, facts = random_program(rng, num_facts=20)
+        serial = build(FOLKB(provenance=True), rules, facts)
+        serial.forward_chain()
+        parallel = build(FOLKB(provenance=True), rules, facts)
+        assert parallel_forward_chain(parallel, workers) is True
+        assert list(parallel.facts) == list(serial.facts)
+        assert parallel.provenance == serial.provenance
+
+def test_query_stops_the_rounds():
+    kb = FOLKB()
+    for a in range(30):
+        kb.add_fact(("Edge", (f"N{a}", f"N{a + 1}")))
+    kb.add_rule(Rule([("Edge", ("x", "y"))], ("Path", ("x", "y"))))
+    kb.add_rule(Rule([("Path", ("x", "y")), ("Edge", ("y", "z"))], ("Path", ("x", "z"))))
+    assert parallel_forward_chain(kb, 2, query=("Path", ("N0", "N3")))
+    assert ("Path", ("N0", "N30")) not in kb.facts
+    assert not parallel_forward_chain(kb, 2, query=("Path", ("N3", "N0")))
@@ -0,0 +1,76 @@
+import itertools
+import random
+
+import pytest
+
+from FOL_term_index import STAR, DiscriminationTree, flatten, preorder_keys
+from Unification_in_FOL import CONST, FUNC, VAR, Term, parse_term, unify
+
+def random_term(rng, variables, depth=3):
+    if depth == 0 or rng.random() < 0.3:
+        return Term(VAR, next(variables)) if rng.random() < 0.3 else Term(CONST, rng.choice("AB"))
+    name, arity = rng.choice((("f", 1), ("g", 2)))
+    return Term(FUNC, name, tuple(random_term(rng, variables, depth - 1) for _ in range(arity)))
+
+def match(pattern, term, subs=None):
+    """One-way matching: a substitution of pattern's variables that yields term, or None."""
+    subs = {} if subs is None else subs
+    if pattern.kind == VAR:
+        if subs.setdefault(pattern.name, term) is not term:
+            return None
+        return subs
+    if pattern.kind != term.kind or pattern.name != term.name or len(pattern.args) != len(term.args):
+        return None
+    for p, t in zip(pattern.args, term.args):
+        if match(p, t, subs) is None:
+            return None
+    return subs
+
+def test_preorder_keys_and_subterm_ends():
+    keys, ends = flatten(parse_term("f(x, g(A))"))
+    assert keys == preorder_keys(parse_term("f(y, g(A))"))
+    assert keys == [(FUNC, "f", 2), STAR, (FUNC, "g", 1), (CONST, "A", 0)]
+    assert ends == [4, 2, 4, 4]
+
+@pytest.mark.parametrize("seed", range(4))
+def test_retrieval_matches_brute_force_on_linear_terms(seed):
+    # every variable occurs once, so the tree's candidates are exact
+    rng = random.Random(seed)
+    stored_vars = (f"v{i}" for i in itertools.count())
+    query_vars = (f"q{i}" for i in itertools.count())
+    terms = {random_term(rng, stored_vars) for _ in range(300)}
+    tree = DiscriminationTree()
+    for t in terms:
+        tree.insert(t, str(t))
+    assert len(tree) == len(terms)
+    for _ in range(50):
+        q = random_term(rng, query_vars)
+        assert {t for t, _ in tree.unifiable(q)} == {t for t in terms if unify(q, t) is not None}
+        assert {t for t, _ in tree.instances(q)} == {t for t in terms if match(q, t) is not None}
+        assert {t for t, _ in tree.generalizations(q)} == {t for t in terms if match(t, q) is not None}
+
+def test_repeated_variables_give_a_superset():
+    rng = random.Random(7)
+    terms = {random_term(rng, itertools.cycle("uv")) for _ in range(300)}
+    tree = DiscriminationTree()
+    for t in terms:
+        tree.insert(t)
+    for _ in range(50):
+        q = random_term(rng, itertools.cycle("xy"))
+        candidates = {t for t, _ in tree.unifiable(q)}
+        assert candidates >= {t for t in terms if unify(q, t) is not None}
+
+def test_insert_and_delete():
+    tree = DiscriminationTree()
+    a, b = parse_term("f(x, A)"), parse_term("f(B, A)")
+    tree.insert(a, 1)
+    tree.insert(a, 2)
+    tree.insert(a, 2)
+    tree.insert(b)
+    assert len(tree) == 3 and a in tree and b in tree
+    assert sorted(v for _, v in tree.generalizations(b) if v) == [1, 2]
+    assert tree.delete(a, 1) and not tree.delete(a, 1)
+    assert tree.delete(a, 2)
+    assert a not in tree and len(tree) == 1
+    assert tree.delete(b) and tree.root == {}
+    assert not tree.delete(parse_term("g(A)"))
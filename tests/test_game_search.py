@@ -0,0 +1,113 @@
+import math
+import time
+
+from game_search import AlphaBetaSearch, Game
+from mnk_game import AIPlayer, MNKGame
+
+def test_tic_tac_toe_is_a_draw():
+    engine = AlphaBetaSearch(MNKGame(3, 3, 3, radius=2))
+    move, value, depth = engine.search(9)
+    assert value == 0
+    assert move is not None
+
+def test_forced_win_is_found():
+    game = MNKGame(3, 3, 3, radius=2)
+    for move in (0, 3, 1, 4):  # X to move completes the top row at 2
+        game.apply(move)
+    move, value, _ = AlphaBetaSearch(game).search(3)
+    assert move == 2
+    assert value > 0
+
+def test_consecutive_timed_searches_stay_within_budget():
+    game = MNKGame(15, 15, 5)
+    player = AIPlayer(game, time_limit=0.5, max_depth=30)
+    game.apply(player.choose()[0])
+    # a shorter second search must not wait for the first one's node count
+    player.time_limit = 0.1
+    began = time.perf_counter()
+    player.choose()
+    assert time.perf_counter() - began < 0.1 + 0.1
+
+def test_start_clock_resets_the_check_schedule():
+    engine = AlphaBetaSearch(MNKGame(3, 3, 3))
+    engine.nodes, engine.next_check = 5000, 5000
+    engine.reset_stats()
+    assert engine.next_check == 0
+    engine.start_clock(1.0)
+    assert engine.next_check == 0 and not math.isinf(engine.deadline)
+
+class SlowGame(Game):
+    """Endless three-way branching game whose leaves take a millisecond to score."""
+
+    def __init__(self):
+        self.path = []
+
+    def moves(self):
+        return [0, 1, 2]
+
+    def apply(self, move):
+        self.path.append(move)
+
+    def undo(self, move):
+        self.path.pop()
+
+    def is_terminal(self):
+        return False
+
+    def evaluate(self):
+        time.sleep(0.001)
+        return sum(self.path) % 7
+
+    def key(self):
+        return hash(tuple(self.path))
+
+def test_deadline_holds_when_nodes_are_slow():
+    engine = AlphaBetaSearch(SlowGame())
+    began = time.perf_counter()
+    engine.search(20, time_limit=0.1)
+    assert time.perf_counter() - began < 0.1 + 0.05
+
+class RandomTree(Game):
+    """Uniform tree of depth `height` with pseudo-random leaf scores; some
+    positions are reachable by several move orders, so the table gets hits."""
+
+    def __init__(self, seed, branching=3, height=5):
+        self.seed, self.branching, self.height = seed, branching, height
+        self.path = []
+
+    def moves(self):
+        return list(range(self.branching))
+
+    def apply(self, move):
+        self.path.append(move)
+
+    def undo(self, move):
+        self.path.pop()
+
+    def is_terminal(self):
+        return len(self.path) == self.height
+
+    def evaluate(self):
+        return hash((self.seed, tuple(sorted(self.path)), len(self.path) % 2)) % 201 - 100
+
+    def key(self):
+        return hash((tuple(sorted(self.path)), len(self.path)))
+
+def negamax(game, depth):
+    if depth == 0 or game.is_terminal():
+        return game.evaluate()
+    best = -math.inf
+    for move in game.moves():
+        game.apply(move)
+        best = max(best, -negamax(game, depth - 1))
+        game.undo(move)
+    return best
+
+def test_search_matches_plain_negamax():
+    for seed in range(30):
+        game = RandomTree(seed)
+        engine = AlphaBetaSearch(game)
+        _, value, depth = engine.search(5)
+        assert depth == 5
+        assert value == negamax(game, 5)
+        assert engine.stats()["nodes"] > 0
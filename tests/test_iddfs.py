@@ -0,0 +1,28 @@
+import random
+
+from A_star import goal_state
+from puzzle_batch import load_script
+from test_a_star import assert_valid_path, bfs_distance, random_board
+
+iddfs_module = load_script("8 puzzle_iddfs.py")
+
+def test_iddfs_is_optimal():
+    rng = random.Random(1)
+    for _ in range(10):
+        start = random_board(rng, walk=16)
+        path = iddfs_module.iddfs(start, goal_state, 20)
+        assert_valid_path(path, start, goal_state)
+        assert len(path) - 1 == bfs_distance(start, goal_state)
+
+def test_iddfs_is_optimal_with_a_tiny_table():
+    # evictions only cost pruning, never the shortest solution
+    start = random_board(random.Random(2), walk=16)
+    path = iddfs_module.iddfs(start, goal_state, 20, table_size=8)
+    assert len(path) - 1 == bfs_distance(start, goal_state)
+
+def test_transposition_table_is_bounded():
+    table = iddfs_module.TranspositionTable(capacity=3)
+    for code in range(10):
+        assert table.visit(code, 1, 0)
+    assert len(table.entries) == 3
+    assert not table.visit(9, 2, 0)
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from A_star import goal_state
+from local_search import HEURISTICS, parallel_restarts, random_restarts
+from n_puzzle import flatten
+from test_a_star import random_board
+
+def replay(board, directions):
+    board = flatten(board)
+    step = {"up": -3, "down": 3, "left": -1, "right": 1}
+    for direction in directions:
+        blank = board.index(0)
+        cell = blank + step[direction]
+        assert 0 <= cell < 9 and (direction in ("up", "down") or cell // 3 == blank // 3)
+        board[blank], board[cell] = board[cell], 0
+    return board
+
+def score(board, heuristic):
+    table = HEURISTICS[heuristic](flatten(goal_state))
+    return sum(table[tile][k] for k, tile in enumerate(board) if tile)
+
+@pytest.mark.parametrize("strategy", ["hill", "first-choice", "annealing"])
+@pytest.mark.parametrize("heuristic", ["manhattan", "misplaced"])
+def test_reported_path_reaches_the_reported_h(strategy, heuristic):
+    rng = random.Random(0)
+    options = {} if strategy == "annealing" else {"sideways": 5}
+    for _ in range(5):
+        start = random_board(rng, walk=20)
+        result = random_restarts(start, goal_state, heuristic=heuristic, strategy=strategy,
+                                 restarts=20, seed=1, **options)
+        end = replay(start, result["path"])
+        assert score(end, heuristic) == result["h"]
+        assert result["solved"] == (end == flatten(goal_state))
+
+def test_restarts_solve_a_short_instance():
+    start = random_board(random.Random(1), walk=10)
+    result = random_restarts(start, goal_state, restarts=200, sideways=10, seed=0)
+    assert result["solved"]
+    assert replay(start, result["path"]) == flatten(goal_state)
+
+def test_zero_restarts_and_no_time_still_climb_once():
+    start = random_board(random.Random(2), walk=20)
+    result = random_restarts(start, goal_state, restarts=0, time_limit=0, seed=0)
+    assert result["restarts"] == 1
+    assert score(replay(start, result["path"]), "manhattan") == result["h"]
+
+def test_parallel_restarts():
+    start = random_board(random.Random(3), walk=10)
+    result = parallel_restarts(start, goal_state, workers=2, restarts=100, seed=0, sideways=10)
+    assert result["restarts"] == 100
+    assert result["solved"] and replay(start, result["path"]) == flatten(goal_state)
@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from mnk_game import EMPTY, O, X, MNKGame
+
+def recomputed(game):
+    """Score, winner and neighbour counts of the current cells, from scratch."""
+    score, winner = 0, None
+    for window in game.windows:
+        stones = [game.cells[c] for c in window]
+        counts = [0, stones.count(X), stones.count(O)]
+        score += game._value(counts)
+        for player in (X, O):
+            if counts[player] == game.k:
+                winner = player
+    near = [sum(game.cells[a] != EMPTY for a in game.around[c]) for c in range(game.m * game.n)]
+    return score, winner, near
+
+@pytest.mark.parametrize("shape", [(3, 3, 3), (6, 7, 4), (9, 9, 5)])
+def test_incremental_state_matches_a_recount(shape):
+    rng = random.Random(sum(shape))
+    game = MNKGame(*shape, radius=2)
+    start_key = game.key()
+    for _ in range(20):
+        played = []
+        while not game.is_terminal():
+            move = rng.choice([c for c in range(game.m * game.n) if game.cells[c] == EMPTY])
+            game.apply(move)
+            played.append(move)
+            assert recomputed(game) == (game.score, game.winner, game.near)
+        for move in reversed(played[rng.randrange(len(played) + 1):]):
+            game.undo(move)
+            assert recomputed(game) == (game.score, game.winner, game.near)
+        while game.history:
+            game.undo(game.history[-1][0])
+        assert game.key() == start_key and game.player == X
+
+def test_moves_are_empty_neighbours_threats_first():
+    game = MNKGame(7, 7, 4)
+    assert game.moves() == [3 * 7 + 3]
+    for move in (24, 0, 25, 6, 26):   # X has three in a row on the middle row
+        game.apply(move)
+    moves = game.moves()
+    assert set(moves) == set(game.playout_moves())
+    assert all(game.cells[c] == EMPTY and game.near[c] for c in moves)
+    assert set(moves[:2]) == {23, 27}
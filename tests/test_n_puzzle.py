@@ -0,0 +1,55 @@
+import random
+from collections import deque
+
+import pytest
+
+from n_puzzle import cell_neighbors, flatten, goal_board, ida_star, is_solvable
+
+def slides(cells, n):
+    blank = cells.index(0)
+    for other in cell_neighbors(n)[blank]:
+        board = list(cells)
+        board[blank], board[other] = board[other], 0
+        yield tuple(board)
+
+def bfs_distance(start, goal, n):
+    start, goal = tuple(start), tuple(goal)
+    depth = {start: 0}
+    queue = deque([start])
+    while queue:
+        cells = queue.popleft()
+        if cells == goal:
+            return depth[cells]
+        for other in slides(cells, n):
+            if other not in depth:
+                depth[other] = depth[cells] + 1
+                queue.append(other)
+    return None
+
+def random_walk(rng, n, steps):
+    cells = tuple(goal_board(n))
+    for _ in range(steps):
+        cells = rng.choice(list(slides(cells, n)))
+    return list(cells)
+
+@pytest.mark.parametrize("n, steps", [(3, 40), (4, 14)])
+def test_ida_star_is_optimal(n, steps):
+    rng = random.Random(n)
+    goal = goal_board(n)
+    for _ in range(5):
+        start = random_walk(rng, n, steps)
+        path = ida_star(start)
+        assert flatten(path[0]) == start and flatten(path[-1]) == goal
+        for before, after in zip(path, path[1:]):
+            assert tuple(flatten(after)) in set(slides(flatten(before), n))
+        assert len(path) - 1 == bfs_distance(start, goal, n)
+
+def test_unsolvable_board():
+    board = goal_board(3)
+    board[0], board[1] = board[1], board[0]
+    assert not is_solvable(board, goal_board(3))
+    assert ida_star(board) is None
+
+def test_bad_board():
+    with pytest.raises(ValueError):
+        ida_star([1, 1, 2, 3, 4, 5, 6, 7, 0])
@@ -0,0 +1,35 @@
+import time
+
+from mnk_game import MNKGame
+from parallel_search import Node, mcts, root_parallel_alpha_beta, tree_parallel_mcts
+
+def test_root_parallel_alpha_beta_solves_tic_tac_toe():
+    result = root_parallel_alpha_beta(MNKGame(3, 3, 3, radius=2), 5.0, workers=2)
+    assert result["value"] == 0
+
+def test_root_parallel_alpha_beta_stays_within_budget():
+    game = MNKGame(15, 15, 5)
+    game.apply(112)
+    began = time.perf_counter()
+    root_parallel_alpha_beta(game, 0.5, workers=2)
+    # workers are reused, so later iterations must not inherit a stale clock
+    assert time.perf_counter() - began < 0.5 + 0.3
+
+def test_mcts_takes_the_winning_move():
+    game = MNKGame(3, 3, 3, radius=2)
+    for move in (0, 3, 1, 4):
+        game.apply(move)
+    assert mcts(game, 0.3, seed=0)["move"] == 2
+
+def test_tree_parallel_mcts_without_virtual_loss():
+    result = tree_parallel_mcts(MNKGame(3, 3, 3, radius=2), 0.2, threads=4, virtual_loss=0, seed=0)
+    assert result["playouts"] > 0
+
+def test_unvisited_child_is_selected_first():
+    root = Node(None, None, ())
+    root.visits = 3
+    for move, (visits, wins) in enumerate(((2, 2.0), (0, 0.0), (1, 1.0))):
+        child = Node(move, root, ())
+        child.visits, child.wins = visits, wins
+        root.children.append(child)
+    assert root.select(1.4).move == 1
@@ -0,0 +1,33 @@
+import random
+
+from A_star import a_star, goal_state
+from n_puzzle import ida_star
+from pattern_database import AdditivePatternDatabase, PatternDatabase, default_partition, load_or_build
+from test_a_star import bfs_distance, random_board
+
+GOAL = sum(goal_state, [])
+
+def test_additive_database_is_admissible_and_exact_at_goal():
+    pdb = AdditivePatternDatabase(PatternDatabase.build(GOAL, p) for p in default_partition(GOAL))
+    assert pdb(GOAL) == 0
+    rng = random.Random(0)
+    for _ in range(30):
+        board = random_board(rng)
+        assert pdb(sum(board, [])) <= bfs_distance(board, goal_state)
+
+def test_searches_with_the_database_stay_optimal(tmp_path):
+    pdb = load_or_build(GOAL, directory=str(tmp_path))
+    rng = random.Random(1)
+    for _ in range(5):
+        start = random_board(rng)
+        optimal = bfs_distance(start, goal_state)
+        assert len(a_star(start, heuristic=pdb)) - 1 == optimal
+        assert len(ida_star(start, GOAL, heuristic=pdb)) - 1 == optimal
+
+def test_save_and_load_round_trip(tmp_path):
+    built = PatternDatabase.build(GOAL, (1, 2, 3))
+    path = str(tmp_path / "pdb.bin")
+    built.save(path)
+    loaded = PatternDatabase.load(path)
+    assert loaded.pattern == built.pattern and loaded.goal == built.goal
+    assert bytes(loaded.table) == bytes(built.table)
@@ -0,0 +1,34 @@
+import json
+import random
+
+import pytest
+
+from A_star import goal_state
+from puzzle_batch import read_instances, solve_batch, to_board
+from test_a_star import bfs_distance, random_board
+
+def test_read_instances_from_jsonl_and_csv(tmp_path):
+    start = [[2, 8, 3], [1, 6, 4], [7, 0, 5]]
+    jsonl = tmp_path / "instances.jsonl"
+    jsonl.write_text(json.dumps({"start": start}) + "\n" + json.dumps({"start": sum(start, []), "goal": goal_state}) + "\n")
+    csv = tmp_path / "instances.csv"
+    csv.write_text("start,goal\n283164705,\n2 8 3 1 6 4 7 0 5,123804765\n")
+    for path in (jsonl, csv):
+        assert list(read_instances(str(path))) == [(0, start, None), (1, start, goal_state)]
+
+def test_to_board_rejects_bad_boards():
+    with pytest.raises(ValueError):
+        to_board("12345678")
+
+@pytest.mark.parametrize("solver", ["astar", "idastar", "bibfs", "biastar", "iddfs"])
+def test_optimal_solvers_match_bfs_in_input_order(solver):
+    rng = random.Random(0)
+    starts = [random_board(rng, walk=20) for _ in range(12)]
+    instances = [(i, start, None) for i, start in enumerate(starts)]
+    results = list(solve_batch(instances, solver=solver, workers=2, chunksize=5))
+    assert [r["index"] for r in results] == list(range(len(starts)))
+    assert [r["moves"] for r in results] == [bfs_distance(start, goal_state) for start in starts]
+
+def test_unknown_solver():
+    with pytest.raises(ValueError):
+        list(solve_batch([], solver="nope"))
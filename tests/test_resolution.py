@@ -0,0 +1,129 @@
+import importlib.util
+import itertools
+import os
+import random
+
+import pytest
+
+from Unification_in_FOL import CONST, FUNC, VAR, Term, apply_subs, term_to_str
+
+# the module's file name has a space in it, so it is loaded by path
+_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Resolution _FOL.py")
+_spec = importlib.util.spec_from_file_location("resolution_fol", _path)
+resolution = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(resolution)
+
+def satisfiable(clauses, num_vars):
+    return any(all(any((x > 0) == values[abs(x) - 1] for x in c) for c in clauses)
+               for values in itertools.product((False, True), repeat=num_vars))
+
+def random_cnf(rng, num_vars, num_clauses):
+    return [frozenset(v if rng.random() < 0.5 else -v
+                      for v in rng.sample(range(1, num_vars + 1), rng.randint(1, 3)))
+            for _ in range(num_clauses)]
+
+@pytest.mark.parametrize("seed", range(5))
+def test_prove_agrees_with_brute_force(seed):
+    rng = random.Random(seed)
+    for _ in range(60):
+        cnf = random_cnf(rng, 5, rng.randint(2, 20))
+        proof = resolution.prove(cnf, max_clauses=10 ** 6)
+        assert proof.proved == (not satisfiable(cnf, 5))
+        assert proof.proved or proof.saturated
+
+@pytest.mark.parametrize("seed", range(5))
+def test_prove_with_set_of_support_agrees_with_brute_force(seed):
+    rng = random.Random(seed)
+    for _ in range(60):
+        cnf = random_cnf(rng, 5, rng.randint(2, 20))
+        split = rng.randint(1, len(cnf) - 1)
+        kb, goal = cnf[:split], cnf[split:]
+        if not satisfiable(kb, 5):
+            continue  # set of support is only complete over a consistent KB
+        assert resolution.prove(kb, goal, max_clauses=10 ** 6).proved == (not satisfiable(cnf, 5))
+
+def test_prove_accepts_named_literals():
+    clauses = [frozenset(["Alive_Anil"]), frozenset(["-Alive_Anil", "Likes_Peanuts"])]
+    proof = resolution.prove(clauses, [frozenset(["-Likes_Peanuts"])])
+    assert proof.proved
+    assert not resolution.prove(clauses, [frozenset(["Likes_Peanuts"])]).proved
+
+def test_symbols_intern_names_to_dimacs_literals():
+    symbols = resolution.Symbols()
+    clause = symbols.encode_clause(["-B", "A", "B"])
+    assert sorted(clause) == [-1, 1, 2] and [abs(l) for l in clause] == [1, 1, 2]
+    assert symbols.encode("A") == 2 and symbols.encode("-Q") == -3 and len(symbols) == 3
+    assert symbols.decode_clause(clause) == {"-B", "A", "B"}
+    assert resolution.is_tautology(clause)
+
+@pytest.mark.parametrize("seed", range(3))
+def test_dimacs_round_trip_and_proof(tmp_path, seed):
+    rng = random.Random(seed)
+    cnf = random_cnf(rng, 6, 25)
+    path = tmp_path / "random.cnf"
+    resolution.write_dimacs(path, cnf)
+    num_vars, clauses = resolution.read_dimacs(path)
+    assert num_vars == max(abs(l) for c in cnf for l in c)
+    assert [frozenset(c) for c in clauses] == cnf
+    proof = resolution.prove([frozenset(c) for c in clauses], max_clauses=10 ** 6)
+    assert proof.proved == (not satisfiable(cnf, num_vars))
+
+def test_read_dimacs_handles_comments_and_wrapped_clauses(tmp_path):
+    path = tmp_path / "wrapped.cnf"
+    path.write_text("c example\np cnf 4 2\n1 -3\n 2 0\n-1 0\n%\n0\n")
+    assert resolution.read_dimacs(path) == (4, [(1, 2, -3), (-1,)])
+
+def random_fol_clause(rng):
+    # function-free over the constants A and B, so grounding over {A, B} is complete
+    terms = [Term(CONST, "A"), Term(CONST, "B")] + [Term(VAR, v) for v in "uvw"]
+    literals = set()
+    for _ in range(rng.randint(1, 3)):
+        name, arity = rng.choice((("P", 1), ("Q", 2), ("R", 1)))
+        literals.add((rng.random() < 0.5, Term(FUNC, name, tuple(rng.choice(terms) for _ in range(arity)))))
+    return frozenset(literals)
+
+def ground(clauses):
+    grounded = []
+    for clause in clauses:
+        names = sorted({t.name for _, atom in clause for t in atom.args if t.kind == VAR})
+        for values in itertools.product((Term(CONST, "A"), Term(CONST, "B")), repeat=len(names)):
+            subs = dict(zip(names, values))
+            grounded.append(frozenset(("" if sign else "-") + term_to_str(apply_subs(atom, subs))
+                                      for sign, atom in clause))
+    return grounded
+
+@pytest.mark.parametrize("seed", range(3))
+def test_lifted_resolution_agrees_with_the_grounded_prover(seed):
+    rng = random.Random(seed)
+    for _ in range(40):
+        clauses = [random_fol_clause(rng) for _ in range(rng.randint(1, 7))]
+        expected = resolution.prove(ground(clauses), max_clauses=10 ** 6).proved
+        proof = resolution.prove_fol(clauses, max_clauses=5000)
+        assert proof.proved or proof.saturated
+        assert proof.proved == expected
+
+def test_entails_fol():
+    kb = [
+        "forall x. Food(x) -> Likes(John, x)",
+        "Food(Apple) & Food(Vegetables)",
+        "forall x y. Eats(x, y) & ~Killed(x) -> Food(y)",
+        "Eats(Anil, Peanuts) & Alive(Anil)",
+        "forall x. Eats(Anil, x) -> Eats(Harry, x)",
+        "forall x. ~Killed(x) -> Alive(x)",
+        "forall x. Alive(x) -> ~Killed(x)",
+    ]
+    assert resolution.entails_fol(kb, "Likes(John, Peanuts)").proved
+    assert resolution.entails_fol(kb, "Likes(John, x)").proved
+    proof = resolution.entails_fol(kb, "Eats(John, Peanuts)")
+    assert not proof.proved and proof.saturated
+
+def test_skolemization_and_factoring():
+    assert resolution.entails_fol(["forall x. exists y. Loves(x, y)"], "exists y. Loves(Anil, y)").proved
+    assert not resolution.entails_fol(["exists y. forall x. Loves(x, y)"], "Loves(Anil, Anil)").proved
+    # needs factoring: neither clause alone resolves away both P literals
+    proof = resolution.entails_fol(["forall u v. P(u) | P(v)", "forall u. P(u) -> Q(u, B)"], "P(B) & Q(A, B)")
+    assert proof.proved and not proof.saturated
+
+def test_to_cnf_normalizes_variables():
+    clauses = resolution.to_cnf("forall a b. R(a) | ~Q(b, a)")
+    assert [resolution.fol_clause_to_str(c) for c in clauses] == ["-Q(x1, x2) ∨ R(x2)"]
@@ -0,0 +1,98 @@
+import itertools
+import random
+
+import pytest
+
+from prepositional_Logic import entails, evaluate, formula_symbols, sat_entails, tseitin
+from sat_solver import Solver, luby
+
+def random_cnf(rng, num_vars, num_clauses, width=3):
+    return [tuple(v if rng.random() < 0.5 else -v for v in rng.sample(range(1, num_vars + 1), width))
+            for _ in range(num_clauses)]
+
+def brute_force(clauses, num_vars):
+    return any(all(any((l > 0) == values[abs(l) - 1] for l in c) for c in clauses)
+               for values in itertools.product((False, True), repeat=num_vars))
+
+def satisfied(clauses, model):
+    return all(any(model[abs(l)] == (l > 0) for l in c) for c in clauses)
+
+def test_luby():
+    assert [luby(i) for i in range(15)] == [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8]
+
+@pytest.mark.parametrize("seed", range(5))
+def test_solve_agrees_with_brute_force(seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        # clause counts span the 3-SAT threshold of ~4.26 clauses per variable
+        n = rng.randint(3, 10)
+        cnf = random_cnf(rng, n, rng.randint(2 * n, 6 * n))
+        solver = Solver(cnf)
+        result = solver.solve()
+        assert result == brute_force(cnf, n)
+        if result:
+            assert satisfied(cnf, solver.model)
+
+def test_incremental_clauses():
+    rng = random.Random(9)
+    cnf = random_cnf(rng, 12, 40)
+    solver = Solver()
+    for k, clause in enumerate(cnf, 1):
+        solver.add_clause(clause)
+        result = solver.solve()
+        assert result == brute_force(cnf[:k], 12)
+        if result:
+            assert satisfied(cnf[:k], solver.model)
+
+def test_trivial_inputs():
+    assert Solver().solve() is True
+    assert Solver([(1,), (-1,)]).solve() is False
+    assert Solver([()]).solve() is False
+    solver = Solver([(1, -1), (2,)], num_vars=3)
+    assert solver.solve() is True and solver.model[2] is True
+
+def pigeonhole(holes):
+    var = lambda p, h: p * holes + h + 1
+    clauses = [tuple(var(p, h) for h in range(holes)) for p in range(holes + 1)]
+    clauses += [(-var(p, h), -var(q, h)) for h in range(holes)
+                for p, q in itertools.combinations(range(holes + 1), 2)]
+    return clauses
+
+def test_max_conflicts_gives_up_and_resumes():
+    solver = Solver(pigeonhole(6))
+    assert solver.solve(max_conflicts=5) is None
+    assert solver.solve() is False
+    assert solver.stats["conflicts"] > 5
+
+def random_formula(rng, symbols, depth=3):
+    if depth == 0 or rng.random() < 0.25:
+        return rng.choice(symbols)
+    op = rng.choice(("not", "and", "or", "implies", "iff"))
+    if op == "not":
+        return (op, random_formula(rng, symbols, depth - 1))
+    arity = 2 if op in ("implies", "iff") else rng.randint(2, 3)
+    return (op, *(random_formula(rng, symbols, depth - 1) for _ in range(arity)))
+
+def test_tseitin_is_equisatisfiable():
+    rng = random.Random(3)
+    for _ in range(200):
+        formula = random_formula(rng, "ABCD")
+        clauses, ids = tseitin(formula)
+        solver = Solver(clauses)
+        names = formula_symbols(formula)
+        truth = any(evaluate(formula, dict(zip(names, values)))
+                    for values in itertools.product((False, True), repeat=len(names)))
+        assert solver.solve() == truth
+        if truth:
+            assert evaluate(formula, {name: solver.model[v] for name, v in ids.items()})
+
+def test_sat_entails_agrees_with_the_truth_table():
+    rng = random.Random(4)
+    for _ in range(200):
+        kb = [random_formula(rng, "ABC") for _ in range(rng.randint(1, 3))]
+        query = random_formula(rng, "ABC", depth=2)
+        expected = entails(lambda m: all(evaluate(f, m) for f in kb), lambda m: evaluate(query, m),
+                           ["A", "B", "C"], verbose=False)
+        assert sat_entails(kb, query) == expected
+    assert sat_entails(("and", ("implies", "R", "W"), "R"), "W")
+    assert not sat_entails(("and", ("implies", "R", "W"), "R"), ("not", "R"))
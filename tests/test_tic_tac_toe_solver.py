@@ -0,0 +1,58 @@
+import functools
+
+import pytest
+
+from tic_tac_toe_solver import WIN_MASKS, PerfectPlayer
+
+def winner(cells):
+    for mask in WIN_MASKS:
+        line = [cells[c] for c in range(9) if mask >> c & 1]
+        if line[0] and line.count(line[0]) == 3:
+            return line[0]
+    return 0
+
+def to_move(cells):
+    return 1 if cells.count(1) == cells.count(2) else 2
+
+@functools.lru_cache(maxsize=None)
+def value(cells):
+    """Plain minimax value for the player to move: -1, 0 or 1."""
+    if winner(cells):
+        return -1
+    if 0 not in cells:
+        return 0
+    player = to_move(cells)
+    return max(-value(cells[:c] + (player,) + cells[c + 1:]) for c in range(9) if not cells[c])
+
+def reachable():
+    seen, stack = set(), [(0,) * 9]
+    while stack:
+        cells = stack.pop()
+        if cells in seen:
+            continue
+        seen.add(cells)
+        if not winner(cells) and 0 in cells:
+            player = to_move(cells)
+            stack.extend(cells[:c] + (player,) + cells[c + 1:] for c in range(9) if not cells[c])
+    return seen
+
+@pytest.fixture(scope="module")
+def player(tmp_path_factory):
+    return PerfectPlayer(str(tmp_path_factory.mktemp("table") / "table.bin"))
+
+def test_table_matches_minimax_on_every_reachable_position(player):
+    positions = reachable()
+    assert len(positions) == 5478
+    for cells in positions:
+        result, move = player.lookup(list(cells))
+        assert result == value(cells)
+        if move is None:
+            assert winner(cells) or 0 not in cells
+        else:
+            assert cells[move] == 0
+            after = cells[:move] + (to_move(cells),) + cells[move + 1:]
+            assert -value(after) == result
+
+def test_unreachable_position_is_rejected(player):
+    with pytest.raises(ValueError):
+        player.lookup([1, 1, 1, 1, 0, 0, 0, 0, 0])
@@ -0,0 +1,69 @@
+import pickle
+import random
+
+import pytest
+
+from Unification_in_FOL import CONST, FUNC, VAR, Term, apply_subs, parse_term, term_to_str, unify
+
+def random_term(rng, depth=3):
+    if depth == 0 or rng.random() < 0.4:
+        return Term(VAR, rng.choice("xyz")) if rng.random() < 0.5 else Term(CONST, rng.choice("AB"))
+    name, arity = rng.choice((("f", 1), ("g", 2)))
+    return Term(FUNC, name, tuple(random_term(rng, depth - 1) for _ in range(arity)))
+
+def variables(term):
+    if term.kind == VAR:
+        return {term.name}
+    return set().union(*map(variables, term.args)) if term.kind == FUNC else set()
+
+def reference_unify(a, b, subs):
+    """Textbook recursive Robinson unification with fully applied bindings."""
+    a, b = apply_subs(a, subs), apply_subs(b, subs)
+    if a is b:
+        return subs
+    if a.kind != VAR and b.kind == VAR:
+        a, b = b, a
+    if a.kind == VAR:
+        if a.name in variables(b):
+            return None
+        return {**{k: apply_subs(v, {a.name: b}) for k, v in subs.items()}, a.name: b}
+    if a.kind == FUNC and b.kind == FUNC and a.name == b.name and len(a.args) == len(b.args):
+        for x, y in zip(a.args, b.args):
+            subs = reference_unify(x, y, subs)
+            if subs is None:
+                return None
+        return subs
+    return None
+
+def test_terms_are_hash_consed():
+    assert parse_term("f(x, g(A))") is Term(FUNC, "f", (Term(VAR, "x"), Term(FUNC, "g", (Term(CONST, "A"),))))
+    term = parse_term("g(f(x), B)")
+    assert pickle.loads(pickle.dumps(term)) is term
+    assert parse_term(term_to_str(term)) is term
+
+@pytest.mark.parametrize("seed", range(5))
+def test_unifier_agrees_with_the_reference(seed):
+    rng = random.Random(seed)
+    for _ in range(300):
+        a, b = random_term(rng), random_term(rng)
+        subs = unify(a, b)
+        expected = reference_unify(a, b, {})
+        assert (subs is None) == (expected is None)
+        if subs is not None:
+            assert apply_subs(a, subs) is apply_subs(b, subs)
+            # most general: the reference unifier is an instance of ours
+            assert apply_subs(apply_subs(a, subs), expected) is apply_subs(a, expected)
+
+def test_occurs_check():
+    assert unify(parse_term("f(x)"), parse_term("f(g(x))")) is None
+    assert unify(parse_term("g(x, y)"), parse_term("g(y, f(x))")) is None
+
+def test_deep_terms_do_not_recurse():
+    a = b = Term(VAR, "x")
+    for _ in range(5000):
+        a = Term(FUNC, "f", (a,))
+        b = Term(FUNC, "f", (b,))
+    subs = unify(a, Term(FUNC, "f", (Term(VAR, "y"),)))
+    assert apply_subs(Term(VAR, "y"), subs) is a.args[0]
+    assert unify(a, b) == {}
+    assert len(term_to_str(a)) > 5000
@@ -0,0 +1,51 @@
+import importlib
+import random
+
+import pytest
+
+from A_star import a_star, goal_state, manhattan_distance
+from local_search import random_restarts
+from test_a_star import random_board
+from vectorized_heuristics import batch_manhattan, batch_misplaced, batched_hill_climb, packed_heuristic
+
+def misplaced(board, goal):
+    return sum(1 for tile, want in zip(sum(board, []), sum(goal, [])) if tile and tile != want)
+
+def test_batch_scores_match_per_board_scores():
+    rng = random.Random(0)
+    boards = [random_board(rng) for _ in range(50)]
+    assert batch_manhattan(boards, goal_state) == [manhattan_distance(b) for b in boards]
+    assert batch_misplaced(boards, goal_state) == [misplaced(b, goal_state) for b in boards]
+
+def test_a_star_with_batch_heuristic_stays_optimal():
+    rng = random.Random(1)
+    for _ in range(10):
+        start = random_board(rng)
+        batched = a_star(start, batch_heuristic=packed_heuristic(goal_state))
+        assert len(batched) == len(a_star(start))
+
+@pytest.mark.parametrize("module, scorer", [("hill_climbing_manhattan_distance", batch_manhattan),
+                                            ("hill_climbing_no_of_misplaced_tiles", batch_misplaced)])
+def test_hill_climb_with_batch_scoring_is_unchanged(module, scorer):
+    hill_climb = importlib.import_module(module).hill_climb
+    rng = random.Random(2)
+    for _ in range(10):
+        start = random_board(rng, walk=12)
+        assert hill_climb(start, goal_state) == hill_climb(start, goal_state, batch_heuristic=scorer)
+
+def test_batched_hill_climb_solves_an_easy_board():
+    start = random_board(random.Random(3), walk=8)
+    result = batched_hill_climb(start, goal_state, climbs=256, sideways=10, seed=0)
+    assert result["solved"] and result["h"] == 0
+
+def test_batch_restarts_respect_the_time_limit():
+    start = random_board(random.Random(3), walk=8)
+    options = {"restarts": 64, "walk": 0, "sideways": 10, "seed": 0, "batch": True}
+    assert random_restarts(start, goal_state, **options)["solved"]
+    # out of time before the first step: every climb is still at the start
+    result = random_restarts(start, goal_state, time_limit=0, **options)
+    assert not result["solved"] and result["path"] == []
+
+def test_batch_restarts_reject_other_strategies():
+    with pytest.raises(ValueError):
+        random_restarts(goal_state, goal_state, strategy="annealing", batch=True)
@@ -1,3 +1,5 @@
+from tic_tac_toe_solver import PerfectPlayer, has_won
+
 def print_board(board):
     print()
     for i in range(0, 9, 3):
@@ -6,28 +8,35 @@ def print_board(board):
             print("--+---+--")
     print()
 
+def to_bits(board, player):
+    return sum(1 << i for i, cell in enumerate(board) if cell == player)
+
 def check_winner(board, player):
-    winners = [ (0,1,2),(3,4,5),(6,7,8),(0,3,6),(1,4,7),(2,5,8),(0,4,8),(2,4,6)]
-    for a,b,c in winners:
-      if board[a]==board[b]==board[c]==player:
-        return True
-    return False
+    return has_won(to_bits(board, player))
 
-def tic_tac_toe():
+def tic_tac_toe(computer=None):
+    """Play a game; `computer` is "X", "O" or None for two human players."""
     board = [""] * 9
+    bits = {"X": 0, "O": 0}
     player = "X"
+    ai = PerfectPlayer() if computer else None
 
     while True:
         print_board(board)
-        move = int(input(f"Player {player} (choose 1-9): ")) - 1
+        if player == computer:
+            move = ai.best_move([{"": 0, "X": 1, "O": 2}[cell] for cell in board])
+            print(f"Computer ({player}) plays {move + 1}")
+        else:
+            move = int(input(f"Player {player} (choose 1-9): ")) - 1
 
-        if board[move] != "":
-            print("That spot is already taken! Try again.")
-            continue
+            if board[move] != "":
+                print("That spot is already taken! Try again.")
+                continue
 
         board[move] = player
+        bits[player] |= 1 << move
 
-        if check_winner(board, player):
+        if has_won(bits[player]):
             print_board(board)
             print(f"Player {player} wins!")
             break
@@ -38,4 +47,10 @@ def tic_tac_toe():
             break
         player = "O" if player == "X" else "X"
 
-tic_tac_toe()
+if __name__ == "__main__":
+    mode = input("Play against the computer? (y/n): ").strip().lower()
+    computer = None
+    if mode == "y":
+        side = input("Do you want to be X (first) or O? ").strip().upper()
+        computer = "O" if side == "X" else "X"
+    tic_tac_toe(computer)
@@ -0,0 +1,134 @@
+"""Perfect tic-tac-toe play from a precomputed table of solved positions.
+
+Cells hold 0 (empty), 1 (X) or 2 (O) and a position is indexed in base 3,
+index = sum(cell_value * 3**cell). Every position reachable from the empty
+board is solved once by negamax, with the 8 rotations/reflections folded
+into one canonical position (the one with the smallest index). The table is
+a 3**9-byte array stored on disk: for a canonical position its byte holds
+the game value for the player to move (bits 0-1: 0 loss, 1 draw, 2 win) and
+the best move (bits 2-5, 15 when the game is over); other bytes are 255.
+Answering a move is then 8 index computations and one lookup.
+"""
+
+import os
+
+SIZE = 3 ** 9
+UNUSED = 255
+NO_MOVE = 15
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tic_tac_toe_table.bin")
+
+# ----- Bitboards -----
+WIN_MASKS = tuple(sum(1 << c for c in line) for line in (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6)))
+FULL = (1 << 9) - 1
+
+def has_won(bits):
+    """True if the player owning the cells in `bits` has three in a row."""
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            return True
+    return False
+
+# ----- Symmetries -----
+def _symmetries():
+    """Each symmetry as a permutation p with transformed[i] = board[p[i]]."""
+    rotate = (6, 3, 0, 7, 4, 1, 8, 5, 2)
+    mirror = (2, 1, 0, 5, 4, 3, 8, 7, 6)
+    perms, p = [], tuple(range(9))
+    for _ in range(4):
+        perms.append(p)
+        perms.append(tuple(p[mirror[i]] for i in range(9)))
+        p = tuple(p[rotate[i]] for i in range(9))
+    return tuple(perms)
+
+SYMMETRIES = _symmetries()
+# WEIGHTS[s][cell] = 3**i where symmetry s moves `cell` to position i
+WEIGHTS = tuple(tuple(3 ** p.index(cell) for cell in range(9)) for p in SYMMETRIES)
+
+def encode(cells):
+    return sum(v * 3 ** i for i, v in enumerate(cells))
+
+def canonical(cells):
+    """(canonical index, symmetry used) for a board of 0/1/2 cells."""
+    occupied = [(cell, v) for cell, v in enumerate(cells) if v]
+    return min((sum(w[cell] * v for cell, v in occupied), s) for s, w in enumerate(WEIGHTS))
+
+# ----- Solver -----
+def solve():
+    """Negamax over every reachable position; returns the 3**9-byte table."""
+    table = bytearray([UNUSED]) * SIZE
+    cells = [0] * 9
+
+    def negamax(x_bits, o_bits, player):
+        index, _ = canonical(cells)
+        if table[index] != UNUSED:
+            return (table[index] & 3) - 1
+        opponent_bits = o_bits if player == 1 else x_bits
+        if has_won(opponent_bits):
+            value, best = -1, NO_MOVE
+        elif x_bits | o_bits == FULL:
+            value, best = 0, NO_MOVE
+        else:
+            value, best = -2, NO_MOVE
+            for cell in range(9):
+                if cells[cell] == 0:
+                    cells[cell] = player
+                    if player == 1:
+                        score = -negamax(x_bits | 1 << cell, o_bits, 2)
+                    else:
+                        score = -negamax(x_bits, o_bits | 1 << cell, 1)
+                    cells[cell] = 0
+                    if score > value:
+                        value, best = score, cell
+        # store the move as seen from the canonical orientation
+        index, s = canonical(cells)
+        if best != NO_MOVE:
+            best = SYMMETRIES[s].index(best)
+        table[index] = (value + 1) | (best << 2)
+        return value
+
+    negamax(0, 0, 1)
+    return table
+
+def save_table(table, path=DEFAULT_PATH):
+    with open(path, "wb") as f:
+        f.write(table)
+
+def load_table(path=DEFAULT_PATH):
+    """Read the table from disk, solving and saving it first if it is missing."""
+    if not os.path.exists(path):
+        save_table(solve(), path)
+    with open(path, "rb") as f:
+        table = f.read()
+    if len(table) != SIZE:
+        raise ValueError(f"{path} is not a tic-tac-toe table")
+    return table
+
+class PerfectPlayer:
+    """Looks up the game-theoretic value and best move of any reachable position."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.table = load_table(path)
+
+    def lookup(self, cells):
+        """(value for the player to move: -1/0/1, best cell or None) for a board of 0/1/2 cells."""
+        index, s = canonical(cells)
+        entry = self.table[index]
+        if entry == UNUSED:
+            raise ValueError("position is not reachable in a legal game")
+        move = entry >> 2
+        return (entry & 3) - 1, (None if move == NO_MOVE else SYMMETRIES[s][move])
+
+    def best_move(self, cells):
+        return self.lookup(cells)[1]
+
+if __name__ == "__main__":
+    import time
+
+    began = time.perf_counter()
+    table = solve()
+    save_table(table)
+    solved = sum(1 for entry in table if entry != UNUSED)
+    print(f"Solved {solved} canonical positions in {time.perf_counter() - began:.2f}s -> {DEFAULT_PATH}")
+    value, move = PerfectPlayer().lookup([0] * 9)
+    print(f"Empty board: value {value:+d} for X (0 = draw), best first move: cell {move + 1}")